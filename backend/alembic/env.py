@@ -12,7 +12,7 @@ from app.core.config import settings
 from app.core.database import Base
 
 # Import all models so they are registered with Base.metadata
-from app.models import Claim, Embedding, Finding, Report, Verdict  # noqa: F401
+from app.models import Claim, Embedding, Finding, Report, ReportPdf, Verdict  # noqa: F401
 
 # Alembic Config object
 config = context.config
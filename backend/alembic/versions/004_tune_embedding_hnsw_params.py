@@ -0,0 +1,52 @@
+"""Rebuild the embeddings HNSW index with larger build parameters.
+
+The initial schema used the pgvector defaults (m=16, ef_construction=64),
+which are tuned for corpora under ~100K rows. The combined IFRS, SASB and
+report corpus grows well past that, so the graph is rebuilt with
+m=24, ef_construction=128 for better recall at the same ef_search.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.core.database import hnsw_build_settings
+
+# revision identifiers, used by Alembic
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_hnsw_index(m: int, ef_construction: int) -> None:
+    """Drop and recreate ix_embeddings_embedding_hnsw with the given parameters."""
+    # Optional memory/parallelism overrides (HNSW_BUILD_*), scoped to this
+    # migration's transaction; by default the server configuration applies
+    for statement in hnsw_build_settings():
+        op.execute(statement)
+
+    op.drop_index("ix_embeddings_embedding_hnsw", table_name="embeddings")
+    op.create_index(
+        "ix_embeddings_embedding_hnsw",
+        "embeddings",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": m, "ef_construction": ef_construction},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+
+def upgrade() -> None:
+    """Rebuild the HNSW index with m=24, ef_construction=128."""
+    _rebuild_hnsw_index(m=24, ef_construction=128)
+
+
+def downgrade() -> None:
+    """Restore the pgvector default HNSW build parameters."""
+    _rebuild_hnsw_index(m=16, ef_construction=64)
@@ -0,0 +1,54 @@
+"""Store embeddings as halfvec(1536) instead of vector(1536).
+
+Half-precision storage halves the size of each embedding (6 KB -> 3 KB)
+and of the HNSW graph built over it, with negligible recall loss for
+text-embedding-3-small vectors. Ingestion keeps sending FP32 values;
+PostgreSQL casts them on write. Requires pgvector >= 0.7.0.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.core.database import hnsw_build_settings
+
+# revision identifiers, used by Alembic
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _convert_embedding_column(column_type: str, ops: str) -> None:
+    """Change the embedding column type and rebuild its HNSW index."""
+    for statement in hnsw_build_settings():
+        op.execute(statement)
+
+    op.drop_index("ix_embeddings_embedding_hnsw", table_name="embeddings")
+    op.execute(
+        f"ALTER TABLE embeddings ALTER COLUMN embedding TYPE {column_type} "
+        f"USING embedding::{column_type}"
+    )
+    op.create_index(
+        "ix_embeddings_embedding_hnsw",
+        "embeddings",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 24, "ef_construction": 128},
+        postgresql_ops={"embedding": ops},
+    )
+
+
+def upgrade() -> None:
+    """Convert embeddings.embedding to halfvec(1536)."""
+    _convert_embedding_column("halfvec(1536)", "halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    """Convert embeddings.embedding back to vector(1536)."""
+    _convert_embedding_column("vector(1536)", "vector_cosine_ops")
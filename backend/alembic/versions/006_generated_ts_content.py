@@ -0,0 +1,62 @@
+"""Make embeddings.ts_content a generated column.
+
+ts_content was a plain tsvector filled by a follow-up UPDATE after each
+ingest, which cost an extra statement per batch and left rows with NULL
+ts_content (invisible to keyword search) if that step was skipped.
+PostgreSQL now computes it from chunk_text on every insert/update.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_gin_index() -> None:
+    op.create_index(
+        "ix_embeddings_ts_content_gin",
+        "embeddings",
+        ["ts_content"],
+        postgresql_using="gin",
+    )
+
+
+def upgrade() -> None:
+    """Replace ts_content with a STORED generated column."""
+    op.drop_index("ix_embeddings_ts_content_gin", table_name="embeddings")
+    op.drop_column("embeddings", "ts_content")
+    op.add_column(
+        "embeddings",
+        sa.Column(
+            "ts_content",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', chunk_text)", persisted=True),
+            nullable=True,
+        ),
+    )
+    _recreate_gin_index()
+
+
+def downgrade() -> None:
+    """Restore ts_content as a plain column, keeping its current values."""
+    op.drop_index("ix_embeddings_ts_content_gin", table_name="embeddings")
+    op.add_column(
+        "embeddings",
+        sa.Column("ts_content_plain", postgresql.TSVECTOR(), nullable=True),
+    )
+    op.execute("UPDATE embeddings SET ts_content_plain = ts_content")
+    op.drop_column("embeddings", "ts_content")
+    op.alter_column("embeddings", "ts_content_plain", new_column_name="ts_content")
+    _recreate_gin_index()
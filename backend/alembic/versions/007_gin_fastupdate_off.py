@@ -0,0 +1,33 @@
+"""Disable the GIN pending list on embeddings.ts_content.
+
+With fastupdate on (the default) new entries queue in a pending list that
+every keyword query must scan until vacuum merges it, causing latency
+spikes in the keyword leg of hybrid search after each ingest. Turning it
+off moves that cost to insert time, where COPY batches absorb it.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Set fastupdate=off and flush any entries already pending."""
+    op.execute("ALTER INDEX ix_embeddings_ts_content_gin SET (fastupdate = off)")
+    op.execute("SELECT gin_clean_pending_list('ix_embeddings_ts_content_gin'::regclass)")
+
+
+def downgrade() -> None:
+    """Restore the default fastupdate behaviour."""
+    op.execute("ALTER INDEX ix_embeddings_ts_content_gin RESET (fastupdate)")
@@ -0,0 +1,53 @@
+"""Add a partial HNSW index per embeddings source_type.
+
+Queries scoped to one corpus (e.g. a single report's chunks for the
+chatbot) previously walked the HNSW graph built over every corpus and
+discarded non-matching rows. A partial index per source_type gives the
+planner a smaller graph that contains only candidate rows.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.database import hnsw_build_settings
+
+# revision identifiers, used by Alembic
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SOURCE_TYPES = ("ifrs_s1", "ifrs_s2", "sasb", "report")
+
+
+def upgrade() -> None:
+    """Create ix_embeddings_embedding_hnsw_<source_type> partial indexes."""
+    for statement in hnsw_build_settings():
+        op.execute(statement)
+
+    for source_type in SOURCE_TYPES:
+        op.create_index(
+            f"ix_embeddings_embedding_hnsw_{source_type}",
+            "embeddings",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            postgresql_where=sa.text(f"source_type = '{source_type}'"),
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial HNSW indexes."""
+    for source_type in SOURCE_TYPES:
+        op.drop_index(
+            f"ix_embeddings_embedding_hnsw_{source_type}",
+            table_name="embeddings",
+        )
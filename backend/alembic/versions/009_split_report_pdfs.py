@@ -0,0 +1,50 @@
+"""Move reports.pdf_binary into a separate report_pdfs table.
+
+Every row of reports carried the uploaded PDF, so status polling, list
+queries and agent reads of a report dragged the multi-megabyte bytea
+(or at least its TOAST pointer) through the heap. The bytes now live in
+report_pdfs keyed by report_id and are only read by the PDF route and
+the parsing task.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create report_pdfs, copy existing PDFs, drop reports.pdf_binary."""
+    op.create_table(
+        "report_pdfs",
+        sa.Column("report_id", sa.UUID(), nullable=False),
+        sa.Column("pdf_binary", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["report_id"], ["reports.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("report_id"),
+    )
+    op.execute(
+        "INSERT INTO report_pdfs (report_id, pdf_binary) "
+        "SELECT id, pdf_binary FROM reports WHERE pdf_binary IS NOT NULL"
+    )
+    op.drop_column("reports", "pdf_binary")
+
+
+def downgrade() -> None:
+    """Restore reports.pdf_binary from report_pdfs and drop the table."""
+    op.add_column("reports", sa.Column("pdf_binary", sa.LargeBinary(), nullable=True))
+    op.execute(
+        "UPDATE reports SET pdf_binary = report_pdfs.pdf_binary "
+        "FROM report_pdfs WHERE report_pdfs.report_id = reports.id"
+    )
+    op.drop_table("report_pdfs")
@@ -0,0 +1,57 @@
+"""Replace single-column findings indexes with covering indexes.
+
+Findings are read per claim ordered by iteration and per report ordered
+newest first. With only single-column indexes on claim_id / report_id
+Postgres had to sort after the index scan. The composite indexes carry
+the sort key and INCLUDE the small columns those reads project, so the
+scans come back pre-ordered. The LLM-written summary is left out: it is
+unbounded text and would overflow the B-tree row size limit.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the covering indexes and drop the redundant ones."""
+    op.create_index(
+        "ix_findings_claim_iter",
+        "findings",
+        ["claim_id", sa.text("iteration DESC")],
+        postgresql_include=[
+            "agent_name",
+            "evidence_type",
+            "supports_claim",
+            "confidence",
+            "created_at",
+        ],
+    )
+    op.create_index(
+        "ix_findings_report_created",
+        "findings",
+        ["report_id", sa.text("created_at DESC")],
+        postgresql_include=["claim_id", "agent_name"],
+    )
+    op.drop_index("ix_findings_claim_id", table_name="findings")
+    op.drop_index("ix_findings_report_id", table_name="findings")
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.create_index("ix_findings_report_id", "findings", ["report_id"])
+    op.create_index("ix_findings_claim_id", "findings", ["claim_id"])
+    op.drop_index("ix_findings_report_created", table_name="findings")
+    op.drop_index("ix_findings_claim_iter", table_name="findings")
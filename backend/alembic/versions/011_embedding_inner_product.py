@@ -0,0 +1,78 @@
+"""Normalize stored embeddings and index them for inner product.
+
+With unit-length vectors, inner product ranks identically to cosine
+similarity while skipping the two norm computations per distance
+evaluation during HNSW traversal. Existing rows are normalized in place
+and flagged with chunk_metadata.normalized, then every HNSW index on
+embeddings is rebuilt with halfvec_ip_ops.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.database import hnsw_build_settings
+
+# revision identifiers, used by Alembic
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SOURCE_TYPES = ("ifrs_s1", "ifrs_s2", "sasb", "report")
+
+
+def _rebuild_hnsw_indexes(opclass: str) -> None:
+    """Drop and recreate the full and partial HNSW indexes with an opclass."""
+    for statement in hnsw_build_settings():
+        op.execute(statement)
+
+    op.drop_index("ix_embeddings_embedding_hnsw", table_name="embeddings")
+    op.create_index(
+        "ix_embeddings_embedding_hnsw",
+        "embeddings",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 24, "ef_construction": 128},
+        postgresql_ops={"embedding": opclass},
+    )
+    for source_type in SOURCE_TYPES:
+        op.drop_index(
+            f"ix_embeddings_embedding_hnsw_{source_type}",
+            table_name="embeddings",
+        )
+        op.create_index(
+            f"ix_embeddings_embedding_hnsw_{source_type}",
+            "embeddings",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": opclass},
+            postgresql_where=sa.text(f"source_type = '{source_type}'"),
+        )
+
+
+def upgrade() -> None:
+    """Normalize embeddings to unit length and switch to halfvec_ip_ops."""
+    op.execute(
+        """
+        UPDATE embeddings
+        SET embedding = l2_normalize(embedding),
+            chunk_metadata = COALESCE(chunk_metadata, '{}'::jsonb)
+                || '{"normalized": true}'::jsonb
+        WHERE chunk_metadata IS NULL
+           OR chunk_metadata->>'normalized' IS DISTINCT FROM 'true'
+        """
+    )
+    _rebuild_hnsw_indexes("halfvec_ip_ops")
+
+
+def downgrade() -> None:
+    """Restore cosine HNSW indexes; normalized vectors remain valid for cosine."""
+    _rebuild_hnsw_indexes("halfvec_cosine_ops")
@@ -0,0 +1,79 @@
+"""Promote hot chunk_metadata keys to generated columns on embeddings.
+
+IFRS paragraph lookups filtered on chunk_metadata->>'paragraph_id' and
+report navigation reads page_start / section out of the JSONB document
+on every hit. STORED generated columns expose those keys as scalars
+that can be indexed, and PostgreSQL backfills them for existing rows
+when the columns are added. chunk_metadata keeps the full document.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add paragraph_id, source_page and section_title with partial indexes."""
+    op.add_column(
+        "embeddings",
+        sa.Column(
+            "paragraph_id",
+            sa.Text(),
+            sa.Computed("chunk_metadata->>'paragraph_id'", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "embeddings",
+        sa.Column(
+            "source_page",
+            sa.Integer(),
+            sa.Computed("(chunk_metadata->>'page_start')::integer", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "embeddings",
+        sa.Column(
+            "section_title",
+            sa.Text(),
+            sa.Computed(
+                "COALESCE(chunk_metadata->>'section', chunk_metadata->'section_path'->> -1)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_embeddings_paragraph_id",
+        "embeddings",
+        ["paragraph_id"],
+        postgresql_where=sa.text("source_type IN ('ifrs_s1', 'ifrs_s2')"),
+    )
+    op.create_index(
+        "ix_embeddings_report_source_page",
+        "embeddings",
+        ["report_id", "source_page"],
+        postgresql_where=sa.text("source_type = 'report'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the promoted columns; the values remain in chunk_metadata."""
+    op.drop_index("ix_embeddings_report_source_page", table_name="embeddings")
+    op.drop_index("ix_embeddings_paragraph_id", table_name="embeddings")
+    op.drop_column("embeddings", "section_title")
+    op.drop_column("embeddings", "source_page")
+    op.drop_column("embeddings", "paragraph_id")
@@ -0,0 +1,202 @@
+"""Maintain per-report claim/finding/verdict counters with triggers.
+
+The analysis status endpoint is polled every second or two while the
+pipeline runs and used to aggregate claims, findings and verdicts on
+every call. Statement-level triggers now keep counts (and claim
+breakdowns by type and priority) on the reports row, so a poll is a
+single-row read.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNT_COLUMNS = ("claims_count", "findings_count", "verdicts_count")
+BREAKDOWN_COLUMNS = ("claims_by_type", "claims_by_priority")
+
+# Columns each trigger reads from changed rows (report_id first)
+TRIGGER_COLUMNS = {
+    "claims": ("report_id", "claim_type", "priority"),
+    "findings": ("report_id",),
+    "verdicts": ("report_id",),
+}
+
+# One UPDATE of reports per statement, applying the net change per report;
+# %s is replaced with a query over the transition tables yielding the
+# TRIGGER_COLUMNS plus a +1/-1 delta per row
+COUNTER_UPDATES = {
+    "claims": (
+        "WITH changes AS (%s), "
+        "by_type AS ("
+        "SELECT report_id, claim_type, sum(delta) AS n "
+        "FROM changes GROUP BY report_id, claim_type), "
+        "by_priority AS ("
+        "SELECT report_id, priority, sum(delta) AS n "
+        "FROM changes GROUP BY report_id, priority), "
+        "totals AS ("
+        "SELECT report_id, sum(n) AS n, jsonb_object_agg(claim_type, n) AS by_type "
+        "FROM by_type GROUP BY report_id) "
+        "UPDATE reports r SET "
+        "claims_count = r.claims_count + t.n, "
+        "claims_by_type = jsonb_counters_add(r.claims_by_type, t.by_type), "
+        "claims_by_priority = jsonb_counters_add(r.claims_by_priority, ("
+        "SELECT jsonb_object_agg(p.priority, p.n) FROM by_priority p "
+        "WHERE p.report_id = t.report_id)) "
+        "FROM totals t WHERE r.id = t.report_id"
+    ),
+    **{
+        table: (
+            "WITH changes AS (%s), "
+            "totals AS ("
+            "SELECT report_id, sum(delta) AS n FROM changes "
+            "GROUP BY report_id HAVING sum(delta) <> 0) "
+            f"UPDATE reports r SET {table}_count = r.{table}_count + t.n "
+            "FROM totals t WHERE r.id = t.report_id"
+        )
+        for table in ("findings", "verdicts")
+    },
+}
+
+
+def upgrade() -> None:
+    """Add counter columns, backfill them, and install the triggers."""
+    for column in COUNT_COLUMNS:
+        op.add_column(
+            "reports",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+    for column in BREAKDOWN_COLUMNS:
+        op.add_column(
+            "reports",
+            sa.Column(
+                column,
+                postgresql.JSONB(),
+                nullable=False,
+                server_default=sa.text("'{}'::jsonb"),
+            ),
+        )
+
+    # Adds each count in deltas to counts, dropping keys that reach zero so
+    # the breakdowns match what GROUP BY used to return
+    op.execute(
+        """
+        CREATE FUNCTION jsonb_counters_add(counts jsonb, deltas jsonb)
+        RETURNS jsonb LANGUAGE sql IMMUTABLE AS $$
+            SELECT COALESCE(jsonb_object_agg(key, n) FILTER (WHERE n > 0), '{}'::jsonb)
+            FROM (
+                SELECT key, sum(value::integer) AS n
+                FROM (
+                    SELECT * FROM jsonb_each_text(counts)
+                    UNION ALL
+                    SELECT * FROM jsonb_each_text(deltas)
+                ) e
+                GROUP BY key
+            ) t
+        $$
+        """
+    )
+
+    # The triggers are statement-level and read the changed rows from
+    # transition tables, so a bulk insert updates each affected reports row
+    # once instead of once per row. Updates only count rows whose counted
+    # columns actually changed, so e.g. claim status updates leave reports
+    # alone. Transition tables can't be combined with several events or a
+    # column list, hence one trigger per event.
+    for table, columns in TRIGGER_COLUMNS.items():
+        selected = ", ".join(f"{{side}}.{column}" for column in columns)
+        changed = (
+            f"({', '.join(f'o.{column}' for column in columns)}) IS DISTINCT FROM "
+            f"({', '.join(f'n.{column}' for column in columns)})"
+        )
+        moved = f"FROM old_rows o JOIN new_rows n USING (id) WHERE {changed}"
+        op.execute(
+            f"""
+            CREATE FUNCTION reports_count_{table}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                changes text;
+            BEGIN
+                changes := CASE TG_OP
+                    WHEN 'INSERT' THEN
+                        'SELECT {selected.format(side="n")}, 1 AS delta FROM new_rows n'
+                    WHEN 'DELETE' THEN
+                        'SELECT {selected.format(side="o")}, -1 AS delta FROM old_rows o'
+                    ELSE
+                        'SELECT {selected.format(side="n")}, 1 AS delta {moved}
+                         UNION ALL
+                         SELECT {selected.format(side="o")}, -1 AS delta {moved}'
+                END;
+                EXECUTE format({COUNTER_UPDATES[table]!r}, changes);
+                RETURN NULL;
+            END
+            $$
+            """
+        )
+        for event, referencing in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ):
+            op.execute(
+                f"""
+                CREATE TRIGGER trg_{table}_report_counters_{event.lower()}
+                AFTER {event} ON {table}
+                REFERENCING {referencing}
+                FOR EACH STATEMENT EXECUTE FUNCTION reports_count_{table}()
+                """
+            )
+
+    op.execute(
+        """
+        UPDATE reports r SET
+            claims_count = COALESCE(
+                (SELECT count(*) FROM claims c WHERE c.report_id = r.id), 0
+            ),
+            claims_by_type = COALESCE(
+                (SELECT jsonb_object_agg(claim_type, n) FROM (
+                    SELECT claim_type, count(*) AS n FROM claims c
+                    WHERE c.report_id = r.id GROUP BY claim_type
+                ) t),
+                '{}'::jsonb
+            ),
+            claims_by_priority = COALESCE(
+                (SELECT jsonb_object_agg(priority, n) FROM (
+                    SELECT priority, count(*) AS n FROM claims c
+                    WHERE c.report_id = r.id GROUP BY priority
+                ) p),
+                '{}'::jsonb
+            ),
+            findings_count = COALESCE(
+                (SELECT count(*) FROM findings f WHERE f.report_id = r.id), 0
+            ),
+            verdicts_count = COALESCE(
+                (SELECT count(*) FROM verdicts v WHERE v.report_id = r.id), 0
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers, their functions, and the counter columns."""
+    for table in TRIGGER_COLUMNS:
+        for event in ("insert", "delete", "update"):
+            op.execute(
+                f"DROP TRIGGER IF EXISTS trg_{table}_report_counters_{event} ON {table}"
+            )
+        op.execute(f"DROP FUNCTION IF EXISTS reports_count_{table}()")
+    op.execute("DROP FUNCTION IF EXISTS jsonb_counters_add(jsonb, jsonb)")
+    for column in BREAKDOWN_COLUMNS + COUNT_COLUMNS:
+        op.drop_column("reports", column)
@@ -0,0 +1,187 @@
+"""List-partition embeddings by source_type.
+
+IFRS S1, IFRS S2, SASB and report chunks shared one heap, so HNSW
+maintenance, VACUUM and corpus re-ingestion (delete one source_type)
+all worked across the whole table. Each source_type is now its own
+partition with its own HNSW graph; deleting a corpus is a TRUNCATE of
+one partition and source_type filters prune to the matching partitions.
+The per-source_type partial HNSW indexes from 008 are superseded by the
+partitioned index, and ix_embeddings_source_type by partition pruning.
+
+The table is rebuilt: rows are copied into the new partitioned table
+and the old one is dropped.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from app.core.database import hnsw_build_settings
+
+# revision identifiers, used by Alembic
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SOURCE_TYPES = ("ifrs_s1", "ifrs_s2", "sasb", "report")
+
+COPY_COLUMNS = "id, report_id, source_type, chunk_text, chunk_metadata, embedding, created_at"
+
+
+def _create_embeddings_table(table_name: str, partitioned: bool) -> None:
+    """Create the embeddings table (partitioned or plain) without secondary indexes."""
+    primary_key = ("id", "source_type") if partitioned else ("id",)
+    op.create_table(
+        table_name,
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("report_id", sa.UUID(), nullable=True),
+        sa.Column("source_type", sa.String(length=30), nullable=False),
+        sa.Column("chunk_text", sa.Text(), nullable=False),
+        sa.Column("chunk_metadata", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "paragraph_id",
+            sa.Text(),
+            sa.Computed("chunk_metadata->>'paragraph_id'", persisted=True),
+            nullable=True,
+        ),
+        sa.Column(
+            "source_page",
+            sa.Integer(),
+            sa.Computed("(chunk_metadata->>'page_start')::integer", persisted=True),
+            nullable=True,
+        ),
+        sa.Column(
+            "section_title",
+            sa.Text(),
+            sa.Computed(
+                "COALESCE(chunk_metadata->>'section', chunk_metadata->'section_path'->> -1)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+        sa.Column("embedding", pgvector.sqlalchemy.HALFVEC(1536), nullable=False),
+        sa.Column(
+            "ts_content",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', chunk_text)", persisted=True),
+            nullable=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["report_id"],
+            ["reports.id"],
+            name=f"{table_name}_report_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name=f"{table_name}_pkey"),
+        **({"postgresql_partition_by": "LIST (source_type)"} if partitioned else {}),
+    )
+
+
+def _create_common_indexes() -> None:
+    """Create the secondary indexes shared by both layouts on embeddings."""
+    op.create_index("ix_embeddings_report_id", "embeddings", ["report_id"])
+    op.create_index(
+        "ix_embeddings_embedding_hnsw",
+        "embeddings",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 24, "ef_construction": 128},
+        postgresql_ops={"embedding": "halfvec_ip_ops"},
+    )
+    op.create_index(
+        "ix_embeddings_paragraph_id",
+        "embeddings",
+        ["paragraph_id"],
+        postgresql_where=sa.text("source_type IN ('ifrs_s1', 'ifrs_s2')"),
+    )
+    op.create_index(
+        "ix_embeddings_report_source_page",
+        "embeddings",
+        ["report_id", "source_page"],
+        postgresql_where=sa.text("source_type = 'report'"),
+    )
+    op.create_index(
+        "ix_embeddings_ts_content_gin",
+        "embeddings",
+        ["ts_content"],
+        postgresql_using="gin",
+        postgresql_with={"fastupdate": "off"},
+    )
+
+
+def _swap_in_new_table(partitioned: bool) -> None:
+    """Create the new embeddings layout, copy rows into it, drop the old table."""
+    for statement in hnsw_build_settings():
+        op.execute(statement)
+
+    op.rename_table("embeddings", "embeddings_old")
+    # Free the constraint and index names for the new table
+    op.execute("ALTER TABLE embeddings_old RENAME CONSTRAINT embeddings_pkey TO embeddings_old_pkey")
+    op.execute(
+        "ALTER TABLE embeddings_old "
+        "RENAME CONSTRAINT embeddings_report_id_fkey TO embeddings_old_report_id_fkey"
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE index_name text;
+        BEGIN
+            FOR index_name IN
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = 'embeddings_old' AND indexname LIKE 'ix_embeddings_%'
+            LOOP
+                EXECUTE format('DROP INDEX %I', index_name);
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+    _create_embeddings_table("embeddings", partitioned=partitioned)
+    if partitioned:
+        for source_type in SOURCE_TYPES:
+            op.execute(
+                f"CREATE TABLE embeddings_{source_type} "
+                f"PARTITION OF embeddings FOR VALUES IN ('{source_type}')"
+            )
+
+    # Load before indexing so each HNSW graph is built once, in bulk
+    op.execute(f"INSERT INTO embeddings ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM embeddings_old")
+    op.drop_table("embeddings_old")
+    _create_common_indexes()
+
+
+def upgrade() -> None:
+    """Rebuild embeddings as a LIST (source_type) partitioned table."""
+    _swap_in_new_table(partitioned=True)
+
+
+def downgrade() -> None:
+    """Rebuild embeddings as a single table with per-source_type partial HNSW indexes."""
+    _swap_in_new_table(partitioned=False)
+    op.create_index("ix_embeddings_source_type", "embeddings", ["source_type"])
+    for source_type in SOURCE_TYPES:
+        op.create_index(
+            f"ix_embeddings_embedding_hnsw_{source_type}",
+            "embeddings",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_ip_ops"},
+            postgresql_where=sa.text(f"source_type = '{source_type}'"),
+        )
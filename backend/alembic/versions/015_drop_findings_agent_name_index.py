@@ -0,0 +1,37 @@
+"""Drop the single-column findings agent_name index.
+
+agent_name has five distinct values, so the planner rarely chooses this
+index, yet every findings insert has to maintain it. Agent filters in
+the API are always combined with report_id or claim_id, which are
+served by ix_findings_report_created (agent_name is INCLUDEd) and
+ix_findings_claim_id_agent_name. The single-column claim_id and
+report_id indexes were already replaced in 010.
+
+Check pg_stat_user_indexes.idx_scan for ix_findings_agent_name before
+applying to a long-running database.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop ix_findings_agent_name."""
+    op.drop_index("ix_findings_agent_name", table_name="findings")
+
+
+def downgrade() -> None:
+    """Recreate ix_findings_agent_name."""
+    op.create_index("ix_findings_agent_name", "findings", ["agent_name"])
@@ -0,0 +1,60 @@
+"""Add generated search_vec columns for chatbot full-text retrieval.
+
+The chatbot's finding, verdict, gap and claim retrievers previously
+filtered with up to five OR-ed ILIKE '%keyword%' predicates, which
+cannot use an index and scan every row of the report. Each table now
+carries a STORED tsvector generated by PostgreSQL with a GIN index, so
+retrieval is an index lookup ranked by ts_rank_cd.
+
+Adding a STORED generated column rewrites the table; run during a
+maintenance window on large databases.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SEARCH_VECTORS = {
+    "findings": "to_tsvector('english', summary || ' ' || agent_name)",
+    "verdicts": "to_tsvector('english', reasoning)",
+    "claims": "to_tsvector('english', claim_text)",
+}
+
+
+def upgrade() -> None:
+    """Add search_vec generated columns and their GIN indexes."""
+    for table, expression in _SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vec",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_search_vec_gin",
+            table,
+            ["search_vec"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Drop the search_vec columns and their GIN indexes."""
+    for table in _SEARCH_VECTORS:
+        op.drop_index(f"ix_{table}_search_vec_gin", table_name=table)
+        op.drop_column(table, "search_vec")
@@ -11,15 +11,16 @@ Uses Map-Reduce architecture to handle large documents:
 import asyncio
 import json
 import logging
-import math
 import re
 from dataclasses import dataclass
 from typing import Literal
 from uuid import UUID
 
+import numpy as np
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.agents.state import Claim as StateClaim
 from app.agents.state import SibylState
@@ -460,17 +461,16 @@ async def _extract_claims_from_chunk(chunk: DocumentChunk) -> list[ExtractedClai
 # ============================================================================
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
+def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Compute cosine similarity between two embedding vectors."""
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    return dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
+    norm_a = np.linalg.norm(a)
+    norm_b = np.linalg.norm(b)
+    return float(np.dot(a, b) / (norm_a * norm_b)) if norm_a and norm_b else 0.0
 
 
 def _find_candidate_duplicates(
     claims: list[ExtractedClaim],
-    embeddings: list[list[float]],
+    embeddings: np.ndarray,
 ) -> list[tuple[int, int, float]]:
     """Find claim pairs with high embedding similarity from overlap regions.
 
@@ -903,7 +903,11 @@ async def run_claims_extraction(
         List of persisted Claim models
     """
     # Load the report
-    stmt = select(Report).where(Report.id == UUID(report_id))
+    stmt = (
+        select(Report)
+        .where(Report.id == UUID(report_id))
+        .options(undefer(Report.parsed_content))
+    )
     result = await db.execute(stmt)
     report = result.scalar_one_or_none()
 
@@ -11,7 +11,7 @@ This is the terminal node in the pipeline that:
 import logging
 from uuid import UUID
 
-from sqlalchemy import update
+from sqlalchemy import insert, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,7 +22,8 @@ from app.agents.stream_utils import (
     emit_pipeline_completed,
     emit_error,
 )
-from app.core.database import generate_uuid7, get_db_session
+from app.core.database import generate_uuid7, generate_uuid7_batch, get_db_session
+from app.core.sanitize import sanitize_rows
 from app.models.claim import Claim as DBClaim
 from app.models.finding import Finding
 from app.models.report import Report
@@ -114,24 +115,28 @@ async def _persist_results(state: SibylState, db: AsyncSession) -> None:
     
     # Persist claims first (other entities reference them)
     claim_id_mapping: dict[str, UUID] = {}  # Maps state claim_id -> DB UUID
-    for claim in claims:
-        db_claim_id = generate_uuid7()
+    claim_rows: list[dict] = []
+    for claim, db_claim_id in zip(claims, generate_uuid7_batch(len(claims))):
         claim_id_mapping[claim.claim_id] = db_claim_id
         
-        db_claim = DBClaim(
-            id=db_claim_id,
-            report_id=report_id,
-            claim_text=claim.text,
-            claim_type=claim.claim_type,
-            source_page=claim.page_number,
-            source_location=claim.source_location,
-            ifrs_paragraphs=[{"paragraph_id": p} for p in claim.ifrs_paragraphs],
-            priority=claim.priority,
-            agent_reasoning=claim.agent_reasoning,
-        )
-        db.add(db_claim)
+        claim_rows.append({
+            "id": db_claim_id,
+            "report_id": report_id,
+            "claim_text": claim.text,
+            "claim_type": claim.claim_type,
+            "source_page": claim.page_number,
+            "source_location": claim.source_location,
+            "ifrs_paragraphs": [{"paragraph_id": p} for p in claim.ifrs_paragraphs],
+            "priority": claim.priority,
+            "agent_reasoning": claim.agent_reasoning,
+        })
+    if claim_rows:
+        # Bulk Core insert bypasses the before_flush sanitizer
+        await db.execute(insert(DBClaim), sanitize_rows(DBClaim, claim_rows))
     
     # Persist findings (using mapped claim IDs)
+    finding_rows: list[dict] = []
+    finding_ids = iter(generate_uuid7_batch(len(findings)))
     for finding in findings:
         # Skip if this is a stub finding without real evidence
         if finding.details.get("stub"):
@@ -140,19 +145,20 @@ async def _persist_results(state: SibylState, db: AsyncSession) -> None:
         # Map state claim_id to the persisted DB claim UUID
         db_claim_id = claim_id_mapping.get(finding.claim_id) if finding.claim_id else None
         
-        db_finding = Finding(
-            id=generate_uuid7(),
-            report_id=report_id,
-            claim_id=db_claim_id,
-            agent_name=finding.agent_name,
-            evidence_type=finding.evidence_type,
-            summary=finding.summary,
-            details=finding.details,
-            supports_claim=finding.supports_claim,
-            confidence=finding.confidence,
-            iteration=finding.iteration,
-        )
-        db.add(db_finding)
+        finding_rows.append({
+            "id": next(finding_ids),
+            "report_id": report_id,
+            "claim_id": db_claim_id,
+            "agent_name": finding.agent_name,
+            "evidence_type": finding.evidence_type,
+            "summary": finding.summary,
+            "details": finding.details,
+            "supports_claim": finding.supports_claim,
+            "confidence": finding.confidence,
+            "iteration": finding.iteration,
+        })
+    if finding_rows:
+        await db.execute(insert(Finding), sanitize_rows(Finding, finding_rows))
     
     # Persist verdicts (using mapped claim IDs) with upsert to handle re-judging
     for verdict in verdicts:
@@ -175,7 +181,7 @@ async def _persist_results(state: SibylState, db: AsyncSession) -> None:
             "evidence_summary": verdict.evidence_summary,
             "iteration_count": verdict.iteration_count,
         }
-        stmt = pg_insert(Verdict).values(**verdict_data)
+        stmt = pg_insert(Verdict).values(**sanitize_rows(Verdict, [verdict_data])[0])
         stmt = stmt.on_conflict_do_update(
             index_elements=["claim_id"],
             set_={
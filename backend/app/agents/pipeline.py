@@ -13,6 +13,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.agents.event_registry import get_event_queue, remove_event_queue
 from app.agents.graph import get_checkpointer, get_compiled_graph, EXTRACT_CLAIMS
@@ -164,7 +165,11 @@ async def load_report(report_id: str, db: AsyncSession) -> Report:
     Raises:
         ValueError: If report not found or has no parsed content
     """
-    stmt = select(Report).where(Report.id == UUID(report_id))
+    stmt = (
+        select(Report)
+        .where(Report.id == UUID(report_id))
+        .options(undefer(Report.parsed_content))
+    )
     result = await db.execute(stmt)
     report = result.scalar_one_or_none()
     
@@ -16,15 +16,14 @@ from app.core.dependencies import get_db
 from app.models.claim import Claim
 from app.models.finding import Finding
 from app.models.report import Report
-from app.models.verdict import Verdict
 from app.schemas.analysis import (
     AnalysisStatusResponse,
+    ClaimListAdapter,
     ClaimResponse,
     ClaimsListResponse,
     ClaimWithFindingsResponse,
-    FindingResponse,
+    FindingListAdapter,
     FindingsListResponse,
-    IFRSParagraphMapping,
     StartAnalysisResponse,
 )
 
@@ -46,30 +45,7 @@ async def get_redis() -> redis.Redis:
 
 def _claim_to_response(claim: Claim) -> ClaimResponse:
     """Convert a Claim model to ClaimResponse schema."""
-    # Parse ifrs_paragraphs from JSONB
-    ifrs_mappings = []
-    if claim.ifrs_paragraphs:
-        for mapping in claim.ifrs_paragraphs:
-            if isinstance(mapping, dict):
-                ifrs_mappings.append(
-                    IFRSParagraphMapping(
-                        paragraph_id=mapping.get("paragraph_id", ""),
-                        pillar=mapping.get("pillar", ""),
-                        relevance=mapping.get("relevance", ""),
-                    )
-                )
-
-    return ClaimResponse(
-        id=str(claim.id),
-        claim_text=claim.claim_text,
-        claim_type=claim.claim_type,
-        source_page=claim.source_page,
-        source_location=claim.source_location,
-        ifrs_paragraphs=ifrs_mappings,
-        priority=claim.priority,
-        agent_reasoning=claim.agent_reasoning,
-        created_at=claim.created_at,
-    )
+    return ClaimResponse.model_validate(claim)
 
 
 def _derive_pipeline_stage(
@@ -165,11 +141,7 @@ async def start_analysis(
 
     # If skipping claims extraction, verify claims exist
     if skip_claims_extraction:
-        claims_count_stmt = select(func.count()).where(Claim.report_id == report_uuid)
-        claims_result = await db.execute(claims_count_stmt)
-        claims_count = claims_result.scalar() or 0
-        
-        if claims_count == 0:
+        if report.claims_count == 0:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot skip claims extraction: no claims exist for this report.",
@@ -220,56 +192,30 @@ async def get_analysis_status(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid report ID format.")
 
-    stmt = select(Report).where(Report.id == report_uuid)
+    # Counters are maintained on the report row by database triggers, so a
+    # poll is a single-row read rather than aggregates over claims/findings
+    stmt = select(
+        Report.status,
+        Report.error_message,
+        Report.updated_at,
+        Report.claims_count,
+        Report.claims_by_type,
+        Report.claims_by_priority,
+        Report.findings_count,
+        Report.verdicts_count,
+    ).where(Report.id == report_uuid)
     result = await db.execute(stmt)
-    report = result.scalar_one_or_none()
+    report = result.one_or_none()
 
     if report is None:
         raise HTTPException(status_code=404, detail="Report not found.")
 
-    # Count claims by type
-    type_counts_stmt = (
-        select(Claim.claim_type, func.count(Claim.id))
-        .where(Claim.report_id == report_uuid)
-        .group_by(Claim.claim_type)
-    )
-    type_counts_result = await db.execute(type_counts_stmt)
-    claims_by_type = dict(type_counts_result.all())
-
-    # Count claims by priority
-    priority_counts_stmt = (
-        select(Claim.priority, func.count(Claim.id))
-        .where(Claim.report_id == report_uuid)
-        .group_by(Claim.priority)
-    )
-    priority_counts_result = await db.execute(priority_counts_stmt)
-    claims_by_priority = dict(priority_counts_result.all())
-
-    # Total claims count
-    total_claims = sum(claims_by_type.values())
-    
-    # FRD 5: Count findings
-    findings_count_stmt = (
-        select(func.count())
-        .where(Finding.report_id == report_uuid)
-    )
-    findings_result = await db.execute(findings_count_stmt)
-    findings_count = findings_result.scalar() or 0
-    
-    # FRD 5: Count verdicts
-    verdicts_count_stmt = (
-        select(func.count())
-        .where(Verdict.report_id == report_uuid)
-    )
-    verdicts_result = await db.execute(verdicts_count_stmt)
-    verdicts_count = verdicts_result.scalar() or 0
-    
     # Derive pipeline stage
     pipeline_stage = _derive_pipeline_stage(
         report.status,
-        total_claims,
-        findings_count,
-        verdicts_count,
+        report.claims_count,
+        report.findings_count,
+        report.verdicts_count,
     )
     
     # For active_agents and iteration_count, we would need to query the
@@ -281,14 +227,14 @@ async def get_analysis_status(
     return AnalysisStatusResponse(
         report_id=report_id,
         status=report.status,
-        claims_count=total_claims,
-        claims_by_type=claims_by_type,
-        claims_by_priority=claims_by_priority,
+        claims_count=report.claims_count,
+        claims_by_type=report.claims_by_type,
+        claims_by_priority=report.claims_by_priority,
         pipeline_stage=pipeline_stage,
         active_agents=active_agents,
         iteration_count=iteration_count,
-        findings_count=findings_count,
-        verdicts_count=verdicts_count,
+        findings_count=report.findings_count,
+        verdicts_count=report.verdicts_count,
         error_message=report.error_message,
         updated_at=report.updated_at,
     )
@@ -352,11 +298,9 @@ async def get_claims(
     result = await db.execute(query)
     claims = result.scalars().all()
 
-    # Convert to response
-    claim_responses = [_claim_to_response(claim) for claim in claims]
-
-    return ClaimsListResponse(
-        claims=claim_responses,
+    # Convert to response (items validated in one pass, envelope trusted)
+    return ClaimsListResponse.model_construct(
+        claims=ClaimListAdapter.validate_python(claims, from_attributes=True),
         total=total,
         page=page,
         size=size,
@@ -396,22 +340,6 @@ async def get_claim(
 # =============================================================================
 
 
-def _finding_to_response(finding: Finding) -> FindingResponse:
-    """Convert a Finding model to FindingResponse schema."""
-    return FindingResponse(
-        id=str(finding.id),
-        claim_id=str(finding.claim_id) if finding.claim_id else None,
-        agent_name=finding.agent_name,
-        evidence_type=finding.evidence_type,
-        summary=finding.summary,
-        details=finding.details,
-        supports_claim=finding.supports_claim,
-        confidence=finding.confidence,
-        iteration=finding.iteration,
-        created_at=finding.created_at,
-    )
-
-
 @router.get("/{report_id}/findings", response_model=FindingsListResponse)
 async def get_findings(
     report_id: str,
@@ -466,11 +394,9 @@ async def get_findings(
     result = await db.execute(query)
     findings = result.scalars().all()
 
-    # Convert to response
-    finding_responses = [_finding_to_response(finding) for finding in findings]
-
-    return FindingsListResponse(
-        findings=finding_responses,
+    # Convert to response (items validated in one pass, envelope trusted)
+    return FindingsListResponse.model_construct(
+        findings=FindingListAdapter.validate_python(findings, from_attributes=True),
         total=total,
         page=page,
         size=size,
@@ -514,5 +440,5 @@ async def get_claim_with_findings(
 
     return ClaimWithFindingsResponse(
         claim=_claim_to_response(claim),
-        findings=[_finding_to_response(f) for f in findings],
+        findings=FindingListAdapter.validate_python(findings, from_attributes=True),
     )
@@ -7,10 +7,10 @@ Provides:
 - GET /chat/{report_id}/history - Get conversation history
 """
 
-import json
 import logging
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
@@ -24,7 +24,7 @@ from app.schemas.chat import (
     Citation,
     ConversationHistoryResponse,
 )
-from app.services.chat_service import ChatService
+from app.services.chat_service import ChatService, report_cache_version
 from app.services.embedding_service import EmbeddingService
 from app.services.openrouter_client import openrouter_client
 from app.services.rag_service import RAGService
@@ -62,7 +62,7 @@ def format_sse_event(event_type: str, data: dict, event_id: int) -> str:
     Returns:
         SSE-formatted string
     """
-    data_str = json.dumps(data)
+    data_str = orjson.dumps(data, option=orjson.OPT_NAIVE_UTC).decode()
     lines = [
         f"event: {event_type}",
         f"data: {data_str}",
@@ -84,6 +84,7 @@ async def send_chat_message(
     This endpoint streams the chatbot response via Server-Sent Events (SSE).
     The response includes:
     - chat_token events: Individual tokens as they're generated
+    - chat_citation_ref events: Each cited source as soon as its marker streams
     - chat_citations events: Citation data after response completion
     - chat_done events: Final event with complete message
     - chat_error events: Error information if something fails
@@ -96,7 +97,8 @@ async def send_chat_message(
         StreamingResponse with SSE content
     """
     # Verify report exists
-    await get_report_or_404(report_id, db)
+    report = await get_report_or_404(report_id, db)
+    report_version = report_cache_version(report)
 
     # Initialize services
     embedding_service = EmbeddingService()
@@ -104,10 +106,11 @@ async def send_chat_message(
     chat_service = ChatService(db, rag_service, openrouter_client)
 
     # Get or create conversation
-    conversation = await chat_service.get_or_create_conversation(report_id)
+    conversation = await chat_service.get_or_create_conversation(report.id)
 
-    # Get conversation history
-    history_messages = await chat_service.get_conversation_history(conversation.id)
+    # Get the recent history window sent to the LLM, flattened once to the
+    # role/content dicts the service passes through as-is
+    history_messages = await chat_service.get_recent_messages(conversation.id)
     conversation_history = [
         {"role": msg.role, "content": msg.content}
         for msg in history_messages
@@ -132,6 +135,7 @@ async def send_chat_message(
                 report_id=report_id,
                 user_message=request.message,
                 conversation_history=conversation_history,
+                report_version=report_version,
             ):
                 event_type = event["type"]
                 data = event["data"]
@@ -141,24 +145,23 @@ async def send_chat_message(
                     yield format_sse_event("chat_token", {"token": data}, event_id)
                     event_id += 1
 
+                elif event_type == "citation_ref":
+                    yield format_sse_event("chat_citation_ref", {"citation": data}, event_id)
+                    event_id += 1
+
                 elif event_type == "citations":
                     citations_data = data
                     yield format_sse_event("chat_citations", {"citations": data}, event_id)
                     event_id += 1
 
                 elif event_type == "done":
-                    # Persist assistant message
-                    # Need to get a fresh session since we're in a generator
-                    citations = [
-                        Citation(**c) for c in citations_data
-                    ] if citations_data else None
-
-                    # Persist inside the generator using the same session
+                    # Persist inside the generator using the same session;
+                    # citations arrive already dumped from the stream
                     assistant_message = await chat_service.persist_message(
                         conversation_id=conversation.id,
                         role="assistant",
                         content=full_content,
-                        citations=citations,
+                        citations_dumped=citations_data or None,
                     )
                     await db.commit()
 
@@ -207,7 +210,7 @@ async def get_chat_history(
         ConversationHistoryResponse with all messages
     """
     # Verify report exists
-    await get_report_or_404(report_id, db)
+    report = await get_report_or_404(report_id, db)
 
     # Initialize chat service
     embedding_service = EmbeddingService()
@@ -215,7 +218,7 @@ async def get_chat_history(
     chat_service = ChatService(db, rag_service, openrouter_client)
 
     # Get or create conversation
-    conversation = await chat_service.get_or_create_conversation(report_id)
+    conversation = await chat_service.get_or_create_conversation(report.id)
 
     # Get messages
     messages = await chat_service.get_conversation_history(conversation.id)
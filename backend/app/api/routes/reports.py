@@ -12,6 +12,7 @@ from sqlalchemy import select
 
 from app.core.database import DbSession
 from app.models.report import Report
+from app.models.report_pdf import ReportPdf
 
 logger = logging.getLogger(__name__)
 
@@ -51,19 +52,23 @@ async def get_report_pdf(
             detail="Report not found.",
         ) from exc
 
-    # Query the report
-    stmt = select(Report).where(Report.id == uuid)
+    # Query the report's filename alongside its PDF (stored in report_pdfs)
+    stmt = (
+        select(Report.filename, ReportPdf.pdf_binary)
+        .outerjoin(ReportPdf, ReportPdf.report_id == Report.id)
+        .where(Report.id == uuid)
+    )
     result = await db.execute(stmt)
-    report = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if report is None:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Report not found.",
         )
 
     # Check if PDF binary exists
-    if report.pdf_binary is None:
+    if row.pdf_binary is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="PDF binary not available for this report.",
@@ -71,10 +76,10 @@ async def get_report_pdf(
 
     # Return the PDF binary with appropriate headers
     return Response(
-        content=report.pdf_binary,
+        content=row.pdf_binary,
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f'inline; filename="{report.filename}"',
+            "Content-Disposition": f'inline; filename="{row.filename}"',
             "Cache-Control": "private, max-age=3600",
         },
     )
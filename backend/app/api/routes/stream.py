@@ -10,6 +10,7 @@ import asyncio
 import logging
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
@@ -35,7 +36,7 @@ def format_sse_event(event: StreamEvent, event_id: int) -> str:
     Returns:
         SSE-formatted string with event type, data, and ID
     """
-    data = event.model_dump_json()
+    data = orjson.dumps(event.model_dump(), option=orjson.OPT_NAIVE_UTC).decode()
     lines = [
         f"event: {event.event_type}",
         f"data: {data}",
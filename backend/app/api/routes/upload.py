@@ -14,6 +14,7 @@ from app.core.config import settings
 from app.core.database import DbSession
 from app.core.dependencies import RAGServiceDep, RedisDep
 from app.models.report import Report
+from app.models.report_pdf import ReportPdf
 from app.schemas.upload import (
     ReportStatusResponse,
     RetryResponse,
@@ -84,7 +85,7 @@ async def upload_pdf(
         filename=filename,
         file_size_bytes=len(content),
         status="uploaded",
-        pdf_binary=content,
+        pdf=ReportPdf(pdf_binary=content),
     )
     db.add(report)
     await db.flush()  # Get the ID assigned
@@ -1,5 +1,7 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,12 +17,30 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql+psycopg://sibyl:sibyl@db:5432/sibyl"
 
+    # HNSW vector index tuning. When unset, values are picked at startup from
+    # the live embedding count; set any of them to pin it.
+    HNSW_M: int | None = None
+    HNSW_EF_CONSTRUCTION: int | None = None
+    HNSW_EF_SEARCH: int | None = None
+    # Rebuild HNSW indexes at startup when their build parameters differ from
+    # the selected ones. Off by default: mismatches are only logged.
+    HNSW_AUTO_REINDEX: bool = False
+    # Session overrides for HNSW builds in migrations; unset leaves the
+    # server configuration in charge. Parallel builds keep the graph in
+    # shared memory sized by maintenance_work_mem, so the database's
+    # /dev/shm (the db container's shm_size) must be at least that large.
+    HNSW_BUILD_MAINTENANCE_WORK_MEM: str | None = None
+    HNSW_BUILD_PARALLEL_WORKERS: int | None = None
+
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
 
     # OpenRouter
     OPENROUTER_API_KEY: str
     OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
+    # Process-wide request rate shared by chat completions and embeddings
+    OPENROUTER_REQUESTS_PER_SECOND: float = 10.0
+    OPENROUTER_BURST: int = 20
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173"]
@@ -54,5 +74,15 @@ class Settings(BaseSettings):
     CLOUD_COVER_MAX_ACCEPTABLE: float = 50.0
 
 
+@lru_cache(maxsize=1)
+def get_settings_cached() -> Settings:
+    """Return the process-wide settings instance.
+
+    Tests can call ``get_settings_cached.cache_clear()`` to have the
+    settings dependency pick up new environment variables.
+    """
+    return Settings()
+
+
 # Singleton settings instance
-settings = Settings()
+settings = get_settings_cached()
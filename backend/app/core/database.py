@@ -2,31 +2,79 @@
 
 import logging
 from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
 from typing import Annotated, Any
 from uuid import UUID
 
+import orjson
 from fastapi import Depends
-from sqlalchemy import String, Text, event
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import TextClause, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session
-from uuid_utils import uuid7
+from uuid_utils.compat import uuid7
 
 from app.core.config import settings
-from app.core.sanitize import sanitize_for_pg, sanitize_string
+from app.core.sanitize import get_sanitize_keys, sanitize_for_pg, sanitize_string
 
 logger = logging.getLogger(__name__)
 
 
 def generate_uuid7() -> UUID:
     """Generate a UUID v7 and return as stdlib uuid.UUID for psycopg3 compatibility."""
-    return UUID(str(uuid7()))
+    return uuid7()
+
+
+def generate_uuid7_batch(count: int) -> list[UUID]:
+    """Allocate ``count`` UUID v7 primary keys up front for a bulk insert.
+
+    Bulk writers assign ids themselves so SQLAlchemy does not invoke the
+    column default once per row (and COPY, which runs no defaults, gets
+    them in the stream). v7 ids are time-ordered, so a batch lands at the
+    right edge of the primary-key B-tree.
+    """
+    return [uuid7() for _ in range(count)]
+
+
+def utc_now() -> datetime:
+    """Return the current UTC time for client-side timestamp column defaults."""
+    return datetime.now(timezone.utc)
+
+
+# hnsw.ef_search every pooled connection starts with; semantic queries only
+# SET LOCAL a different value once tune_hnsw_index() has picked one
+SESSION_HNSW_EF_SEARCH = settings.HNSW_EF_SEARCH or 100
+
+
+def _engine_connect_args(database_url: str) -> dict[str, Any]:
+    """Driver-specific connection arguments for session defaults and plan caching.
+
+    JIT is turned off because LLVM compilation costs more than it saves on
+    the short HNSW/FTS lookups this app issues, and repeated statements are
+    server-side prepared so they are not re-planned on every call.
+    """
+    server_settings = {"jit": "off", "hnsw.ef_search": str(SESSION_HNSW_EF_SEARCH)}
+    if "+asyncpg" in database_url:
+        return {
+            "server_settings": server_settings,
+            "prepared_statement_cache_size": 1024,
+        }
+    # psycopg: startup GUCs via libpq options; prepare from the second execution
+    options = " ".join(f"-c {name}={value}" for name, value in server_settings.items())
+    return {"options": options, "prepare_threshold": 2}
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB bind values with orjson instead of stdlib json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     pool_pre_ping=True,
+    connect_args=_engine_connect_args(settings.DATABASE_URL),
+    json_serializer=_json_serializer,
 )
 
 # Create async session factory
@@ -74,50 +122,216 @@ DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 
 # =============================================================================
-# PostgreSQL Sanitization Event Listener
+# HNSW Index Tuning
 # =============================================================================
 
-# Column types that need sanitization for PostgreSQL compatibility
-_SANITIZABLE_TYPES = (String, Text)
+# ef_search applied per semantic query; updated by tune_hnsw_index() at startup
+_hnsw_ef_search = SESSION_HNSW_EF_SEARCH
 
 
+def hnsw_build_settings() -> list[TextClause]:
+    """Statements applying the HNSW_BUILD_* overrides for one transaction.
+
+    Migrations execute these before building HNSW indexes. Each override is
+    transaction-local and only issued when its setting is configured.
+    """
+    overrides = {
+        "maintenance_work_mem": settings.HNSW_BUILD_MAINTENANCE_WORK_MEM,
+        "max_parallel_maintenance_workers": settings.HNSW_BUILD_PARALLEL_WORKERS,
+    }
+    return [
+        text("SELECT set_config(:name, :value, true)").bindparams(
+            name=name, value=str(value)
+        )
+        for name, value in overrides.items()
+        if value is not None
+    ]
+
+
+def configure_hnsw_params(vector_count: int) -> dict[str, int]:
+    """Pick HNSW (m, ef_construction, ef_search) for a corpus of the given size.
+
+    Below a million rows the build parameters are the ones the model and
+    migrations create the indexes with (m=24, ef_construction=128), so only
+    ef_search changes with size; larger corpora get a denser graph.
+
+    Args:
+        vector_count: Number of rows in the embeddings table
+
+    Returns:
+        Dict with "m", "ef_construction", and "ef_search"
+    """
+    if vector_count < 100_000:
+        return {"m": 24, "ef_construction": 128, "ef_search": 40}
+    if vector_count < 1_000_000:
+        return {"m": 24, "ef_construction": 128, "ef_search": 100}
+    return {"m": 32, "ef_construction": 128, "ef_search": 200}
+
+
+def get_hnsw_ef_search() -> int:
+    """Return the hnsw.ef_search value to apply to semantic queries."""
+    return _hnsw_ef_search
+
+
+# Advisory lock key held while rebuilding HNSW indexes, so only one worker
+# process rebuilds at a time
+HNSW_REINDEX_LOCK_ID = 0x5EB1_0001
+
+_HNSW_INDEXES_SQL = text(
+    """
+    SELECT c.relname, c.reloptions, i.indisvalid
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_am am ON am.oid = c.relam
+    JOIN pg_inherits p ON p.inhrelid = i.indrelid
+    WHERE p.inhparent = 'embeddings'::regclass
+      AND am.amname = 'hnsw'
+      AND c.relkind = 'i'
+    """
+)
+
+
+def _stale_hnsw_indexes(indexes: list, build_params: dict[str, int]) -> list[str]:
+    """Return the valid indexes whose m/ef_construction differ from build_params."""
+    stale = []
+    for index_name, reloptions, is_valid in indexes:
+        if not is_valid:
+            continue
+        current = dict(opt.split("=", 1) for opt in reloptions or [])
+        if any(current.get(k) != str(v) for k, v in build_params.items()):
+            stale.append(index_name)
+    return stale
+
+
+async def tune_hnsw_index() -> dict[str, int]:
+    """Match the embeddings HNSW indexes to the current corpus size.
+
+    Counts embeddings, selects parameters (with HNSW_* settings overrides),
+    and stores ef_search for RAG queries. Per-partition HNSW indexes built
+    with a different m/ef_construction are only rebuilt when
+    HNSW_AUTO_REINDEX is set, and then by whichever worker takes the
+    advisory lock first: it drops invalid indexes left by an interrupted
+    rebuild, alters the stale ones and runs REINDEX CONCURRENTLY, so reads
+    and writes continue meanwhile.
+
+    Returns:
+        The parameters now in effect
+    """
+    global _hnsw_ef_search
+
+    async with engine.connect() as conn:
+        vector_count = (
+            await conn.execute(text("SELECT count(*) FROM embeddings"))
+        ).scalar_one()
+        indexes = (await conn.execute(_HNSW_INDEXES_SQL)).all()
+
+    params = configure_hnsw_params(vector_count)
+    overrides = {
+        "m": settings.HNSW_M,
+        "ef_construction": settings.HNSW_EF_CONSTRUCTION,
+        "ef_search": settings.HNSW_EF_SEARCH,
+    }
+    params.update({k: v for k, v in overrides.items() if v is not None})
+    _hnsw_ef_search = params["ef_search"]
+
+    build_params = {k: params[k] for k in ("m", "ef_construction")}
+    stale = _stale_hnsw_indexes(indexes, build_params)
+
+    if not stale:
+        logger.info("HNSW indexes match %d embeddings: %s", vector_count, params)
+        return params
+
+    if not settings.HNSW_AUTO_REINDEX:
+        logger.warning(
+            "HNSW indexes %s differ from %s for %d embeddings; "
+            "set HNSW_AUTO_REINDEX to rebuild them",
+            stale,
+            build_params,
+            vector_count,
+        )
+        return params
+
+    async with engine.connect() as conn:
+        # REINDEX CONCURRENTLY cannot run inside a transaction block
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        locked = (
+            await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": HNSW_REINDEX_LOCK_ID}
+            )
+        ).scalar_one()
+        if not locked:
+            logger.info("HNSW index rebuild already running in another worker")
+            return params
+
+        try:
+            # Re-read under the lock: another worker may have just finished
+            indexes = (await conn.execute(_HNSW_INDEXES_SQL)).all()
+            for index_name, _, is_valid in indexes:
+                if not is_valid:
+                    logger.info("Dropping invalid HNSW index %s", index_name)
+                    await conn.execute(
+                        text(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+                    )
+
+            stale = _stale_hnsw_indexes(indexes, build_params)
+            logger.info(
+                "Rebuilding HNSW indexes %s for %d embeddings with %s",
+                stale,
+                vector_count,
+                build_params,
+            )
+            for index_name in stale:
+                await conn.execute(
+                    text(
+                        f'ALTER INDEX "{index_name}" SET '
+                        f"(m = {int(params['m'])}, "
+                        f"ef_construction = {int(params['ef_construction'])})"
+                    )
+                )
+                await conn.execute(text(f'REINDEX INDEX CONCURRENTLY "{index_name}"'))
+        finally:
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": HNSW_REINDEX_LOCK_ID}
+            )
+    logger.info("HNSW index rebuild complete")
+    return params
+
+
+# =============================================================================
+# PostgreSQL Sanitization Event Listener
+# =============================================================================
+
 def _sanitize_model_instance(instance: Any) -> None:
     """Sanitize all string and JSONB columns on a model instance.
     
     This ensures no null bytes or unpaired surrogates reach PostgreSQL.
     """
-    mapper = instance.__class__.__mapper__
-    
-    for column in mapper.columns:
-        # Get the column type
-        col_type = column.type
-        
-        # Check if this column needs sanitization
-        if isinstance(col_type, _SANITIZABLE_TYPES):
-            # Get current value
-            value = getattr(instance, column.key, None)
-            if value is not None and isinstance(value, str):
-                sanitized = sanitize_string(value)
-                if sanitized != value:
-                    setattr(instance, column.key, sanitized)
-                    logger.debug(
-                        "Sanitized %s.%s (removed invalid chars)",
-                        instance.__class__.__name__,
-                        column.key,
-                    )
-        
-        elif isinstance(col_type, JSONB):
-            # Recursively sanitize JSONB values
-            value = getattr(instance, column.key, None)
-            if value is not None:
-                sanitized = sanitize_for_pg(value)
-                if sanitized != value:
-                    setattr(instance, column.key, sanitized)
-                    logger.debug(
-                        "Sanitized %s.%s (JSONB, removed invalid chars)",
-                        instance.__class__.__name__,
-                        column.key,
-                    )
+    string_keys, jsonb_keys = get_sanitize_keys(instance.__class__)
+
+    for key in string_keys:
+        value = getattr(instance, key, None)
+        if value is not None and isinstance(value, str):
+            sanitized = sanitize_string(value)
+            if sanitized is not value:
+                setattr(instance, key, sanitized)
+                logger.debug(
+                    "Sanitized %s.%s (removed invalid chars)",
+                    instance.__class__.__name__,
+                    key,
+                )
+
+    for key in jsonb_keys:
+        # Recursively sanitize JSONB values
+        value = getattr(instance, key, None)
+        if value is not None:
+            sanitized = sanitize_for_pg(value)
+            if sanitized is not value:
+                setattr(instance, key, sanitized)
+                logger.debug(
+                    "Sanitized %s.%s (JSONB, removed invalid chars)",
+                    instance.__class__.__name__,
+                    key,
+                )
 
 
 @event.listens_for(Session, "before_flush")
@@ -128,9 +342,10 @@ def _sanitize_before_flush(
 ) -> None:
     """SQLAlchemy event listener that sanitizes all new/dirty objects before flush.
     
-    This is the nuclear option that catches ALL data going to the database,
-    regardless of which code path wrote it. It ensures that null bytes and
-    other PostgreSQL-incompatible characters never reach the database.
+    This is the nuclear option that catches ALL data written through the ORM
+    unit of work. It ensures that null bytes and other PostgreSQL-incompatible
+    characters never reach the database. Bulk Core inserts do not flush and
+    are sanitized explicitly with app.core.sanitize.sanitize_rows.
     """
     # Sanitize new objects
     for instance in session.new:
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Annotated
 import redis.asyncio as redis
 from fastapi import Depends
 
-from app.core.config import Settings, settings
+from app.core.config import Settings, get_settings_cached, settings
 from app.core.database import get_db, DbSession
 
 if TYPE_CHECKING:
@@ -27,7 +27,7 @@ __all__ = [
 
 def get_settings() -> Settings:
     """Dependency that returns the application settings singleton."""
-    return settings
+    return get_settings_cached()
 
 
 SettingsDep = Annotated[Settings, Depends(get_settings)]
@@ -0,0 +1,58 @@
+"""Process-wide request rate limiting for outbound API clients.
+
+A token bucket refills at a steady rate up to a burst capacity; each request
+takes a token and waits when none are left. One bucket is shared by every
+OpenRouter caller (chat completions and embeddings alike), so their combined
+request rate stays under the account limit instead of each caller bursting
+independently into 429s.
+"""
+
+import asyncio
+import time
+
+from app.core.config import settings
+
+
+class AsyncTokenBucket:
+    """Token bucket for asyncio tasks.
+
+    Callers reserve tokens synchronously (there is no await between reading
+    and updating the bucket, so no lock is needed); when the bucket is empty
+    the balance goes negative and each caller sleeps until its share has
+    refilled, which serves waiters in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the allowed burst size
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _reserve(self, n: float) -> float:
+        """Take n tokens and return how long to wait until they are earned."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= n
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    async def acquire(self, n: float = 1) -> None:
+        """Wait until n tokens are available and take them."""
+        delay = self._reserve(n)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Shared by all OpenRouter requests in this process
+openrouter_bucket = AsyncTokenBucket(
+    rate=settings.OPENROUTER_REQUESTS_PER_SECOND,
+    capacity=settings.OPENROUTER_BURST,
+)
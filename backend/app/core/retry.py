@@ -0,0 +1,118 @@
+"""Retry backoff shared by the outbound API clients.
+
+Retries of rate-limited or failing requests sleep for the delay the server
+asks for in its ``Retry-After`` header when it sends one, and otherwise for a
+jittered step of the client's fixed backoff schedule. Jitter keeps concurrent
+callers (e.g. parallel embedding batches) from retrying in lockstep.
+
+Clients wrap the single request of a call in ``retry_http`` rather than each
+writing its own retry loop.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import ParamSpec, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Rate limiting and transient server/gateway failures
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on a server-requested wait, so a bad header cannot stall a task
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def parse_retry_after(response: httpx.Response | None) -> float | None:
+    """Return the Retry-After delay in seconds, or None if absent or invalid.
+
+    Accepts both forms allowed by RFC 9110: delay-seconds and an HTTP date.
+    """
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def retry_delay(
+    attempt: int,
+    delays: Sequence[float],
+    response: httpx.Response | None = None,
+) -> float:
+    """Compute how long to wait before retry number ``attempt`` (0-based).
+
+    A Retry-After header is honored as a minimum, with up to a second of
+    jitter added; otherwise the schedule step is scaled by 0.5-1.0x.
+    """
+    retry_after = parse_retry_after(response)
+    if retry_after is not None:
+        return retry_after + random.uniform(0.0, 1.0)
+    return delays[min(attempt, len(delays) - 1)] * random.uniform(0.5, 1.0)
+
+
+def retry_http(
+    max_retries: int = 3,
+    delays: Sequence[float] = (1.0, 2.0, 4.0),
+    retry_codes: Collection[int] = RETRY_STATUS_CODES,
+    label: str = "HTTP request",
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Retry an async call that raises httpx.HTTPStatusError on retryable codes.
+
+    The wrapped coroutine should make one request and call
+    ``response.raise_for_status()``. Errors with other status codes propagate
+    immediately; after ``max_retries`` attempts the last error is re-raised.
+
+    Args:
+        max_retries: Total attempts, including the first
+        delays: Backoff schedule in seconds (see retry_delay)
+        retry_codes: HTTP status codes worth retrying
+        label: Name used in retry log messages
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            for attempt in range(max_retries - 1):
+                try:
+                    return await func(*args, **kwargs)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code not in retry_codes:
+                        raise
+                    delay = retry_delay(attempt, delays, e.response)
+                    logger.warning(
+                        "%s returned %d, retrying in %.1fs (attempt %d/%d)",
+                        label,
+                        e.response.status_code,
+                        delay,
+                        attempt + 1,
+                        max_retries,
+                    )
+                    await asyncio.sleep(delay)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
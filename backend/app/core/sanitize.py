@@ -7,11 +7,18 @@ Prevents database persistence failures caused by:
 
 This module provides both a utility function for explicit sanitization and
 a SQLAlchemy event listener for automatic sanitization of all database writes.
+
+The listener (see app.core.database) only sees ORM unit-of-work flushes. Bulk
+writes issued as Core ``insert()`` statements bypass it and must run their
+parameter rows through ``sanitize_rows`` once at the call site.
 """
 
 import logging
 import re
-from typing import Any
+from typing import Any, Callable
+
+from sqlalchemy import String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +39,8 @@ def sanitize_string(value: str, max_length: int = MAX_STRING_LENGTH) -> str:
         max_length: Maximum allowed string length (default: 100KB)
         
     Returns:
-        Sanitized string safe for PostgreSQL text/jsonb columns
+        Sanitized string safe for PostgreSQL text/jsonb columns (the same
+        object if it was already clean)
     """
     if not value:
         return value
@@ -52,12 +60,51 @@ def sanitize_string(value: str, max_length: int = MAX_STRING_LENGTH) -> str:
     return sanitized
 
 
+def _sanitize_dict(value: dict, max_length: int) -> dict:
+    changed = False
+    result = {}
+    for k, v in value.items():
+        new_k = sanitize_for_pg(k, max_length)
+        new_v = sanitize_for_pg(v, max_length)
+        changed = changed or new_k is not k or new_v is not v
+        result[new_k] = new_v
+    return result if changed else value
+
+
+def _sanitize_list(value: list, max_length: int) -> list:
+    result = [sanitize_for_pg(item, max_length) for item in value]
+    if any(new is not old for new, old in zip(result, value)):
+        return result
+    return value
+
+
+def _sanitize_tuple(value: tuple, max_length: int) -> tuple:
+    result = tuple(sanitize_for_pg(item, max_length) for item in value)
+    if any(new is not old for new, old in zip(result, value)):
+        return result
+    return value
+
+
+# Exact-type dispatch for the container/leaf types found in JSONB payloads.
+# A dict lookup on type(value) replaces a chain of isinstance() checks on the
+# hot leaf path; subclasses miss the table and fall back to isinstance below.
+_SANITIZE_DISPATCH: dict[type, Callable[[Any, int], Any]] = {
+    str: sanitize_string,
+    dict: _sanitize_dict,
+    list: _sanitize_list,
+    tuple: _sanitize_tuple,
+}
+
+
 def sanitize_for_pg(value: Any, max_length: int = MAX_STRING_LENGTH) -> Any:
     """Recursively sanitize a value for PostgreSQL compatibility.
     
     Handles strings, dicts, lists, and nested structures. Non-string
     primitive types (int, float, bool, None) are returned unchanged.
     
+    When nothing needs sanitizing the original object is returned, so callers
+    can detect changes with an identity check instead of a deep comparison.
+    
     Args:
         value: Any value that might contain strings
         max_length: Maximum allowed string length (default: 100KB)
@@ -75,25 +122,16 @@ def sanitize_for_pg(value: Any, max_length: int = MAX_STRING_LENGTH) -> Any:
         >>> sanitize_for_pg(["a\\x00", {"b": "c\\x00"}])
         ['a', {'b': 'c'}]
     """
-    if value is None:
-        return None
-    
-    if isinstance(value, str):
-        return sanitize_string(value, max_length)
-    
-    if isinstance(value, dict):
-        return {
-            sanitize_for_pg(k, max_length): sanitize_for_pg(v, max_length)
-            for k, v in value.items()
-        }
-    
-    if isinstance(value, list):
-        return [sanitize_for_pg(item, max_length) for item in value]
-    
-    if isinstance(value, tuple):
-        return tuple(sanitize_for_pg(item, max_length) for item in value)
-    
-    # Primitives (int, float, bool, bytes, etc.) - return unchanged
+    fn = _SANITIZE_DISPATCH.get(type(value))
+    if fn is not None:
+        return fn(value, max_length)
+
+    # Rare path: subclasses of the dispatched types (e.g. str enums)
+    for base, base_fn in _SANITIZE_DISPATCH.items():
+        if isinstance(value, base):
+            return base_fn(value, max_length)
+
+    # Primitives (None, int, float, bool, bytes, etc.) - return unchanged
     return value
 
 
@@ -111,3 +149,67 @@ def contains_invalid_chars(value: str) -> bool:
     if not value:
         return False
     return bool(_INVALID_PG_CHARS.search(value))
+
+
+# =============================================================================
+# Model-aware helpers
+# =============================================================================
+
+# Column types that need sanitization for PostgreSQL compatibility
+_SANITIZABLE_TYPES = (String, Text)
+
+# Per-model cache of (string column keys, JSONB column keys) to sanitize.
+# Columns declared with info={"skip_sanitize": True} hold application-generated
+# values (enum-like strings) and are left out entirely.
+_sanitize_keys_cache: dict[type, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+
+
+def get_sanitize_keys(model: type) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the string and JSONB column keys of a model that need sanitizing.
+    
+    Args:
+        model: A mapped SQLAlchemy model class
+        
+    Returns:
+        Tuple of (string column keys, JSONB column keys)
+    """
+    keys = _sanitize_keys_cache.get(model)
+    if keys is None:
+        # Generated columns are computed by PostgreSQL and never written
+        columns = [
+            col
+            for col in model.__mapper__.columns
+            if not col.info.get("skip_sanitize") and col.computed is None
+        ]
+        string_keys = tuple(
+            col.key for col in columns if isinstance(col.type, _SANITIZABLE_TYPES)
+        )
+        jsonb_keys = tuple(col.key for col in columns if isinstance(col.type, JSONB))
+        keys = _sanitize_keys_cache[model] = (string_keys, jsonb_keys)
+    return keys
+
+
+def sanitize_rows(model: type, rows: list[dict]) -> list[dict]:
+    """Sanitize parameter rows for a bulk Core insert into a model's table.
+    
+    Rows are modified in place and returned for convenience, e.g.
+    ``await db.execute(insert(Embedding), sanitize_rows(Embedding, rows))``.
+    
+    Args:
+        model: The mapped SQLAlchemy model class being inserted into
+        rows: Parameter dicts keyed by column name
+        
+    Returns:
+        The same list of rows, sanitized
+    """
+    string_keys, jsonb_keys = get_sanitize_keys(model)
+    for row in rows:
+        for key in string_keys:
+            value = row.get(key)
+            if isinstance(value, str):
+                row[key] = sanitize_string(value)
+        for key in jsonb_keys:
+            value = row.get(key)
+            if value is not None:
+                row[key] = sanitize_for_pg(value)
+    return rows
@@ -12,7 +12,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import api_router
 from app.core.config import settings
-from app.core.database import async_session_maker, engine
+from app.core.database import async_session_maker, engine, tune_hnsw_index
+from app.services.geocoding_service import geocoding_service
 from app.services.task_worker import TaskWorker
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,12 @@ def run_migrations() -> None:
         logger.error("Failed to run migrations: %s", e)
 
 
+def _log_hnsw_tuning_failure(task: asyncio.Task) -> None:
+    """Log (without raising) a failed background HNSW tuning task."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("HNSW index tuning failed: %s", task.exception())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events."""
@@ -45,6 +52,12 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Sibyl API...")
     run_migrations()
 
+    # Match HNSW search parameters to the corpus size; an opted-in rebuild
+    # (HNSW_AUTO_REINDEX) can take a while on large tables, so it runs in
+    # the background
+    hnsw_task = asyncio.create_task(tune_hnsw_index())
+    hnsw_task.add_done_callback(_log_hnsw_tuning_failure)
+
     # Create Redis client for task worker
     redis_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
 
@@ -67,9 +80,17 @@ async def lifespan(app: FastAPI):
         pass
     logger.info("Task worker stopped")
 
+    # A rebuild interrupted here leaves an invalid index behind; the next
+    # rebuild drops it before starting
+    if not hnsw_task.done():
+        hnsw_task.cancel()
+
     # Close Redis connection
     await redis_client.aclose()
 
+    # Close the shared geocoding HTTP client
+    await geocoding_service.close()
+
     # Dispose database engine
     await engine.dispose()
 
@@ -5,6 +5,7 @@ from app.models.claim import Claim
 from app.models.embedding import Embedding
 from app.models.finding import Finding
 from app.models.report import Report
+from app.models.report_pdf import ReportPdf
 from app.models.verdict import Verdict
 
 __all__ = [
@@ -14,5 +15,6 @@ __all__ = [
     "Embedding",
     "Finding",
     "Report",
+    "ReportPdf",
     "Verdict",
 ]
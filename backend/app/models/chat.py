@@ -11,7 +11,7 @@ from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, generate_uuid7
+from app.core.database import Base, generate_uuid7, utc_now
 
 if TYPE_CHECKING:
     from app.models.report import Report
@@ -38,13 +38,15 @@ class Conversation(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utc_now,
     )
 
     # Relationships
@@ -78,6 +80,7 @@ class ChatMessage(Base):
     role: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
+        info={"skip_sanitize": True},
     )  # "user" or "assistant"
     content: Mapped[str] = mapped_column(Text, nullable=False)
     citations: Mapped[list[dict] | None] = mapped_column(
@@ -100,6 +103,7 @@ class ChatMessage(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
 
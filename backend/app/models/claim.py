@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, generate_uuid7
+from app.core.database import Base, generate_uuid7, utc_now
 
 if TYPE_CHECKING:
     from app.models.finding import Finding
@@ -41,7 +41,17 @@ class Claim(Base):
         nullable=False,
     )
     claim_text: Mapped[str] = mapped_column(Text, nullable=False)
-    claim_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Generated by PostgreSQL for chatbot full-text retrieval
+    search_vec: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', claim_text)", persisted=True),
+        nullable=True,
+    )
+    claim_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        info={"skip_sanitize": True},
+    )
     source_page: Mapped[int] = mapped_column(Integer, nullable=False)
     source_location: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     ifrs_paragraphs: Mapped[list | None] = mapped_column(JSONB, nullable=True)
@@ -49,18 +59,21 @@ class Claim(Base):
         String(20),
         nullable=False,
         default="medium",
+        info={"skip_sanitize": True},
     )
     agent_reasoning: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utc_now,
     )
 
     # Relationships
@@ -80,4 +93,5 @@ class Claim(Base):
     __table_args__ = (
         Index("ix_claims_report_id", "report_id"),
         Index("ix_claims_claim_type", "claim_type"),
+        Index("ix_claims_search_vec_gin", "search_vec", postgresql_using="gin"),
     )
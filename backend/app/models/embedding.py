@@ -4,17 +4,39 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import (
+    DDL,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, generate_uuid7
+from app.core.database import Base, generate_uuid7, utc_now
 
 if TYPE_CHECKING:
     from app.models.report import Report
 
 
+# Corpus types stored in the embeddings table; each is a list partition
+# (embeddings_<source_type>) with its own HNSW index
+EMBEDDING_SOURCE_TYPES = ("ifrs_s1", "ifrs_s2", "sasb", "report")
+
+
+def embedding_partition_name(source_type: str) -> str:
+    """Return the partition table holding a source type's embeddings."""
+    return f"embeddings_{source_type}"
+
+
 class Embedding(Base):
     """
     Represents a text chunk with its vector embedding for RAG retrieval.
@@ -24,6 +46,9 @@ class Embedding(Base):
     - ifrs_s1: Chunk from the IFRS S1 standard text
     - ifrs_s2: Chunk from the IFRS S2 standard text
     - sasb: Chunk from SASB industry standards
+
+    The table is list-partitioned on source_type, so the partition key is
+    part of the primary key.
     """
 
     __tablename__ = "embeddings"
@@ -36,14 +61,41 @@ class Embedding(Base):
         ForeignKey("reports.id", ondelete="CASCADE"),
         nullable=True,
     )
-    source_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    source_type: Mapped[str] = mapped_column(String(30), primary_key=True)
     chunk_text: Mapped[str] = mapped_column(Text, nullable=False)
     chunk_metadata: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    embedding: Mapped[list] = mapped_column(Vector(1536), nullable=False)
-    ts_content: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
+    # Hot chunk_metadata keys promoted to generated columns so lookups and
+    # filters read a scalar instead of walking the JSONB document
+    paragraph_id: Mapped[str | None] = mapped_column(
+        Text,
+        Computed("chunk_metadata->>'paragraph_id'", persisted=True),
+        nullable=True,
+    )
+    source_page: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("(chunk_metadata->>'page_start')::integer", persisted=True),
+        nullable=True,
+    )
+    section_title: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            "COALESCE(chunk_metadata->>'section', chunk_metadata->'section_path'->> -1)",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+    # Stored as FP16 (halfvec); FP32 vectors are cast by PostgreSQL on write
+    embedding: Mapped[list] = mapped_column(HALFVEC(1536), nullable=False)
+    # Generated by PostgreSQL from chunk_text; never written by the application
+    ts_content: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', chunk_text)", persisted=True),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
 
@@ -52,17 +104,41 @@ class Embedding(Base):
 
     __table_args__ = (
         Index("ix_embeddings_report_id", "report_id"),
-        Index("ix_embeddings_source_type", "source_type"),
+        # Partitioned index: PostgreSQL builds one HNSW graph per partition
         Index(
             "ix_embeddings_embedding_hnsw",
             "embedding",
             postgresql_using="hnsw",
-            postgresql_with={"m": 16, "ef_construction": 64},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_ip_ops"},
+        ),
+        Index(
+            "ix_embeddings_paragraph_id",
+            "paragraph_id",
+            postgresql_where=text("source_type IN ('ifrs_s1', 'ifrs_s2')"),
+        ),
+        Index(
+            "ix_embeddings_report_source_page",
+            "report_id",
+            "source_page",
+            postgresql_where=text("source_type = 'report'"),
         ),
         Index(
             "ix_embeddings_ts_content_gin",
             "ts_content",
             postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+        {"postgresql_partition_by": "LIST (source_type)"},
+    )
+
+
+for _source_type in EMBEDDING_SOURCE_TYPES:
+    event.listen(
+        Embedding.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE {embedding_partition_name(_source_type)} "
+            f"PARTITION OF embeddings FOR VALUES IN ('{_source_type}')"
         ),
     )
@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, Integer, String, Text, desc, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, generate_uuid7
+from app.core.database import Base, generate_uuid7, utc_now
 
 if TYPE_CHECKING:
     from app.models.claim import Claim
@@ -49,6 +49,12 @@ class Finding(Base):
     agent_name: Mapped[str] = mapped_column(String(50), nullable=False)
     evidence_type: Mapped[str] = mapped_column(String(50), nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
+    # Generated by PostgreSQL for chatbot full-text retrieval
+    search_vec: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', summary || ' ' || agent_name)", persisted=True),
+        nullable=True,
+    )
     details: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     supports_claim: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
     confidence: Mapped[str | None] = mapped_column(String(20), nullable=True)
@@ -56,6 +62,7 @@ class Finding(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
 
@@ -64,8 +71,26 @@ class Finding(Base):
     claim: Mapped["Claim"] = relationship("Claim", back_populates="findings")
 
     __table_args__ = (
-        Index("ix_findings_report_id", "report_id"),
-        Index("ix_findings_claim_id", "claim_id"),
-        Index("ix_findings_agent_name", "agent_name"),
+        # Covering indexes for the per-claim (by iteration) and per-report
+        # (newest first) reads; they also serve plain report_id/claim_id lookups.
+        Index(
+            "ix_findings_claim_iter",
+            "claim_id",
+            desc("iteration"),
+            postgresql_include=[
+                "agent_name",
+                "evidence_type",
+                "supports_claim",
+                "confidence",
+                "created_at",
+            ],
+        ),
+        Index(
+            "ix_findings_report_created",
+            "report_id",
+            desc("created_at"),
+            postgresql_include=["claim_id", "agent_name"],
+        ),
         Index("ix_findings_claim_id_agent_name", "claim_id", "agent_name"),
+        Index("ix_findings_search_vec_gin", "search_vec", postgresql_using="gin"),
     )
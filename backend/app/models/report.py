@@ -4,17 +4,18 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import BigInteger, DateTime, Index, LargeBinary, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, generate_uuid7
+from app.core.database import Base, generate_uuid7, utc_now
 
 if TYPE_CHECKING:
     from app.models.chat import Conversation
     from app.models.claim import Claim
     from app.models.embedding import Embedding
     from app.models.finding import Finding
+    from app.models.report_pdf import ReportPdf
     from app.models.verdict import Verdict
 
 
@@ -46,48 +47,90 @@ class Report(Base):
         nullable=False,
         default="uploaded",
     )
-    parsed_content: Mapped[str | None] = mapped_column(Text, nullable=True)
-    pdf_binary: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    # Deferred: only loaded by callers that ask for it via undefer()
+    parsed_content: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        deferred=True,
+    )
     content_structure: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Counters maintained by triggers on claims/findings/verdicts (migration
+    # 013) so status polling reads one row; never written by the application
+    claims_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    findings_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    verdicts_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    claims_by_type: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
+    claims_by_priority: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utc_now,
     )
 
-    # Relationships
+    # Relationships. Loading any of these must be explicit (selectinload etc.);
+    # deletes rely on the ON DELETE CASCADE foreign keys, not ORM loads.
     claims: Mapped[list["Claim"]] = relationship(
         "Claim",
         back_populates="report",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     embeddings: Mapped[list["Embedding"]] = relationship(
         "Embedding",
         back_populates="report",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     findings: Mapped[list["Finding"]] = relationship(
         "Finding",
         back_populates="report",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     verdicts: Mapped[list["Verdict"]] = relationship(
         "Verdict",
         back_populates="report",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+    pdf: Mapped["ReportPdf | None"] = relationship(
+        "ReportPdf",
+        back_populates="report",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        uselist=False,
+        lazy="raise_on_sql",
     )
     conversation: Mapped["Conversation | None"] = relationship(
         "Conversation",
         back_populates="report",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         uselist=False,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -0,0 +1,33 @@
+"""ReportPdf model - stores the uploaded PDF bytes for a report."""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+if TYPE_CHECKING:
+    from app.models.report import Report
+
+
+class ReportPdf(Base):
+    """
+    Holds the original PDF binary of a report in its own table.
+
+    Kept out of `reports` so that status polls and relationship loads on
+    Report rows never drag multi-megabyte TOASTed PDFs through the buffer
+    cache. Loaded only by the code paths that serve or parse the PDF.
+    """
+
+    __tablename__ = "report_pdfs"
+
+    report_id: Mapped[UUID] = mapped_column(
+        ForeignKey("reports.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    pdf_binary: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    # Relationships
+    report: Mapped["Report"] = relationship("Report", back_populates="pdf")
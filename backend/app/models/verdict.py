@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, generate_uuid7
+from app.core.database import Base, generate_uuid7, utc_now
 
 if TYPE_CHECKING:
     from app.models.claim import Claim
@@ -43,12 +43,19 @@ class Verdict(Base):
     )
     verdict: Mapped[str] = mapped_column(String(30), nullable=False)
     reasoning: Mapped[str] = mapped_column(Text, nullable=False)
+    # Generated by PostgreSQL for chatbot full-text retrieval
+    search_vec: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', reasoning)", persisted=True),
+        nullable=True,
+    )
     ifrs_mapping: Mapped[list] = mapped_column(JSONB, nullable=False)
     evidence_summary: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     iteration_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
 
@@ -58,4 +65,5 @@ class Verdict(Base):
 
     __table_args__ = (
         Index("ix_verdicts_report_id", "report_id"),
+        Index("ix_verdicts_search_vec_gin", "search_vec", postgresql_using="gin"),
     )
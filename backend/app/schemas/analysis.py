@@ -4,11 +4,19 @@ Implements FRD 3 (Claims Agent) and FRD 5 (Orchestrator Agent).
 """
 
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import Field, TypeAdapter, field_validator
 
+from app.schemas.base import FastBase
 
-class StartAnalysisResponse(BaseModel):
+
+def _uuid_to_str(value: object) -> object:
+    """Render ORM UUID primary/foreign keys as the API's string IDs."""
+    return str(value) if isinstance(value, UUID) else value
+
+
+class StartAnalysisResponse(FastBase):
     """Response after triggering analysis."""
 
     report_id: str
@@ -16,7 +24,7 @@ class StartAnalysisResponse(BaseModel):
     message: str
 
 
-class AnalysisStatusResponse(BaseModel):
+class AnalysisStatusResponse(FastBase):
     """Response for analysis status polling.
     
     Extended in FRD 5 with pipeline-specific fields.
@@ -39,7 +47,7 @@ class AnalysisStatusResponse(BaseModel):
     updated_at: datetime
 
 
-class IFRSParagraphMapping(BaseModel):
+class IFRSParagraphMapping(FastBase):
     """IFRS paragraph mapping with relevance explanation."""
 
     paragraph_id: str
@@ -47,7 +55,7 @@ class IFRSParagraphMapping(BaseModel):
     relevance: str
 
 
-class ClaimResponse(BaseModel):
+class ClaimResponse(FastBase):
     """Response for a single claim."""
 
     id: str
@@ -60,8 +68,26 @@ class ClaimResponse(BaseModel):
     agent_reasoning: str | None = None
     created_at: datetime
 
-
-class ClaimsListResponse(BaseModel):
+    _id_to_str = field_validator("id", mode="before")(_uuid_to_str)
+
+    @field_validator("ifrs_paragraphs", mode="before")
+    @classmethod
+    def _normalize_ifrs_paragraphs(cls, value: object) -> object:
+        """Keep only dict mappings from the JSONB column, filling missing keys."""
+        if not value:
+            return []
+        return [
+            {
+                "paragraph_id": mapping.get("paragraph_id", ""),
+                "pillar": mapping.get("pillar", ""),
+                "relevance": mapping.get("relevance", ""),
+            }
+            for mapping in value
+            if isinstance(mapping, dict)
+        ]
+
+
+class ClaimsListResponse(FastBase):
     """Paginated response for claims list."""
 
     claims: list[ClaimResponse]
@@ -75,7 +101,7 @@ class ClaimsListResponse(BaseModel):
 # =============================================================================
 
 
-class StreamEventResponse(BaseModel):
+class StreamEventResponse(FastBase):
     """A single event from the pipeline execution."""
     
     event_id: int
@@ -85,7 +111,7 @@ class StreamEventResponse(BaseModel):
     timestamp: str
 
 
-class EventsListResponse(BaseModel):
+class EventsListResponse(FastBase):
     """Response for pipeline events replay."""
     
     events: list[StreamEventResponse]
@@ -98,7 +124,7 @@ class EventsListResponse(BaseModel):
 # =============================================================================
 
 
-class FindingResponse(BaseModel):
+class FindingResponse(FastBase):
     """Response for a single finding (agent investigation result)."""
 
     id: str
@@ -112,8 +138,10 @@ class FindingResponse(BaseModel):
     iteration: int
     created_at: datetime
 
+    _ids_to_str = field_validator("id", "claim_id", mode="before")(_uuid_to_str)
 
-class FindingsListResponse(BaseModel):
+
+class FindingsListResponse(FastBase):
     """Paginated response for findings list."""
 
     findings: list[FindingResponse]
@@ -122,7 +150,13 @@ class FindingsListResponse(BaseModel):
     size: int
 
 
-class ClaimWithFindingsResponse(BaseModel):
+# Validate whole result sets in one call; list responses are then assembled
+# with model_construct since their items are already validated.
+ClaimListAdapter = TypeAdapter(list[ClaimResponse])
+FindingListAdapter = TypeAdapter(list[FindingResponse])
+
+
+class ClaimWithFindingsResponse(FastBase):
     """Response for a claim with its associated findings."""
 
     claim: ClaimResponse
@@ -0,0 +1,19 @@
+"""Shared Pydantic base for API schemas."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class FastBase(BaseModel):
+    """Base model for API request/response schemas.
+
+    Models accept ORM objects directly, so routes can validate query
+    results without converting them to dicts first.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FrozenBase(FastBase):
+    """FastBase for response models that are built once and only serialized."""
+
+    model_config = ConfigDict(frozen=True)
@@ -7,7 +7,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field, TypeAdapter
+
+from app.schemas.base import FastBase
 
 
 class CitationSourceType(str, Enum):
@@ -32,7 +34,7 @@ class CitationNavigationTarget(str, Enum):
     DISCLOSURE_GAPS = "disclosure_gaps"
 
 
-class Citation(BaseModel):
+class Citation(FastBase):
     """A citation linking to a source entity."""
 
     citation_number: int = Field(
@@ -58,7 +60,7 @@ class Citation(BaseModel):
     )
 
 
-class ChatMessageRequest(BaseModel):
+class ChatMessageRequest(FastBase):
     """Request body for sending a chat message."""
 
     message: str = Field(
@@ -69,7 +71,7 @@ class ChatMessageRequest(BaseModel):
     )
 
 
-class ChatMessageResponse(BaseModel):
+class ChatMessageResponse(FastBase):
     """A single chat message with metadata and citations."""
 
     id: str = Field(..., description="Message UUID")
@@ -85,7 +87,7 @@ class ChatMessageResponse(BaseModel):
     timestamp: datetime = Field(..., description="When the message was sent")
 
 
-class ConversationHistoryResponse(BaseModel):
+class ConversationHistoryResponse(FastBase):
     """Response containing full conversation history for a report."""
 
     conversation_id: str = Field(..., description="Conversation UUID")
@@ -99,14 +101,14 @@ class ConversationHistoryResponse(BaseModel):
 # SSE Event Schemas for streaming
 
 
-class ChatTokenEvent(BaseModel):
+class ChatTokenEvent(FastBase):
     """SSE event containing a text token from the streaming response."""
 
     event_type: Literal["chat_token"] = "chat_token"
     token: str = Field(..., description="Individual text token")
 
 
-class ChatCitationsEvent(BaseModel):
+class ChatCitationsEvent(FastBase):
     """SSE event containing parsed citations after response completion."""
 
     event_type: Literal["chat_citations"] = "chat_citations"
@@ -116,7 +118,7 @@ class ChatCitationsEvent(BaseModel):
     )
 
 
-class ChatDoneEvent(BaseModel):
+class ChatDoneEvent(FastBase):
     """SSE event indicating response completion."""
 
     event_type: Literal["chat_done"] = "chat_done"
@@ -124,9 +126,12 @@ class ChatDoneEvent(BaseModel):
     full_content: str = Field(..., description="Complete response text")
 
 
-class ChatErrorEvent(BaseModel):
+class ChatErrorEvent(FastBase):
     """SSE event indicating an error occurred."""
 
     event_type: Literal["chat_error"] = "chat_error"
     error: str = Field(..., description="Error message")
 
+
+# Dump or validate a response's citations in one call instead of per model
+CitationListAdapter = TypeAdapter(list[Citation])
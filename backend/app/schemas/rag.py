@@ -5,7 +5,9 @@ Implements FRD 1 (RAG Pipeline) Section 7 - Backend Endpoints.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from app.schemas.base import FastBase
 
 
 # -----------------------------------------------------------------------------
@@ -13,7 +15,7 @@ from pydantic import BaseModel, Field
 # -----------------------------------------------------------------------------
 
 
-class IngestRequest(BaseModel):
+class IngestRequest(FastBase):
     """Request body for POST /api/v1/rag/ingest."""
 
     corpus: Literal["all", "ifrs", "sasb"] = Field(
@@ -22,7 +24,7 @@ class IngestRequest(BaseModel):
     )
 
 
-class SearchRequest(BaseModel):
+class SearchRequest(FastBase):
     """Request body for POST /api/v1/rag/search."""
 
     query: str = Field(
@@ -61,7 +63,7 @@ class SearchRequest(BaseModel):
 # -----------------------------------------------------------------------------
 
 
-class RAGResultResponse(BaseModel):
+class RAGResultResponse(FastBase):
     """Single search result in the response."""
 
     chunk_id: str = Field(description="UUID of the embedding row")
@@ -73,7 +75,7 @@ class RAGResultResponse(BaseModel):
     search_method: str = Field(description="Search method: semantic, keyword, or hybrid")
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(FastBase):
     """Response body for POST /api/v1/rag/search."""
 
     results: list[RAGResultResponse] = Field(description="Ranked search results")
@@ -81,7 +83,7 @@ class SearchResponse(BaseModel):
     search_mode: str = Field(description="Search mode used")
 
 
-class IngestResponse(BaseModel):
+class IngestResponse(FastBase):
     """Response body for POST /api/v1/rag/ingest."""
 
     status: Literal["completed", "already_ingested"] = Field(
@@ -99,7 +101,7 @@ class IngestResponse(BaseModel):
     )
 
 
-class CorpusStatsResponse(BaseModel):
+class CorpusStatsResponse(FastBase):
     """Response body for GET /api/v1/rag/stats."""
 
     ifrs_s1: int = Field(default=0, description="Number of IFRS S1 embeddings")
@@ -109,7 +111,7 @@ class CorpusStatsResponse(BaseModel):
     total: int = Field(default=0, description="Total embeddings")
 
 
-class DeleteCorpusResponse(BaseModel):
+class DeleteCorpusResponse(FastBase):
     """Response body for DELETE /api/v1/rag/corpus/{source_type}."""
 
     status: Literal["deleted"] = Field(description="Operation status")
@@ -117,7 +119,7 @@ class DeleteCorpusResponse(BaseModel):
     deleted_count: int = Field(description="Number of embeddings deleted")
 
 
-class AlreadyIngestedResponse(BaseModel):
+class AlreadyIngestedResponse(FastBase):
     """Response body for 409 Conflict when corpus already exists."""
 
     status: Literal["already_ingested"] = Field(description="Status indicator")
@@ -4,15 +4,16 @@ Implements FRD 13 (Source of Truth Report).
 """
 
 from datetime import datetime
-from pydantic import BaseModel
 from typing import Literal
 
+from app.schemas.base import FrozenBase
+
 
 # ============================================================================
 # Evidence Chain Types
 # ============================================================================
 
-class EvidenceChainEntry(BaseModel):
+class EvidenceChainEntry(FrozenBase):
     """Single entry in the evidence chain."""
     
     finding_id: str
@@ -33,7 +34,7 @@ class EvidenceChainEntry(BaseModel):
 # IFRS Mapping Types
 # ============================================================================
 
-class IFRSMappingResponse(BaseModel):
+class IFRSMappingResponse(FrozenBase):
     """IFRS paragraph mapping in response."""
     
     paragraph_id: str
@@ -45,7 +46,7 @@ class IFRSMappingResponse(BaseModel):
 # Claim Response Types
 # ============================================================================
 
-class ClaimResponse(BaseModel):
+class ClaimResponse(FrozenBase):
     """Claim data in response."""
     
     claim_id: str
@@ -62,7 +63,7 @@ class ClaimResponse(BaseModel):
     created_at: datetime
 
 
-class VerdictResponse(BaseModel):
+class VerdictResponse(FrozenBase):
     """Verdict data in response."""
     
     verdict_id: str
@@ -74,7 +75,7 @@ class VerdictResponse(BaseModel):
     created_at: datetime
 
 
-class ClaimWithVerdictResponse(BaseModel):
+class ClaimWithVerdictResponse(FrozenBase):
     """Claim paired with its verdict and findings."""
     
     claim: ClaimResponse
@@ -86,7 +87,7 @@ class ClaimWithVerdictResponse(BaseModel):
 # Disclosure Gap Types
 # ============================================================================
 
-class DisclosureGapResponse(BaseModel):
+class DisclosureGapResponse(FrozenBase):
     """Disclosure gap finding."""
     
     gap_id: str
@@ -104,7 +105,7 @@ class DisclosureGapResponse(BaseModel):
 # Pillar Section Types
 # ============================================================================
 
-class PillarSummaryResponse(BaseModel):
+class PillarSummaryResponse(FrozenBase):
     """Summary statistics for a single pillar."""
     
     total_claims: int
@@ -115,7 +116,7 @@ class PillarSummaryResponse(BaseModel):
     disclosure_gaps: int
 
 
-class PillarSectionResponse(BaseModel):
+class PillarSectionResponse(FrozenBase):
     """A single IFRS pillar section with claims and gaps."""
     
     pillar: Literal["governance", "strategy", "risk_management", "metrics_targets"]
@@ -129,7 +130,7 @@ class PillarSectionResponse(BaseModel):
 # Report Summary Types
 # ============================================================================
 
-class VerdictBreakdown(BaseModel):
+class VerdictBreakdown(FrozenBase):
     """Breakdown of verdicts by type."""
     
     verified: int
@@ -138,7 +139,7 @@ class VerdictBreakdown(BaseModel):
     insufficient_evidence: int
 
 
-class ReportSummaryResponse(BaseModel):
+class ReportSummaryResponse(FrozenBase):
     """Summary statistics for the entire report."""
     
     report_id: str
@@ -154,7 +155,7 @@ class ReportSummaryResponse(BaseModel):
 # Full Report Response
 # ============================================================================
 
-class SourceOfTruthReportResponse(BaseModel):
+class SourceOfTruthReportResponse(FrozenBase):
     """Full Source of Truth report with all pillars."""
     
     report_id: str
@@ -169,7 +170,7 @@ class SourceOfTruthReportResponse(BaseModel):
 # Claims List Response (with pagination)
 # ============================================================================
 
-class ClaimsListPaginatedResponse(BaseModel):
+class ClaimsListPaginatedResponse(FrozenBase):
     """Paginated claims response."""
     
     claims: list[ClaimWithVerdictResponse]
@@ -183,7 +184,7 @@ class ClaimsListPaginatedResponse(BaseModel):
 # Gaps List Response (with pagination)
 # ============================================================================
 
-class GapsListPaginatedResponse(BaseModel):
+class GapsListPaginatedResponse(FrozenBase):
     """Paginated gaps response."""
     
     gaps: list[DisclosureGapResponse]
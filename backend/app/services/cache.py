@@ -0,0 +1,185 @@
+"""Two-tier (in-process + Redis) cache for expensive chat/RAG results.
+
+L1 is a per-process TTL cache that serves repeat hits without a network
+round trip; L2 is Redis, shared across workers and restarts. Values are
+JSON-compatible structures serialized with orjson unless a cache supplies
+its own codec. Redis failures are logged and treated as misses so caching
+never breaks a request.
+"""
+
+import hashlib
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+import orjson
+import redis.asyncio as redis
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: object) -> str:
+    """Build a fixed-length cache key from arbitrary key components."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")  # unit separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class TwoTierCache:
+    """Namespaced cache with an in-process TTL layer in front of Redis."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        namespace: str,
+        ttl: int,
+        l1_maxsize: int = 1024,
+        l1_ttl: int | None = None,
+        dumps: Callable[[Any], bytes] = orjson.dumps,
+        loads: Callable[[bytes], Any] = orjson.loads,
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis_client: Async Redis client used as the shared L2
+            namespace: Prefix for Redis keys (e.g. "chat:response")
+            ttl: Default Redis expiry in seconds
+            l1_maxsize: Maximum entries kept in process
+            l1_ttl: In-process expiry in seconds (defaults to ttl)
+            dumps: Encodes a value for Redis (defaults to orjson)
+            loads: Decodes a value read from Redis (defaults to orjson)
+        """
+        self.redis = redis_client
+        self.namespace = namespace
+        self.ttl = ttl
+        self._dumps = dumps
+        self._loads = loads
+        self._l1: TTLCache = TTLCache(maxsize=l1_maxsize, ttl=l1_ttl or ttl)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None on a miss."""
+        value = self._l1.get(key)
+        if value is not None:
+            return value
+
+        try:
+            raw = await self.redis.get(self._redis_key(key))
+        except RedisError as e:
+            logger.warning("Cache read failed for %s: %s", self.namespace, e)
+            return None
+        if raw is None:
+            return None
+
+        value = self._loads(raw)
+        self._l1[key] = value
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Return cached values for keys in order, None for each miss.
+
+        L1 misses are fetched from Redis in a single MGET.
+        """
+        values: list[Any | None] = [self._l1.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+
+        try:
+            raws = await self.redis.mget([self._redis_key(keys[i]) for i in missing])
+        except RedisError as e:
+            logger.warning("Cache read failed for %s: %s", self.namespace, e)
+            return values
+
+        for i, raw in zip(missing, raws):
+            if raw is not None:
+                value = self._loads(raw)
+                self._l1[keys[i]] = value
+                values[i] = value
+        return values
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store value under key in both tiers."""
+        self._l1[key] = value
+        try:
+            await self.redis.set(
+                self._redis_key(key), self._dumps(value), ex=ttl or self.ttl
+            )
+        except RedisError as e:
+            logger.warning("Cache write failed for %s: %s", self.namespace, e)
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """Store several values in both tiers with one pipelined round trip."""
+        if not items:
+            return
+        self._l1.update(items)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._redis_key(key), self._dumps(value), ex=ttl or self.ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Cache write failed for %s: %s", self.namespace, e)
+
+    def clear_local(self) -> None:
+        """Drop the in-process tier (Redis entries expire on their own)."""
+        self._l1.clear()
+
+
+def _dump_vector(vector: list[float] | np.ndarray) -> bytes:
+    """Pack an embedding as raw float32 bytes (a quarter of its JSON size)."""
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _load_vector(raw: bytes) -> np.ndarray:
+    """Unpack an embedding stored by _dump_vector (a read-only float32 view)."""
+    return np.frombuffer(raw, dtype=np.float32)
+
+
+# Shared Redis client for caches; connections are opened lazily on first use
+cache_redis = redis.from_url(settings.REDIS_URL, decode_responses=False)
+
+# Final chat answers (content + citations), keyed by question, history window
+# and report version
+chat_response_cache = TwoTierCache(cache_redis, "chat:response", ttl=4 * 3600)
+
+# Multi-source retrieval results, keyed by question and report version only,
+# so follow-ups with different history still reuse them
+chat_retrieval_cache = TwoTierCache(cache_redis, "chat:rag", ttl=600)
+
+# Individual RAG searches, keyed by question, source types, top_k and (for
+# report content) report; IFRS/SASB results are shared across reports
+chat_search_cache = TwoTierCache(cache_redis, "chat:search", ttl=600)
+
+# Normalized query embeddings, keyed by embedding model and exact query text
+query_embedding_cache = TwoTierCache(
+    cache_redis, "rag:embedding", ttl=24 * 3600, l1_maxsize=256
+)
+
+# Raw text embeddings as returned by the API, keyed by embedding model and
+# (truncated) input text, so re-ingesting unchanged content skips the API.
+# Vectors are large, so few are kept in process; Redis holds the rest.
+text_embedding_cache = TwoTierCache(
+    cache_redis,
+    "embedding:text",
+    ttl=30 * 24 * 3600,
+    l1_maxsize=256,
+    dumps=_dump_vector,
+    loads=_load_vector,
+)
+
+# Nominatim geocoding results, keyed by normalized location name and country.
+# Misses cost a rate-limited (1 req/s) API call, so results are kept for 30
+# days; "not found" results are stored with a shorter TTL by the service.
+geocoding_cache = TwoTierCache(
+    cache_redis, "geocode", ttl=30 * 24 * 3600, l1_maxsize=10_000, l1_ttl=24 * 3600
+)
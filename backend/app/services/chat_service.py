@@ -7,16 +7,32 @@ LLM generation via OpenRouter streaming, and conversation persistence.
 """
 
 import asyncio
+import io
 import logging
 import re
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from cachetools import TTLCache
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    Text,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import JSONB, REAL, TSQUERY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.database import async_session_maker
 from app.models.chat import ChatMessage, Conversation
 from app.models.claim import Claim
 from app.models.finding import Finding
@@ -24,11 +40,19 @@ from app.models.report import Report
 from app.models.verdict import Verdict
 from app.schemas.chat import (
     Citation,
+    CitationListAdapter,
     CitationNavigationTarget,
     CitationSourceType,
 )
+from app.services.cache import (
+    TwoTierCache,
+    chat_response_cache,
+    chat_retrieval_cache,
+    chat_search_cache,
+    make_cache_key,
+)
 from app.services.openrouter_client import Models, OpenRouterClient
-from app.services.rag_service import RAGResult, RAGService
+from app.services.rag_service import RAGResult, RAGResultListAdapter, RAGService
 
 logger = logging.getLogger(__name__)
 
@@ -71,10 +95,250 @@ When referencing sources, use inline citations:
 The context sources are numbered [1], [2], [3], etc. Use these numbers to cite specific sources."""
 
 
+# Frontend view opened by a citation, by retrieval source type
+_NAVIGATION_TARGETS = {
+    "report": "pdf_viewer",
+    "claim": "pdf_viewer",
+    "finding": "finding_panel",
+    "ifrs": "ifrs_viewer",
+    "ifrs_s1": "ifrs_viewer",
+    "ifrs_s2": "ifrs_viewer",
+    "sasb": "ifrs_viewer",
+    "verdict": "source_of_truth",
+    "gap": "disclosure_gaps",
+}
+
+_IFRS_SOURCE_TYPES = frozenset({"ifrs", "ifrs_s1", "ifrs_s2"})
+
+
+# (report_id, report_version, top_k, normalized query) of database retrievals
+# that matched nothing; the report version changes whenever rows are added
+_EMPTY_DATABASE_RESULTS: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+
 class ChatServiceError(Exception):
     """Raised when chat service operations fail."""
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_CITATION_RE = re.compile(r"\[(\d+)\]")
+_SMALL_TALK_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|thx|ok|okay|great|cool|bye|goodbye)"
+    r"(\s+(there|so much|a lot))?[\s!.?]*$",
+    re.IGNORECASE,
+)
+# Operators understood by websearch_to_tsquery: quotes, "or", leading "-"
+_SEARCH_SYNTAX_RE = re.compile(r'"|\bor\b|(?:^|\s)-\w', re.IGNORECASE)
+
+
+async def _logged_failure(label: str, coro: Awaitable[Any]) -> Any | None:
+    """Await a retrieval, logging and swallowing its failure as None."""
+    try:
+        return await coro
+    except Exception as e:
+        logger.warning("Error retrieving %s: %s", label, e)
+        return None
+
+
+class _CitationScanner:
+    """Incrementally find [N] citation markers in a token stream.
+
+    Keeps a short unmatched tail between tokens so markers split across
+    tokens (e.g. "[1" + "2]") are still found, without rescanning the
+    accumulated response.
+    """
+
+    # Longest tail kept between tokens; covers a split "[1234567"
+    MAX_CARRY = 8
+
+    def __init__(self) -> None:
+        self.used: set[int] = set()
+        self._carry = ""
+
+    def feed(self, token: str) -> list[int]:
+        """Consume a token and return citation numbers seen for the first time."""
+        buf = self._carry + token
+        new: list[int] = []
+        end = 0
+        for match in _CITATION_RE.finditer(buf):
+            num = int(match.group(1))
+            if num not in self.used:
+                self.used.add(num)
+                new.append(num)
+            end = match.end()
+        self._carry = buf[end:][-self.MAX_CARRY :]
+        return new
+
+
+@lru_cache(maxsize=64)
+def _title(label: str) -> str:
+    """Title-case an agent or verdict label (a small, closed set of values)."""
+    return label.title()
+
+
+def is_small_talk(message: str) -> bool:
+    """Whether a chat message is a greeting or acknowledgement, not a question."""
+    return _SMALL_TALK_RE.match(message) is not None
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a user question for cache keys (case and whitespace)."""
+    return _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+
+def _fts_match(
+    search_vec: ColumnElement, query: str
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """Build a full-text predicate and ts_rank_cd score for a search_vec column.
+
+    Tokenization, stemming and stopword removal happen in PostgreSQL.
+    Queries using web-search syntax ("quoted phrases", or, -exclusions) go
+    through websearch_to_tsquery as written; plain questions match any of
+    their terms, with documents matching more terms, closer together,
+    ranking higher. An empty query matches everything with a zero score.
+    """
+    if not query.strip():
+        return true(), literal(0.0, REAL)
+    if _SEARCH_SYNTAX_RE.search(query):
+        tsquery = func.websearch_to_tsquery("english", query)
+    else:
+        # A natural-language question rarely contains every term of a
+        # matching row, so OR the terms instead of ANDing them
+        tsquery = cast(
+            func.replace(
+                cast(func.websearch_to_tsquery("english", query), Text), "&", "|"
+            ),
+            TSQUERY,
+        )
+    return search_vec.op("@@")(tsquery), func.ts_rank_cd(search_vec, tsquery)
+
+
+def _ranked_rows(
+    src: str,
+    model: Any,
+    meta: ColumnElement,
+    query: str,
+    top_k: int,
+    *criteria: ColumnElement[bool],
+) -> Select:
+    """Build one UNION ALL branch: (src, id, meta, score), best-ranked first."""
+    match, rank = _fts_match(model.search_vec, query)
+    return (
+        select(
+            literal(src).label("src"),
+            model.id.label("id"),
+            meta.label("meta"),
+            rank.label("score"),
+        )
+        .where(*criteria, match)
+        .order_by(rank.desc())
+        .limit(top_k)
+    )
+
+
+def _finding_rows(query: str, report_id: UUID, top_k: int) -> Select:
+    """Agent findings relevant to the query."""
+    meta = func.jsonb_build_object(
+        "summary", Finding.summary,
+        "agent_name", Finding.agent_name,
+        "claim_id", Finding.claim_id,
+        "evidence_type", Finding.evidence_type,
+        "supports_claim", Finding.supports_claim,
+        "confidence", Finding.confidence,
+        type_=JSONB,
+    )  # fmt: skip
+    return _ranked_rows(
+        "finding", Finding, meta, query, top_k, Finding.report_id == report_id
+    )
+
+
+def _verdict_rows(query: str, report_id: UUID, top_k: int) -> Select:
+    """Judge verdicts relevant to the query."""
+    meta = func.jsonb_build_object(
+        "reasoning", Verdict.reasoning,
+        "verdict", Verdict.verdict,
+        "claim_id", Verdict.claim_id,
+        "iteration_count", Verdict.iteration_count,
+        type_=JSONB,
+    )  # fmt: skip
+    return _ranked_rows(
+        "verdict", Verdict, meta, query, top_k, Verdict.report_id == report_id
+    )
+
+
+def _gap_rows(query: str, report_id: UUID, top_k: int) -> Select:
+    """Disclosure gaps (findings with evidence_type='disclosure_gap')."""
+    meta = func.jsonb_build_object(
+        "summary", Finding.summary,
+        "agent_name", Finding.agent_name,
+        "details", Finding.details,
+        type_=JSONB,
+    )  # fmt: skip
+    return _ranked_rows(
+        "gap",
+        Finding,
+        meta,
+        query,
+        top_k,
+        Finding.report_id == report_id,
+        Finding.evidence_type == "disclosure_gap",
+    )
+
+
+def _claim_rows(query: str, report_id: UUID, top_k: int) -> Select:
+    """Claims relevant to the query."""
+    meta = func.jsonb_build_object(
+        "claim_text", Claim.claim_text,
+        "claim_type", Claim.claim_type,
+        "source_page", Claim.source_page,
+        "priority", Claim.priority,
+        "ifrs_paragraphs", Claim.ifrs_paragraphs,
+        type_=JSONB,
+    )  # fmt: skip
+    return _ranked_rows(
+        "claim", Claim, meta, query, top_k, Claim.report_id == report_id
+    )
+
+
+def _database_result(
+    src: str, row_id: str, meta: dict[str, Any], score: float, report_id: str
+) -> RAGResult:
+    """Convert a unified retrieval row into a RAGResult for its source type."""
+    if src == "finding":
+        summary = meta.pop("summary")
+        chunk_text = f"[{_title(meta['agent_name'])} Agent] {summary}"
+    elif src == "verdict":
+        reasoning = meta.pop("reasoning")
+        chunk_text = f"[Judge Verdict: {_title(meta['verdict'])}] {reasoning}"
+    elif src == "gap":
+        chunk_text = f"[Disclosure Gap] {meta.pop('summary')}"
+    else:
+        claim_text = meta.pop("claim_text")
+        chunk_text = f"[Claim | Page {meta['source_page']}] {claim_text}"
+
+    return RAGResult(
+        chunk_id=row_id,
+        chunk_text=chunk_text,
+        metadata=meta,
+        source_type=src,
+        report_id=report_id,
+        score=score,
+        search_method="keyword",
+    )
+
+
+def report_cache_version(report: Report) -> str:
+    """Return a token that changes whenever a report's chat context changes.
+
+    Re-ingestion and pipeline progress bump updated_at or the trigger-
+    maintained counters, so cached answers for older states are never hit.
+    """
+    return (
+        f"{report.updated_at.isoformat()}:{report.claims_count}:"
+        f"{report.findings_count}:{report.verdicts_count}"
+    )
+
+
 class ChatService:
     """Service for chatbot Q&A with RAG retrieval and citation generation."""
 
@@ -84,11 +348,20 @@ class ChatService:
     # Maximum conversation history messages to include
     MAX_HISTORY_MESSAGES = 10
 
+    # Streamed tokens are coalesced into one event per this many tokens...
+    TOKEN_BATCH_SIZE = 8
+    # ...or per this many seconds, whichever comes first
+    TOKEN_BATCH_SECONDS = 0.02
+
     def __init__(
         self,
         db: AsyncSession,
         rag_service: RAGService,
         openrouter_client: OpenRouterClient,
+        response_cache: TwoTierCache | None = chat_response_cache,
+        retrieval_cache: TwoTierCache | None = chat_retrieval_cache,
+        search_cache: TwoTierCache | None = chat_search_cache,
+        session_factory: async_sessionmaker[AsyncSession] | None = async_session_maker,
     ):
         """Initialize the chat service.
 
@@ -96,16 +369,25 @@ class ChatService:
             db: Async SQLAlchemy session
             rag_service: RAG service for retrieval
             openrouter_client: OpenRouter client for LLM calls
+            response_cache: Cache for final answers (None disables)
+            retrieval_cache: Cache for multi-source retrieval (None disables)
+            search_cache: Cache for individual RAG searches (None disables)
+            session_factory: Sessions for concurrent retrieval queries (None
+                runs them on db)
         """
         self.db = db
         self.rag_service = rag_service
         self.openrouter_client = openrouter_client
+        self.response_cache = response_cache
+        self.retrieval_cache = retrieval_cache
+        self.search_cache = search_cache
+        self.session_factory = session_factory
 
     # -------------------------------------------------------------------------
     # Conversation Management
     # -------------------------------------------------------------------------
 
-    async def get_or_create_conversation(self, report_id: str) -> Conversation:
+    async def get_or_create_conversation(self, report_id: UUID) -> Conversation:
         """Get or create a conversation for the given report.
 
         Args:
@@ -114,16 +396,12 @@ class ChatService:
         Returns:
             Conversation model instance
         """
-        stmt = (
-            select(Conversation)
-            .where(Conversation.report_id == UUID(report_id))
-            .options(selectinload(Conversation.messages))
-        )
+        stmt = select(Conversation).where(Conversation.report_id == report_id)
         result = await self.db.execute(stmt)
         conversation = result.scalar_one_or_none()
 
         if not conversation:
-            conversation = Conversation(report_id=UUID(report_id))
+            conversation = Conversation(report_id=report_id)
             self.db.add(conversation)
             await self.db.flush()
             logger.info("Created new conversation for report %s", report_id)
@@ -150,12 +428,39 @@ class ChatService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_recent_messages(
+        self,
+        conversation_id: UUID,
+        limit: int = MAX_HISTORY_MESSAGES,
+    ) -> list[ChatMessage]:
+        """Get the most recent messages in a conversation.
+
+        Only the tail of the conversation is sent to the LLM, so this
+        avoids loading the full history of long conversations.
+
+        Args:
+            conversation_id: The conversation's UUID
+            limit: Maximum number of messages to return
+
+        Returns:
+            Up to limit ChatMessage models ordered by created_at
+        """
+        stmt = (
+            select(ChatMessage)
+            .where(ChatMessage.conversation_id == conversation_id)
+            .order_by(ChatMessage.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(reversed(result.scalars().all()))
+
     async def persist_message(
         self,
         conversation_id: UUID,
         role: str,
         content: str,
         citations: list[Citation] | None = None,
+        citations_dumped: list[dict[str, Any]] | None = None,
     ) -> ChatMessage:
         """Persist a chat message to the database.
 
@@ -164,15 +469,19 @@ class ChatService:
             role: "user" or "assistant"
             content: Message text
             citations: List of citations (for assistant messages)
+            citations_dumped: Citations already dumped with mode="json", as
+                streamed by generate_response_stream; preferred over citations
 
         Returns:
             Created ChatMessage model
         """
+        if citations_dumped is None and citations:
+            citations_dumped = CitationListAdapter.dump_python(citations, mode="json")
         message = ChatMessage(
             conversation_id=conversation_id,
             role=role,
             content=content,
-            citations=[c.model_dump() for c in citations] if citations else None,
+            citations=citations_dumped or None,
         )
         self.db.add(message)
         await self.db.flush()
@@ -187,6 +496,7 @@ class ChatService:
         query: str,
         report_id: str,
         top_k_per_source: int = DEFAULT_TOP_K_PER_SOURCE,
+        report_version: str = "",
     ) -> dict[str, list[RAGResult]]:
         """Retrieve from all source types in parallel.
 
@@ -194,228 +504,186 @@ class ChatService:
             query: User's question
             report_id: Report to search within
             top_k_per_source: Max results per source type
+            report_version: report_cache_version() of the report, for caching
 
         Returns:
             Dict mapping source_type to list of RAGResult objects.
         """
-        # Parallel retrieval from RAG and database
-        results = await asyncio.gather(
-            # Report content
-            self.rag_service.search(
-                query=query,
-                top_k=top_k_per_source,
-                source_types=["report"],
-                report_id=report_id,
-            ),
-            # IFRS standards
-            self.rag_service.search(
-                query=query,
-                top_k=top_k_per_source,
-                source_types=["ifrs_s1", "ifrs_s2"],
-            ),
-            # SASB standards
-            self.rag_service.search(
-                query=query,
-                top_k=top_k_per_source,
-                source_types=["sasb"],
-            ),
-            # Agent findings (database query)
-            self._retrieve_findings(query, report_id, top_k_per_source),
-            # Judge verdicts (database query)
-            self._retrieve_verdicts(query, report_id, top_k_per_source),
-            # Disclosure gaps (database query)
-            self._retrieve_gaps(query, report_id, top_k_per_source),
-            # Claims (database query)
-            self._retrieve_claims(query, report_id, top_k_per_source),
-            return_exceptions=True,
+        cache_key = make_cache_key(
+            report_id, report_version, top_k_per_source, normalize_query(query)
         )
+        if self.retrieval_cache is not None:
+            cached = await self.retrieval_cache.get(cache_key)
+            if cached is not None:
+                return {
+                    key: RAGResultListAdapter.validate_python(items)
+                    for key, items in cached.items()
+                }
+
+        # Parallel retrieval from RAG and database. Each retrieval runs on its
+        # own pooled session so the queries overlap instead of queueing on the
+        # request session; a failed source is logged and left empty.
+        async with asyncio.TaskGroup() as tg:
+            report_task = tg.create_task(
+                _logged_failure(
+                    "report",
+                    self._cached_search(
+                        query,
+                        top_k_per_source,
+                        ["report"],
+                        report_id=report_id,
+                        report_version=report_version,
+                    ),
+                )
+            )
+            ifrs_task = tg.create_task(
+                _logged_failure(
+                    "ifrs",
+                    self._cached_search(
+                        query, top_k_per_source, ["ifrs_s1", "ifrs_s2"]
+                    ),
+                )
+            )
+            sasb_task = tg.create_task(
+                _logged_failure(
+                    "sasb", self._cached_search(query, top_k_per_source, ["sasb"])
+                )
+            )
+            # Findings, verdicts, gaps and claims (single database query)
+            database_task = tg.create_task(
+                _logged_failure(
+                    "database sources",
+                    self._retrieve_database_sources(
+                        query, UUID(report_id), top_k_per_source, report_version
+                    ),
+                )
+            )
 
-        # Handle any exceptions
         processed_results: dict[str, list[RAGResult]] = {
-            "report": [],
-            "ifrs": [],
-            "sasb": [],
+            "report": report_task.result() or [],
+            "ifrs": ifrs_task.result() or [],
+            "sasb": sasb_task.result() or [],
             "finding": [],
             "verdict": [],
             "gap": [],
             "claim": [],
         }
-
-        source_keys = ["report", "ifrs", "sasb", "finding", "verdict", "gap", "claim"]
-        for i, key in enumerate(source_keys):
-            if isinstance(results[i], Exception):
-                logger.warning("Error retrieving %s: %s", key, results[i])
-            else:
-                processed_results[key] = results[i]
-
-        return processed_results
-
-    async def _retrieve_findings(
-        self,
-        query: str,
-        report_id: str,
-        top_k: int,
-    ) -> list[RAGResult]:
-        """Retrieve agent findings relevant to the query."""
-        # Simple keyword matching on summary and details
-        keywords = query.lower().split()
-        keyword_filters = [
-            or_(
-                Finding.summary.ilike(f"%{kw}%"),
-                Finding.agent_name.ilike(f"%{kw}%"),
-            )
-            for kw in keywords[:5]  # Limit keywords
-        ]
-
-        stmt = (
-            select(Finding)
-            .where(Finding.report_id == UUID(report_id))
-            .where(or_(*keyword_filters) if keyword_filters else True)
-            .limit(top_k)
+        database_results = database_task.result()
+        if database_results is not None:
+            processed_results.update(database_results)
+        failed = None in (
+            report_task.result(),
+            ifrs_task.result(),
+            sasb_task.result(),
+            database_results,
         )
 
-        result = await self.db.execute(stmt)
-        findings = result.scalars().all()
-
-        return [
-            RAGResult(
-                chunk_id=str(finding.id),
-                chunk_text=f"[{finding.agent_name.title()} Agent] {finding.summary}",
-                metadata={
-                    "agent_name": finding.agent_name,
-                    "claim_id": str(finding.claim_id) if finding.claim_id else None,
-                    "evidence_type": finding.evidence_type,
-                    "supports_claim": finding.supports_claim,
-                    "confidence": finding.confidence,
+        # Don't pin a partial result set in the cache after a source failed
+        if self.retrieval_cache is not None and not failed:
+            await self.retrieval_cache.set(
+                cache_key,
+                {
+                    key: RAGResultListAdapter.dump_python(items)
+                    for key, items in processed_results.items()
                 },
-                source_type="finding",
-                report_id=report_id,
-                score=0.8,  # Placeholder score for keyword matches
-                search_method="keyword",
             )
-            for finding in findings
-        ]
 
-    async def _retrieve_verdicts(
-        self,
-        query: str,
-        report_id: str,
-        top_k: int,
-    ) -> list[RAGResult]:
-        """Retrieve Judge verdicts relevant to the query."""
-        keywords = query.lower().split()
-        keyword_filters = [
-            Verdict.reasoning.ilike(f"%{kw}%")
-            for kw in keywords[:5]
-        ]
+        return processed_results
 
-        stmt = (
-            select(Verdict)
-            .where(Verdict.report_id == UUID(report_id))
-            .where(or_(*keyword_filters) if keyword_filters else True)
-            .limit(top_k)
-        )
+    @asynccontextmanager
+    async def _retrieval_session(self) -> AsyncIterator[AsyncSession]:
+        """Open a session for one concurrent retrieval query.
 
-        result = await self.db.execute(stmt)
-        verdicts = result.scalars().all()
-
-        return [
-            RAGResult(
-                chunk_id=str(verdict.id),
-                chunk_text=f"[Judge Verdict: {verdict.verdict.title()}] {verdict.reasoning}",
-                metadata={
-                    "verdict": verdict.verdict,
-                    "claim_id": str(verdict.claim_id),
-                    "iteration_count": verdict.iteration_count,
-                },
-                source_type="verdict",
-                report_id=report_id,
-                score=0.8,
-                search_method="keyword",
-            )
-            for verdict in verdicts
-        ]
+        Falls back to the request session when no session factory is set.
+        """
+        if self.session_factory is None:
+            yield self.db
+            return
+        async with self.session_factory() as session:
+            yield session
 
-    async def _retrieve_gaps(
+    async def _cached_search(
         self,
         query: str,
-        report_id: str,
         top_k: int,
+        source_types: list[str],
+        report_id: str | None = None,
+        report_version: str = "",
     ) -> list[RAGResult]:
-        """Retrieve disclosure gaps (findings with evidence_type='disclosure_gap')."""
-        keywords = query.lower().split()
-        keyword_filters = [
-            Finding.summary.ilike(f"%{kw}%")
-            for kw in keywords[:5]
-        ]
+        """Run a RAG search, reusing results for repeated questions.
 
-        stmt = (
-            select(Finding)
-            .where(Finding.report_id == UUID(report_id))
-            .where(Finding.evidence_type == "disclosure_gap")
-            .where(or_(*keyword_filters) if keyword_filters else True)
-            .limit(top_k)
+        Standards searches are not report-specific, so their entries are
+        shared by every report's chat.
+        """
+        cache_key = make_cache_key(
+            normalize_query(query),
+            top_k,
+            sorted(source_types),
+            report_id or "",
+            report_version if report_id else "",
         )
+        if self.search_cache is not None:
+            cached = await self.search_cache.get(cache_key)
+            if cached is not None:
+                return RAGResultListAdapter.validate_python(cached)
 
-        result = await self.db.execute(stmt)
-        gaps = result.scalars().all()
-
-        return [
-            RAGResult(
-                chunk_id=str(gap.id),
-                chunk_text=f"[Disclosure Gap] {gap.summary}",
-                metadata={
-                    "agent_name": gap.agent_name,
-                    "details": gap.details,
-                },
-                source_type="gap",
+        async with self._retrieval_session() as session:
+            results = await self.rag_service.with_session(session).search(
+                query=query,
+                top_k=top_k,
+                source_types=source_types,
                 report_id=report_id,
-                score=0.8,
-                search_method="keyword",
             )
-            for gap in gaps
-        ]
+        if self.search_cache is not None:
+            await self.search_cache.set(
+                cache_key, RAGResultListAdapter.dump_python(results)
+            )
+        return results
 
-    async def _retrieve_claims(
+    async def _retrieve_database_sources(
         self,
         query: str,
-        report_id: str,
+        report_id: UUID,
         top_k: int,
-    ) -> list[RAGResult]:
-        """Retrieve claims relevant to the query."""
-        keywords = query.lower().split()
-        keyword_filters = [
-            Claim.claim_text.ilike(f"%{kw}%")
-            for kw in keywords[:5]
-        ]
-
-        stmt = (
-            select(Claim)
-            .where(Claim.report_id == UUID(report_id))
-            .where(or_(*keyword_filters) if keyword_filters else True)
-            .limit(top_k)
-        )
+        report_version: str = "",
+    ) -> dict[str, list[RAGResult]]:
+        """Retrieve findings, verdicts, gaps and claims in one round trip.
 
-        result = await self.db.execute(stmt)
-        claims = result.scalars().all()
-
-        return [
-            RAGResult(
-                chunk_id=str(claim.id),
-                chunk_text=f"[Claim | Page {claim.source_page}] {claim.claim_text}",
-                metadata={
-                    "claim_type": claim.claim_type,
-                    "source_page": claim.source_page,
-                    "priority": claim.priority,
-                    "ifrs_paragraphs": claim.ifrs_paragraphs,
-                },
-                source_type="claim",
-                report_id=report_id,
-                score=0.8,
-                search_method="keyword",
+        Each source is a ranked, per-source-limited branch of a single
+        UNION ALL, so the four retrievers cost one query on the session
+        instead of four serialized ones. Queries that matched nothing are
+        remembered briefly and skip the database on repeat.
+        """
+        grouped: dict[str, list[RAGResult]] = {
+            "finding": [],
+            "verdict": [],
+            "gap": [],
+            "claim": [],
+        }
+        negative_key = (report_id, report_version, top_k, normalize_query(query))
+        if negative_key in _EMPTY_DATABASE_RESULTS:
+            return grouped
+
+        stmt = union_all(
+            _finding_rows(query, report_id, top_k),
+            _verdict_rows(query, report_id, top_k),
+            _gap_rows(query, report_id, top_k),
+            _claim_rows(query, report_id, top_k),
+        ).order_by(literal_column("src"), literal_column("score").desc())
+
+        async with self._retrieval_session() as session:
+            rows = (await session.execute(stmt)).all()
+
+        if not rows:
+            _EMPTY_DATABASE_RESULTS[negative_key] = True
+            return grouped
+
+        report_key = str(report_id)
+        for src, row_id, meta, score in rows:
+            grouped[src].append(
+                _database_result(src, str(row_id), meta, float(score), report_key)
             )
-            for claim in claims
-        ]
+        return grouped
 
     # -------------------------------------------------------------------------
     # Context Assembly
@@ -435,7 +703,8 @@ class ChatService:
             - context_text: Formatted context string with [1], [2] markers
             - citation_map: Dict mapping citation number to source metadata
         """
-        context_parts: list[str] = []
+        buf = io.StringIO()
+        buf.write("## Context Sources\n")
         citation_map: dict[int, dict[str, Any]] = {}
         citation_num = 1
 
@@ -455,10 +724,14 @@ class ChatService:
             if not results:
                 continue
 
-            section_lines = [f"\n### {section_title}"]
+            # Sections are separated by a blank line
+            if citation_num > 1:
+                buf.write("\n")
+            buf.write(f"\n### {section_title}")
             for result in results:
                 # Format the citation entry
-                section_lines.append(f"[{citation_num}] {result.chunk_text}")
+                buf.write(f"\n[{citation_num}] ")
+                buf.write(result.chunk_text)
 
                 # Build citation metadata
                 nav_target = self._get_navigation_target(result.source_type)
@@ -474,25 +747,11 @@ class ChatService:
 
                 citation_num += 1
 
-            context_parts.append("\n".join(section_lines))
-
-        context_text = "## Context Sources\n" + "\n".join(context_parts)
-        return context_text, citation_map
+        return buf.getvalue(), citation_map
 
     def _get_navigation_target(self, source_type: str) -> str:
         """Map source type to navigation target."""
-        mapping = {
-            "report": "pdf_viewer",
-            "claim": "pdf_viewer",
-            "finding": "finding_panel",
-            "ifrs": "ifrs_viewer",
-            "ifrs_s1": "ifrs_viewer",
-            "ifrs_s2": "ifrs_viewer",
-            "sasb": "ifrs_viewer",
-            "verdict": "source_of_truth",
-            "gap": "disclosure_gaps",
-        }
-        return mapping.get(source_type, "source_of_truth")
+        return _NAVIGATION_TARGETS.get(source_type, "source_of_truth")
 
     def _get_display_text(self, result: RAGResult) -> str:
         """Generate display text for a citation."""
@@ -501,13 +760,13 @@ class ChatService:
             return f"Claim (Page {page})"
         elif result.source_type == "finding":
             agent = result.metadata.get("agent_name", "Agent")
-            return f"{agent.title()} Agent Finding"
+            return f"{_title(agent)} Agent Finding"
         elif result.source_type == "verdict":
             verdict = result.metadata.get("verdict", "Verdict")
-            return f"Judge Verdict: {verdict.title()}"
+            return f"Judge Verdict: {_title(verdict)}"
         elif result.source_type == "gap":
             return "Disclosure Gap"
-        elif result.source_type in ("ifrs", "ifrs_s1", "ifrs_s2"):
+        elif result.source_type in _IFRS_SOURCE_TYPES:
             paragraph = result.metadata.get("paragraph_id", "IFRS")
             return f"IFRS {paragraph}"
         elif result.source_type == "sasb":
@@ -531,7 +790,8 @@ class ChatService:
 
         Args:
             context_text: Assembled context with citations
-            conversation_history: Previous user/assistant messages
+            conversation_history: Previous user/assistant messages, already
+                flattened to {"role", "content"} dicts; sent as-is
             user_message: Current user question
 
         Returns:
@@ -544,9 +804,7 @@ class ChatService:
         messages.append({"role": "system", "content": system_content})
 
         # Add recent conversation history (up to MAX_HISTORY_MESSAGES)
-        recent_history = conversation_history[-self.MAX_HISTORY_MESSAGES :]
-        for msg in recent_history:
-            messages.append({"role": msg["role"], "content": msg["content"]})
+        messages.extend(conversation_history[-self.MAX_HISTORY_MESSAGES :])
 
         # Add current user message
         messages.append({"role": "user", "content": user_message})
@@ -559,42 +817,76 @@ class ChatService:
         user_message: str,
         conversation_history: list[dict[str, str]],
         top_k_per_source: int = DEFAULT_TOP_K_PER_SOURCE,
+        report_version: str = "",
     ) -> AsyncIterator[dict[str, Any]]:
         """Generate chatbot response with streaming.
 
+        Answers are cached per (report version, question, history window);
+        a hit replays the stored answer through the same event sequence.
+
         Args:
             report_id: The report being discussed
             user_message: User's question
-            conversation_history: Previous messages
+            conversation_history: Previous messages as {"role", "content"} dicts
             top_k_per_source: Max RAG results per source type
+            report_version: report_cache_version() of the report, for caching
 
         Yields:
             Dicts with 'type' and 'data' for SSE streaming:
             - {"type": "token", "data": "word"}
+            - {"type": "citation_ref", "data": Citation} (first use of each source)
             - {"type": "citations", "data": [Citation, ...]}
             - {"type": "done", "data": {"message_id": "...", "full_content": "..."}}
             - {"type": "error", "data": "error message"}
         """
         try:
-            # 1. RAG retrieval
-            retrieval_results = await self.retrieve_multi_source(
-                query=user_message,
-                report_id=report_id,
-                top_k_per_source=top_k_per_source,
+            recent_history = conversation_history[-self.MAX_HISTORY_MESSAGES :]
+            cache_key = make_cache_key(
+                report_id,
+                report_version,
+                top_k_per_source,
+                normalize_query(user_message),
+                [(msg["role"], msg["content"]) for msg in recent_history],
             )
-
-            # 2. Context assembly
-            context_text, citation_map = self.assemble_context(retrieval_results)
+            if self.response_cache is not None:
+                cached = await self.response_cache.get(cache_key)
+                if cached is not None:
+                    for chunk in cached["full_content"].splitlines(keepends=True):
+                        yield {"type": "token", "data": chunk}
+                    if cached["citations"]:
+                        yield {"type": "citations", "data": cached["citations"]}
+                    yield {"type": "done", "data": cached}
+                    return
+
+            # 1-2. RAG retrieval and context assembly; greetings and
+            # acknowledgements have nothing to retrieve, so they get no context
+            if is_small_talk(user_message):
+                context_text, citation_map = "", {}
+            else:
+                retrieval_results = await self.retrieve_multi_source(
+                    query=user_message,
+                    report_id=report_id,
+                    top_k_per_source=top_k_per_source,
+                    report_version=report_version,
+                )
+                context_text, citation_map = self.assemble_context(retrieval_results)
 
             # 3. Build messages
             messages = self.build_messages(
                 context_text=context_text,
-                conversation_history=conversation_history,
+                conversation_history=recent_history,
                 user_message=user_message,
             )
 
-            # 4. Stream LLM response
+            # 4. Stream LLM response in small batches of tokens, resolving
+            # citation markers as they arrive
             full_content = ""
+            scanner = _CitationScanner()
+            # Each citation is dumped once and reused for every event
+            cited: dict[int, dict[str, Any]] = {}
+            loop = asyncio.get_running_loop()
+            pending: list[str] = []
+            last_flush = loop.time()
             async for token in self.openrouter_client.stream_chat_completion(
                 model=Models.GEMINI_FLASH,
                 messages=messages,
@@ -602,67 +894,53 @@ class ChatService:
                 max_tokens=2048,
             ):
                 full_content += token
-                yield {"type": "token", "data": token}
-
-            # 5. Extract citations from response
-            citations = self._extract_citations(full_content, citation_map)
+                pending.append(token)
+                refs = [
+                    num for num in scanner.feed(token) if num in citation_map
+                ]
+                # Flush before a citation_ref so its marker is already shown
+                if (
+                    refs
+                    or len(pending) >= self.TOKEN_BATCH_SIZE
+                    or loop.time() - last_flush >= self.TOKEN_BATCH_SECONDS
+                ):
+                    yield {"type": "token", "data": "".join(pending)}
+                    pending.clear()
+                    last_flush = loop.time()
+                for num in refs:
+                    citation = self._build_citation(num, citation_map[num])
+                    cited[num] = citation.model_dump(mode="json")
+                    yield {"type": "citation_ref", "data": cited[num]}
+            if pending:
+                yield {"type": "token", "data": "".join(pending)}
+
+            # 5. Citations actually used in the response, in order of first use
+            citations = list(cited.values())
             if citations:
-                yield {"type": "citations", "data": [c.model_dump() for c in citations]}
+                yield {"type": "citations", "data": citations}
 
             # 6. Done event (message will be persisted by the route handler)
-            yield {
-                "type": "done",
-                "data": {
-                    "full_content": full_content,
-                    "citations": [c.model_dump() for c in citations],
-                },
-            }
+            done = {"full_content": full_content, "citations": citations}
+            if self.response_cache is not None and full_content:
+                await self.response_cache.set(cache_key, done)
+            yield {"type": "done", "data": done}
 
         except Exception as e:
             logger.error("Chat generation error: %s", e, exc_info=True)
             yield {"type": "error", "data": str(e)}
 
-    def _extract_citations(
-        self,
-        content: str,
-        citation_map: dict[int, dict[str, Any]],
-    ) -> list[Citation]:
-        """Extract citation markers from LLM response and map to sources.
-
-        Args:
-            content: LLM response text
-            citation_map: Map from citation number to source metadata
-
-        Returns:
-            List of Citation objects for citations actually used in the response
-        """
-        # Find all [N] citation markers in the response
-        pattern = r"\[(\d+)\]"
-        matches = re.findall(pattern, content)
-        used_numbers = {int(n) for n in matches}
-
-        citations = []
-        for num in sorted(used_numbers):
-            if num in citation_map:
-                source = citation_map[num]
-                citations.append(
-                    Citation(
-                        citation_number=num,
-                        source_type=CitationSourceType(
-                            self._normalize_source_type(source["source_type"])
-                        ),
-                        source_id=source["source_id"],
-                        navigation_target=CitationNavigationTarget(
-                            source["navigation_target"]
-                        ),
-                        display_text=source["display_text"],
-                    )
-                )
-
-        return citations
+    def _build_citation(self, num: int, source: dict[str, Any]) -> Citation:
+        """Build the Citation for a context source referenced as [num]."""
+        return Citation(
+            citation_number=num,
+            source_type=CitationSourceType(
+                self._normalize_source_type(source["source_type"])
+            ),
+            source_id=source["source_id"],
+            navigation_target=CitationNavigationTarget(source["navigation_target"]),
+            display_text=source["display_text"],
+        )
 
     def _normalize_source_type(self, source_type: str) -> str:
         """Normalize source type to CitationSourceType enum value."""
-        if source_type in ("ifrs", "ifrs_s1", "ifrs_s2"):
-            return "ifrs_paragraph"
-        return source_type
+        return "ifrs_paragraph" if source_type in _IFRS_SOURCE_TYPES else source_type
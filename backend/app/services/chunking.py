@@ -9,7 +9,9 @@ Provides three distinct chunking strategies:
 """
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TypedDict
 
 
@@ -48,6 +50,51 @@ IFRS_PILLAR_SECTIONS = {
     "metrics_targets": ["metrics", "targets", "ghg emissions", "performance"],
 }
 
+# One keyword alternation per pillar, checked in IFRS_PILLAR_SECTIONS order so
+# the first pillar with any matching keyword wins
+_PILLAR_KEYWORD_RES = [
+    (pillar, re.compile("|".join(re.escape(kw) for kw in keywords)))
+    for pillar, keywords in IFRS_PILLAR_SECTIONS.items()
+]
+
+
+# Sentence-ending punctuation followed by space or newline
+_SENTENCE_BOUNDARY_RE = re.compile(r"[.!?]\s+")
+
+# IFRS paragraph IDs like S1.26, S2.14, S1.27(a), S2.14(a)(iv)
+_PARAGRAPH_ID_RE = re.compile(r"\b(S[12]\.\d+(?:\([a-z]+\))*(?:\([ivx]+\))*)")
+
+# SASB metric codes like EM-EP-110a.1 (XX-YY-NNNa.N)
+_METRIC_CODE_RE = re.compile(r"\b([A-Z]{2}-[A-Z]{2}-\d{3}[a-z]?\.\d+)\b")
+
+# Map common industry names (as they appear in SASB filenames) to SASB codes
+_SASB_CODE_MAP = {
+    "oil_and_gas": "EM-EP",
+    "oil_gas": "EM-EP",
+    "banking": "FN-CB",
+    "banking_and_finance": "FN-CB",
+    "utilities": "IF-EU",
+    "electric_utilities": "IF-EU",
+    "transportation": "TR-RO",
+    "materials": "EM-MM",
+    "materials_and_mining": "EM-MM",
+    "mining": "EM-MM",
+    "technology": "TC-SI",
+    "healthcare": "HC-DY",
+    "real_estate": "IF-RE",
+    "agriculture": "FB-AG",
+    "food": "FB-PF",
+}
+
+# One alternation over the industry names; the group name is the matched key
+_SASB_CODE_RE = re.compile(
+    "|".join(f"(?P<{key}>{re.escape(key)})" for key in _SASB_CODE_MAP)
+)
+
+
+# Sub-requirement suffix following a paragraph ID, e.g. the (a)(iv) of S2.14(a)(iv)
+_SUB_REQUIREMENT_SUFFIX_RE = re.compile(r"\([a-z]+\)(?:\([ivx]+\))?")
+
 
 class IFRSChunkMetadata(TypedDict, total=False):
     """Metadata schema for IFRS chunks."""
@@ -94,75 +141,82 @@ def _estimate_tokens(text: str) -> int:
 
 def _split_sentences(text: str) -> list[str]:
     """Split text into sentences at common boundaries."""
-    # Split on sentence-ending punctuation followed by space or newline
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    return [s.strip() for s in sentences if s.strip()]
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+        end = match.end()
+        sentence = text[start:end].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = end
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+def _header_level(stripped: str) -> tuple[int, str]:
+    """Return (level, text) for a markdown header line of level 1-4, else (0, "").
+
+    Callers check for a leading "#" first so ordinary lines skip this.
+    """
+    level = len(stripped) - len(stripped.lstrip("#"))
+    if level <= 4 and level < len(stripped) and stripped[level] == " ":
+        return level, stripped[level + 1 :].strip()
+    return 0, ""
 
 
+# Markdown table: a row with a pipe followed by a "---" separator line
+_TABLE_RE = re.compile(r"\|[^\n]*\n[^\n]*---")
+
+# Report header lines (levels 1-4), matching _header_level on the stripped line
+_REPORT_HEADER_RE = re.compile(r"^[^\S\n]*(#{1,4}) [^\S\n]*(\S[^\n]*)$", re.MULTILINE)
+
+
+@lru_cache(maxsize=512)
 def _identify_pillar(section_text: str) -> str:
-    """Identify the IFRS pillar from section text."""
+    """Identify the IFRS pillar from section text (headings repeat, so cached)."""
     section_lower = section_text.lower()
-    for pillar, keywords in IFRS_PILLAR_SECTIONS.items():
-        if any(kw in section_lower for kw in keywords):
+    for pillar, pattern in _PILLAR_KEYWORD_RES:
+        if pattern.search(section_lower):
             return pillar
     return "governance"  # Default fallback
 
 
 def _extract_paragraph_id(text: str) -> str | None:
     """Extract IFRS paragraph ID from text (e.g., S1.26, S2.14(a)(iv))."""
-    # Match patterns like S1.26, S2.14, S1.27(a), S2.14(a)(iv)
-    pattern = r"\b(S[12]\.\d+(?:\([a-z]+\))*(?:\([ivx]+\))*)"
-    match = re.search(pattern, text)
+    match = _PARAGRAPH_ID_RE.search(text)
     return match.group(1) if match else None
 
 
 def _extract_sub_requirements(text: str, main_id: str) -> list[str]:
     """Extract sub-requirement IDs from paragraph text."""
-    sub_reqs = []
     # Look for patterns like (a), (b), (i), (ii) within the text
-    # that extend the main paragraph ID
-    base_pattern = re.escape(main_id)
-    sub_pattern = rf"{base_pattern}\([a-z]+\)(?:\([ivx]+\))?"
-    matches = re.findall(sub_pattern, text)
-    sub_reqs.extend(matches)
-    return list(set(sub_reqs))
+    # that extend the main paragraph ID: find each occurrence of the ID and
+    # match the suffix right after it, so no per-ID pattern is compiled
+    matches: dict[str, None] = {}
+    id_len = len(main_id)
+    pos = text.find(main_id)
+    while pos != -1:
+        suffix = _SUB_REQUIREMENT_SUFFIX_RE.match(text, pos + id_len)
+        if suffix:
+            matches[main_id + suffix.group()] = None
+        pos = text.find(main_id, pos + 1)
+    return list(matches)
 
 
 def _extract_metric_codes(text: str) -> list[str]:
-    """Extract SASB metric codes from text (e.g., EM-EP-110a.1)."""
-    # SASB codes follow pattern like XX-YY-NNNa.N
-    pattern = r"\b([A-Z]{2}-[A-Z]{2}-\d{3}[a-z]?\.\d+)\b"
-    matches = re.findall(pattern, text)
-    return list(set(matches))
+    """Extract unique SASB metric codes from text (e.g., EM-EP-110a.1) in order."""
+    if "-" not in text:
+        return []
+    return list(dict.fromkeys(_METRIC_CODE_RE.findall(text)))
 
 
 def _extract_standard_code(filename: str) -> str:
     """Extract SASB standard code from filename."""
-    # Map common industry names to SASB codes
-    code_map = {
-        "oil_and_gas": "EM-EP",
-        "oil_gas": "EM-EP",
-        "banking": "FN-CB",
-        "banking_and_finance": "FN-CB",
-        "utilities": "IF-EU",
-        "electric_utilities": "IF-EU",
-        "transportation": "TR-RO",
-        "materials": "EM-MM",
-        "materials_and_mining": "EM-MM",
-        "mining": "EM-MM",
-        "technology": "TC-SI",
-        "healthcare": "HC-DY",
-        "real_estate": "IF-RE",
-        "agriculture": "FB-AG",
-        "food": "FB-PF",
-    }
-
-    # Clean filename and try to match
     clean_name = filename.lower().replace(".md", "").replace("-", "_").replace(" ", "_")
-    for key, code in code_map.items():
-        if key in clean_name:
-            return code
-    return "XX-XX"  # Unknown
+    match = _SASB_CODE_RE.search(clean_name)
+    return _SASB_CODE_MAP[match.lastgroup] if match else "XX-XX"  # Unknown
 
 
 def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
@@ -179,7 +233,7 @@ def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
     """
     chunks: list[ChunkResult] = []
 
-    # Track current section context
+    # Track current section context (a heading stack, updated in place)
     current_sections: list[str] = []
     current_pillar = "governance"
 
@@ -215,6 +269,7 @@ def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
             # Split at sentence boundaries
             sentences = _split_sentences(para_text)
             sub_chunks = _split_long_paragraph(sentences, context_header)
+            sub_requirements = _extract_sub_requirements(para_text, para_id)
             for i, sub_text in enumerate(sub_chunks, 1):
                 part_indicator = f" [Part {i}/{len(sub_chunks)}]" if len(sub_chunks) > 1 else ""
                 metadata: IFRSChunkMetadata = {
@@ -222,10 +277,10 @@ def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
                     "standard": standard,
                     "pillar": current_pillar,
                     "section": current_sections[-1] if current_sections else "",
-                    "sub_requirements": _extract_sub_requirements(para_text, para_id),
+                    "sub_requirements": list(sub_requirements),
                     "s1_counterpart": None,
                 }
-                chunks.append(ChunkResult(text=sub_text, metadata=dict(metadata)))
+                chunks.append(ChunkResult(text=sub_text, metadata=metadata))
         else:
             metadata = {
                 "paragraph_id": para_id,
@@ -246,7 +301,9 @@ def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
         """Split a long paragraph into smaller chunks at sentence boundaries."""
         sub_chunks = []
         current_chunk: list[str] = []
-        current_tokens = _estimate_tokens(context_header + "\n\n")
+        # Header cost is fixed for the whole split
+        header_tokens = _estimate_tokens(context_header + "\n\n")
+        current_tokens = header_tokens
 
         for sentence in sentences:
             sentence_tokens = _estimate_tokens(sentence)
@@ -255,7 +312,7 @@ def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
                 chunk_text = f"{context_header}\n\n" + " ".join(current_chunk)
                 sub_chunks.append(chunk_text)
                 current_chunk = []
-                current_tokens = _estimate_tokens(context_header + "\n\n")
+                current_tokens = header_tokens
 
             current_chunk.append(sentence)
             current_tokens += sentence_tokens
@@ -270,26 +327,26 @@ def chunk_ifrs(content: str, standard: str) -> list[ChunkResult]:
         stripped = line.strip()
 
         # Check for section headers
-        if stripped.startswith("# "):
+        header_level, section_name = (
+            _header_level(stripped) if stripped[:1] == "#" else (0, "")
+        )
+        if header_level == 1:
             flush_paragraph()
-            current_sections = [stripped[2:].strip()]
+            current_sections[:] = [section_name]
             current_pillar = _identify_pillar(stripped)
-        elif stripped.startswith("## "):
+        elif header_level == 2:
             flush_paragraph()
-            section_name = stripped[3:].strip()
-            current_sections = current_sections[:1] + [section_name]
+            current_sections[1:] = [section_name]
             current_pillar = _identify_pillar(section_name)
-        elif stripped.startswith("### "):
+        elif header_level == 3:
             flush_paragraph()
-            section_name = stripped[4:].strip()
-            current_sections = current_sections[:2] + [section_name]
+            current_sections[2:] = [section_name]
             # Check for paragraph ID in heading (e.g., "### S2.14 Strategy and Decision-Making")
             para_id = _extract_paragraph_id(section_name)
             if para_id:
                 current_para_id = para_id
-        elif stripped.startswith("#### "):
+        elif header_level == 4:
             # Sub-heading, might contain paragraph reference
-            section_name = stripped[5:].strip()
             para_id = _extract_paragraph_id(section_name)
             if para_id:
                 flush_paragraph()
@@ -368,10 +425,12 @@ def chunk_sasb(content: str, filename: str) -> list[ChunkResult]:
                 metadata: SASBChunkMetadata = {
                     "industry_sector": industry_sector,
                     "disclosure_topic": current_topic,
-                    "metric_codes": _extract_metric_codes(sub_text),
+                    # Codes come from the topic-level scan; each sub-chunk
+                    # keeps those it contains
+                    "metric_codes": [code for code in metric_codes if code in sub_text],
                     "standard_code": standard_code,
                 }
-                chunks.append(ChunkResult(text=sub_text, metadata=dict(metadata)))
+                chunks.append(ChunkResult(text=sub_text, metadata=metadata))
         else:
             metadata = {
                 "industry_sector": industry_sector,
@@ -388,7 +447,9 @@ def chunk_sasb(content: str, filename: str) -> list[ChunkResult]:
         sub_chunks = []
         paragraphs = topic_text.split("\n\n")
         current_chunk: list[str] = []
-        current_tokens = _estimate_tokens(context_header + "\n\n")
+        # Header cost is fixed for the whole split
+        header_tokens = _estimate_tokens(context_header + "\n\n")
+        current_tokens = header_tokens
 
         for para in paragraphs:
             para_tokens = _estimate_tokens(para)
@@ -396,7 +457,7 @@ def chunk_sasb(content: str, filename: str) -> list[ChunkResult]:
                 chunk_text = f"{context_header}\n\n" + "\n\n".join(current_chunk)
                 sub_chunks.append(chunk_text)
                 current_chunk = []
-                current_tokens = _estimate_tokens(context_header + "\n\n")
+                current_tokens = header_tokens
 
             current_chunk.append(para)
             current_tokens += para_tokens
@@ -413,12 +474,12 @@ def chunk_sasb(content: str, filename: str) -> list[ChunkResult]:
         stripped = line.strip()
 
         # Check for topic headers (H2 or H3)
-        if stripped.startswith("## ") or stripped.startswith("### "):
+        header_level, header_text = (
+            _header_level(stripped) if stripped[:1] == "#" else (0, "")
+        )
+        if header_level in (2, 3):
             flush_topic()
-            if stripped.startswith("## "):
-                current_topic = stripped[3:].strip()
-            else:
-                current_topic = stripped[4:].strip()
+            current_topic = header_text
         elif stripped or topic_buffer:
             # Add content to current topic
             if current_topic:
@@ -448,70 +509,44 @@ def chunk_report(
     # Track section hierarchy
     section_path: list[str] = []
 
-    # Page tracking
+    # Page tracking: pages are in document order, so their start offsets
+    # are sorted and a position's page is found by binary search
+    page_starts = [p.get("start_char", 0) for p in page_metadata or []]
+    page_numbers = [
+        p.get("page_number", i + 1) for i, p in enumerate(page_metadata or [])
+    ]
+
     def get_page_for_position(char_pos: int) -> int:
         """Get page number for a character position."""
-        if not page_metadata:
-            return 1
-        for i, page_info in enumerate(page_metadata):
-            start = page_info.get("start_char", 0)
-            next_start = (
-                page_metadata[i + 1].get("start_char", float("inf"))
-                if i + 1 < len(page_metadata)
-                else float("inf")
-            )
-            if start <= char_pos < next_start:
-                return page_info.get("page_number", i + 1)
-        return 1
+        index = bisect_right(page_starts, char_pos) - 1
+        return page_numbers[index] if index >= 0 else 1
 
-    # Parse content into sections
+    # Parse content into sections. Header lines are found in a single regex
+    # pass and each section keeps only offsets into content: its body is the
+    # text between its header line and the next one.
     sections: list[dict] = []
-    current_section: dict = {"path": [], "content": [], "start_char": 0}
-    char_pos = 0
+    current_section: dict = {"path": [], "start_char": 0, "body_start": 0}
 
-    lines = content.split("\n")
-    for line in lines:
-        stripped = line.strip()
-        line_len = len(line) + 1  # +1 for newline
-
-        # Check for headers
-        header_level = 0
-        header_text = ""
-        if stripped.startswith("# "):
-            header_level = 1
-            header_text = stripped[2:].strip()
-        elif stripped.startswith("## "):
-            header_level = 2
-            header_text = stripped[3:].strip()
-        elif stripped.startswith("### "):
-            header_level = 3
-            header_text = stripped[4:].strip()
-        elif stripped.startswith("#### "):
-            header_level = 4
-            header_text = stripped[5:].strip()
-
-        if header_level > 0:
-            # Save current section
-            if current_section["content"]:
-                sections.append(current_section)
-
-            # Update section path
-            section_path = section_path[: header_level - 1] + [header_text]
-
-            # Start new section
-            current_section = {
-                "path": section_path.copy(),
-                "content": [],
-                "start_char": char_pos,
-            }
-        else:
-            current_section["content"].append(line)
+    for match in _REPORT_HEADER_RE.finditer(content):
+        # Save current section (its body ends before the header's newline;
+        # a header on the first line leaves the implicit section empty)
+        current_section["body_end"] = max(match.start() - 1, 0)
+        sections.append(current_section)
+
+        # Update section path
+        header_level = len(match.group(1))
+        section_path = section_path[: header_level - 1] + [match.group(2).strip()]
 
-        char_pos += line_len
+        # Start new section
+        current_section = {
+            "path": section_path,
+            "start_char": match.start(),
+            "body_start": match.end() + 1,
+        }
 
     # Save final section
-    if current_section["content"]:
-        sections.append(current_section)
+    current_section["body_end"] = len(content)
+    sections.append(current_section)
 
     # Chunk each section with overlap
     chunk_index = 0
@@ -520,7 +555,7 @@ def chunk_report(
     overlap_chars = ChunkingConfig.REPORT_CHUNK_OVERLAP_TOKENS * ChunkingConfig.CHARS_PER_TOKEN
 
     for section in sections:
-        section_text = "\n".join(section["content"]).strip()
+        section_text = content[section["body_start"] : section["body_end"]].strip()
         if not section_text:
             continue
 
@@ -530,9 +565,10 @@ def chunk_report(
         # Build context header
         path_str = " > ".join(section_path) if section_path else "Document"
         context_header = f"[Report > {path_str}]"
+        body_offset = len(context_header) + 2  # chunk text starts after "\n\n"
 
         # Check for tables
-        has_table = "|" in section_text and "---" in section_text
+        has_table = _TABLE_RE.search(section_text) is not None
 
         # If section is small enough, keep as single chunk
         section_chars = len(section_text)
@@ -546,7 +582,7 @@ def chunk_report(
                 "has_table": has_table,
                 "chunk_index": chunk_index,
             }
-            chunks.append(ChunkResult(text=full_text, metadata=dict(metadata)))
+            chunks.append(ChunkResult(text=full_text, metadata=metadata))
             chunk_index += 1
             continue
 
@@ -561,65 +597,67 @@ def chunk_report(
 
             # Check if adding this paragraph would exceed max
             if current_chars + para_chars > max_chars and current_chunk:
-                # Flush current chunk
-                chunk_text = "\n\n".join(current_chunk)
-                full_text = f"{context_header}\n\n{chunk_text}"
+                # Flush current chunk, joining header and paragraphs once
+                full_text = "\n\n".join((context_header, *current_chunk))
+                chunk_chars = len(full_text) - body_offset
 
                 page_start = get_page_for_position(chunk_start_char)
-                page_end = get_page_for_position(chunk_start_char + len(chunk_text))
+                page_end = get_page_for_position(chunk_start_char + chunk_chars)
 
                 metadata = {
                     "page_start": page_start,
                     "page_end": page_end,
                     "section_path": section_path,
-                    "has_table": "|" in chunk_text and "---" in chunk_text,
+                    "has_table": has_table
+                    and _TABLE_RE.search(full_text, body_offset) is not None,
                     "chunk_index": chunk_index,
                 }
                 chunks.append(ChunkResult(text=full_text, metadata=metadata))
                 chunk_index += 1
 
                 # Apply overlap - keep last paragraph(s) up to overlap_chars
-                overlap_content: list[str] = []
+                overlap_count = 0
                 overlap_total = 0
                 for prev_para in reversed(current_chunk):
                     if overlap_total + len(prev_para) <= overlap_chars:
-                        overlap_content.insert(0, prev_para)
+                        overlap_count += 1
                         overlap_total += len(prev_para)
                     else:
                         break
 
-                current_chunk = overlap_content
+                current_chunk = current_chunk[len(current_chunk) - overlap_count :]
                 current_chars = overlap_total
-                chunk_start_char += len(chunk_text) - overlap_total
+                chunk_start_char += chunk_chars - overlap_total
 
             current_chunk.append(para)
             current_chars += para_chars
 
         # Flush remaining content
         if current_chunk and current_chars >= min_chars:
-            chunk_text = "\n\n".join(current_chunk)
-            full_text = f"{context_header}\n\n{chunk_text}"
+            full_text = "\n\n".join((context_header, *current_chunk))
+            chunk_chars = len(full_text) - body_offset
 
             page_start = get_page_for_position(chunk_start_char)
-            page_end = get_page_for_position(chunk_start_char + len(chunk_text))
+            page_end = get_page_for_position(chunk_start_char + chunk_chars)
 
             metadata = {
                 "page_start": page_start,
                 "page_end": page_end,
                 "section_path": section_path,
-                "has_table": "|" in chunk_text and "---" in chunk_text,
+                "has_table": has_table
+                and _TABLE_RE.search(full_text, body_offset) is not None,
                 "chunk_index": chunk_index,
             }
             chunks.append(ChunkResult(text=full_text, metadata=metadata))
             chunk_index += 1
         elif current_chunk and chunks:
             # Append to last chunk if too small
+            tail_text = "\n\n".join(current_chunk)
             last_chunk = chunks[-1]
-            separator = "\n\n"
-            last_chunk.text += separator + "\n\n".join(current_chunk)
+            last_chunk.text += "\n\n" + tail_text
             # Update page_end
             last_chunk.metadata["page_end"] = get_page_for_position(
-                chunk_start_char + len("\n\n".join(current_chunk))
+                chunk_start_char + len(tail_text)
             )
 
     return chunks
@@ -5,17 +5,25 @@ Implements FRD 1 (RAG Pipeline) Section 1 - Embedding Service.
 Provides:
 - Single text embedding via embed_text()
 - Batch text embedding via embed_batch() with token-aware batching
+- Streaming batch results via embed_stream() as each batch completes
 - Retry logic for transient failures
 - Token estimation for batch sizing
+- Content-addressed caching of embeddings so unchanged texts skip the API
 """
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import numpy as np
+import orjson
 
 from app.core.config import settings
+from app.core.rate_limit import openrouter_bucket
+from app.core.retry import RETRY_STATUS_CODES, retry_http
+from app.services.cache import TwoTierCache, make_cache_key, text_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,10 @@ class EmbeddingError(Exception):
     """Raised when embedding generation fails after all retries."""
 
 
+class EmbeddingBatchTooLargeError(EmbeddingError):
+    """Raised when the API rejects a batch for exceeding its token limit."""
+
+
 class EmbeddingService:
     """
     Service for generating text embeddings via OpenRouter API.
@@ -44,18 +56,30 @@ class EmbeddingService:
     MAX_TEXTS_PER_BATCH = 100
     MAX_TOKENS_PER_BATCH = 50_000
     CHARS_PER_TOKEN = 4  # Approximate for English text
-    MAX_TEXT_CHARS = 32000  # ~8000 tokens, truncate texts exceeding this
-
-    # Concurrency configuration
+    # Truncate texts whose UTF-8 encoding exceeds this. Bytes track tokens far
+    # better than characters for non-Latin scripts (a CJK character is 3 bytes
+    # and often more than one token); ~7000 tokens of English text.
+    MAX_TEXT_BYTES = 28_000
+
+    # Concurrency configuration: embedding requests in flight at once. Only
+    # the request holds a slot, so the next batch is sent while the previous
+    # response is still being decoded.
     MAX_CONCURRENT_BATCHES = 5
 
     # Retry configuration
     MAX_RETRIES = 3
-    RETRY_DELAYS = [1.0, 2.0, 4.0]  # seconds
-    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    RETRY_DELAYS = (1.0, 2.0, 4.0)  # seconds
+    # Fragments of the 400 error body when a request has too many tokens
+    TOKEN_LIMIT_MARKERS = ("context_length_exceeded", "maximum context length", "too many tokens")
+
+    def __init__(self, cache: TwoTierCache | None = text_embedding_cache) -> None:
+        """Initialize the embedding service with an HTTP client.
 
-    def __init__(self) -> None:
-        """Initialize the embedding service with an HTTP client."""
+        Args:
+            cache: Cache of embeddings by model and text (None disables)
+        """
+        self.cache = cache
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
         self._client = httpx.AsyncClient(
             base_url=settings.OPENROUTER_BASE_URL,
             headers={
@@ -65,6 +89,14 @@ class EmbeddingService:
                 "X-Title": "Sibyl",
             },
             timeout=httpx.Timeout(120.0),  # Embeddings can take longer for large batches
+            # Retry failed connection attempts (not requests); keep enough
+            # idle connections for every concurrent batch to reuse one
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+                ),
+            ),
         )
 
     async def close(self) -> None:
@@ -80,163 +112,198 @@ class EmbeddingService:
         return len(text) // self.CHARS_PER_TOKEN
 
     def _truncate_text(self, text: str) -> str:
-        """Truncate text if it exceeds the maximum character limit.
+        """Truncate text if its UTF-8 encoding exceeds MAX_TEXT_BYTES.
 
-        Returns the original text if within limits, otherwise truncates
-        and logs a warning.
+        Returns the original text if within limits, otherwise truncates at a
+        character boundary and logs a warning.
         """
-        if len(text) <= self.MAX_TEXT_CHARS:
+        # No character takes more than 4 bytes, so short texts skip encoding
+        if len(text) * 4 <= self.MAX_TEXT_BYTES:
+            return text
+        encoded = text.encode("utf-8")
+        if len(encoded) <= self.MAX_TEXT_BYTES:
             return text
 
         logger.warning(
-            "Truncating text from %d to %d characters (estimated %d to %d tokens)",
-            len(text),
-            self.MAX_TEXT_CHARS,
+            "Truncating text from %d to %d bytes (estimated %d tokens)",
+            len(encoded),
+            self.MAX_TEXT_BYTES,
             self._estimate_tokens(text),
-            self.MAX_TOKENS_PER_BATCH,
         )
-        return text[: self.MAX_TEXT_CHARS]
+        # errors="ignore" drops a multi-byte character split by the cut
+        return encoded[: self.MAX_TEXT_BYTES].decode("utf-8", errors="ignore")
 
     def _create_batches(self, texts: list[str]) -> list[list[str]]:
         """Group texts into batches respecting token and count limits.
 
         Each batch contains at most MAX_TEXTS_PER_BATCH texts and
-        approximately MAX_TOKENS_PER_BATCH total tokens.
+        approximately MAX_TOKENS_PER_BATCH total tokens. Boundaries are found
+        by binary search over the running token total rather than per text.
+        Texts must already be truncated (embed_stream does this once per text).
         """
-        batches: list[list[str]] = []
-        current_batch: list[str] = []
-        current_tokens = 0
-
-        for text in texts:
-            # Truncate if needed
-            text = self._truncate_text(text)
-            text_tokens = self._estimate_tokens(text)
-
-            # Check if adding this text would exceed limits
-            would_exceed_count = len(current_batch) >= self.MAX_TEXTS_PER_BATCH
-            would_exceed_tokens = (
-                current_tokens + text_tokens > self.MAX_TOKENS_PER_BATCH
-                and len(current_batch) > 0
-            )
-
-            if would_exceed_count or would_exceed_tokens:
-                # Start a new batch
-                batches.append(current_batch)
-                current_batch = []
-                current_tokens = 0
+        if not texts:
+            return []
 
-            current_batch.append(text)
-            current_tokens += text_tokens
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        token_totals = np.cumsum(lengths // self.CHARS_PER_TOKEN)
 
-        # Add the last batch if not empty
-        if current_batch:
-            batches.append(current_batch)
+        batches: list[list[str]] = []
+        start = 0
+        while start < len(texts):
+            consumed = int(token_totals[start - 1]) if start else 0
+            # Extend while the batch stays within the token budget, always
+            # taking at least one text and at most MAX_TEXTS_PER_BATCH
+            end = int(
+                np.searchsorted(
+                    token_totals, consumed + self.MAX_TOKENS_PER_BATCH, side="right"
+                )
+            )
+            end = min(max(end, start + 1), start + self.MAX_TEXTS_PER_BATCH)
+            batches.append(texts[start:end])
+            start = end
 
         return batches
 
-    async def _call_embedding_api(self, texts: list[str]) -> list[list[float]]:
-        """Call the OpenRouter embeddings API with retry logic.
+    async def _call_embedding_api(self, texts: list[str]) -> np.ndarray:
+        """Embed one batch of texts.
 
         Args:
             texts: List of text strings to embed (already batched)
 
         Returns:
-            List of embedding vectors in the same order as input
+            float32 array of shape (len(texts), dimensions), rows in input order
 
         Raises:
             EmbeddingError: If all retries fail
         """
-        payload: dict[str, Any] = {
-            "model": self.MODEL,
-            "input": texts,
-        }
-
-        last_exception: Exception | None = None
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                logger.debug(
-                    "Embedding API request: texts=%d, attempt=%d",
-                    len(texts),
-                    attempt + 1,
-                )
+        async with self._request_slots:
+            body = await self._request_embeddings(
+                {"model": self.MODEL, "input": texts}, len(texts)
+            )
+        # Decoding a full batch (~30 KB of JSON per vector) takes tens of ms,
+        # so it runs in a worker thread, outside the request slot, while the
+        # loop serves other batches
+        return await asyncio.to_thread(self._parse_embeddings, body, len(texts))
 
-                response = await self._client.post("/embeddings", json=payload)
+    def _parse_embeddings(self, body: bytes, count: int) -> np.ndarray:
+        """Decode an embeddings response body into a float32 array.
 
-                if response.status_code in self.RETRY_STATUS_CODES:
-                    delay = self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS) - 1)]
-                    logger.warning(
-                        "Embedding API returned %d, retrying in %.1fs (attempt %d/%d)",
-                        response.status_code,
-                        delay,
-                        attempt + 1,
-                        self.MAX_RETRIES,
-                    )
-                    await asyncio.sleep(delay)
-                    continue
-
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Extract embeddings in order (API returns them with index)
-                embedding_data = data.get("data", [])
-                # Sort by index to ensure correct order
-                embedding_data.sort(key=lambda x: x.get("index", 0))
-                embeddings = [item["embedding"] for item in embedding_data]
-
-                # Log usage if available
-                if "usage" in data:
-                    usage = data["usage"]
-                    logger.info(
-                        "Embedding API response: texts=%d, total_tokens=%d",
-                        len(texts),
-                        usage.get("total_tokens", 0),
-                    )
+        Args:
+            body: Raw JSON response body
+            count: Number of input texts, for logging
+
+        Returns:
+            float32 array of shape (count, dimensions), rows in input order
 
-                return embeddings
+        Raises:
+            EmbeddingError: If the body is not a valid embeddings response
+        """
+        try:
+            data = orjson.loads(body)
+
+            # Extract embeddings in order: the API tags each with its input
+            # index, so place them directly instead of sorting. Rows are written
+            # straight into one float32 array rather than kept as lists of floats.
+            embedding_data = data.get("data", [])
+            dimensions = (
+                len(embedding_data[0]["embedding"]) if embedding_data else self.EMBEDDING_DIMENSION
+            )
+            embeddings = np.empty((len(embedding_data), dimensions), dtype=np.float32)
+            for position, item in enumerate(embedding_data):
+                embeddings[item.get("index", position)] = item["embedding"]
+        except Exception as e:
+            logger.error("Embedding API unexpected response: %s", e)
+            raise EmbeddingError(f"Embedding API error: {e}") from e
+
+        # Log usage if available
+        if "usage" in data:
+            usage = data["usage"]
+            logger.info(
+                "Embedding API response: texts=%d, total_tokens=%d",
+                count,
+                usage.get("total_tokens", 0),
+            )
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in self.RETRY_STATUS_CODES:
-                    last_exception = e
-                    delay = self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS) - 1)]
-                    logger.warning(
-                        "Embedding API HTTP error %d, retrying in %.1fs",
-                        e.response.status_code,
-                        delay,
-                    )
-                    await asyncio.sleep(delay)
-                    continue
-                logger.error("Embedding API non-retryable error: %s", e)
-                raise EmbeddingError(f"Embedding API error: {e}") from e
-
-            except Exception as e:
-                last_exception = e
-                logger.error("Embedding API unexpected error: %s", e)
-                raise EmbeddingError(f"Embedding API error: {e}") from e
-
-        # Exhausted retries
-        msg = f"Embedding API request failed after {self.MAX_RETRIES} attempts"
-        logger.error(msg)
-        raise EmbeddingError(msg) from last_exception
-
-    async def embed_text(self, text: str) -> list[float]:
+        return embeddings
+
+    @retry_http(
+        max_retries=MAX_RETRIES,
+        delays=RETRY_DELAYS,
+        retry_codes=RETRY_STATUS_CODES,
+        label="Embedding API",
+    )
+    async def _post_embeddings(self, payload: dict[str, Any]) -> httpx.Response:
+        """Make one embeddings request, raising on any HTTP error status."""
+        await openrouter_bucket.acquire()
+        response = await self._client.post("/embeddings", json=payload)
+        response.raise_for_status()
+        return response
+
+    async def _request_embeddings(self, payload: dict[str, Any], count: int) -> bytes:
+        """POST to the OpenRouter embeddings API with retry logic.
+
+        Args:
+            payload: Request body ("input" is a string or a list of strings)
+            count: Number of input texts, for logging and errors
+
+        Returns:
+            The raw response body
+
+        Raises:
+            EmbeddingError: If all retries fail
+        """
+        logger.debug("Embedding API request: texts=%d", count)
+        try:
+            response = await self._post_embeddings(payload)
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in RETRY_STATUS_CODES:
+                msg = f"Embedding API request failed after {self.MAX_RETRIES} attempts"
+                logger.error(msg)
+                raise EmbeddingError(msg) from e
+            if e.response.status_code == 400 and any(
+                marker in e.response.text.lower() for marker in self.TOKEN_LIMIT_MARKERS
+            ):
+                raise EmbeddingBatchTooLargeError(
+                    f"Embedding batch of {count} texts exceeds the token limit"
+                ) from e
+            logger.error("Embedding API non-retryable error: %s", e)
+            raise EmbeddingError(f"Embedding API error: {e}") from e
+
+        except Exception as e:
+            logger.error("Embedding API unexpected error: %s", e)
+            raise EmbeddingError(f"Embedding API error: {e}") from e
+
+        return response.content
+
+    async def embed_text(self, text: str) -> np.ndarray:
         """Embed a single text string.
 
         Args:
             text: The text to embed
 
         Returns:
-            A 1536-dimensional float vector
+            A 1536-dimensional float32 vector
 
         Raises:
             EmbeddingError: If embedding fails after all retries
         """
         text = self._truncate_text(text)
-        embeddings = await self._call_embedding_api([text])
-        return embeddings[0]
-
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        cache_key = make_cache_key(self.MODEL, text)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Single input: send it as a bare string and decode the one small
+        # result inline rather than in a worker thread
+        body = await self._request_embeddings({"model": self.MODEL, "input": text}, 1)
+        embedding = self._parse_embeddings(body, 1)[0]
+        if self.cache is not None:
+            await self.cache.set(cache_key, embedding)
+        return embedding
+
+    async def embed_batch(self, texts: list[str]) -> np.ndarray:
         """Embed multiple text strings with batching and concurrency.
 
         Groups texts into batches respecting token limits and processes
@@ -247,47 +314,137 @@ class EmbeddingService:
             texts: List of text strings to embed
 
         Returns:
-            List of 1536-dimensional float vectors in the same order as input
+            float32 array of shape (len(texts), 1536), rows in input order
 
         Raises:
             EmbeddingError: If embedding fails after all retries
         """
-        if not texts:
-            return []
+        embeddings: np.ndarray | None = None
+        async for indices, vectors in self.embed_stream(texts):
+            if embeddings is None:
+                embeddings = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            embeddings[indices] = vectors
+        if embeddings is None:
+            return np.empty((0, self.EMBEDDING_DIMENSION), dtype=np.float32)
+        return embeddings
+
+    async def embed_stream(
+        self, texts: list[str]
+    ) -> AsyncIterator[tuple[list[int], np.ndarray]]:
+        """Embed texts, yielding each group of vectors as soon as it is ready.
+
+        Cached vectors come first, then each API batch in completion order,
+        so callers can store results while later batches are still in flight.
+        Each distinct text is looked up and embedded once, and batches are
+        packed shortest first so each fills its token budget.
 
-        # Create batches
-        batches = self._create_batches(texts)
+        Args:
+            texts: List of text strings to embed
+
+        Yields:
+            (indices, vectors) pairs of input positions and a float32 array of
+            their vectors; every input position appears exactly once across
+            the stream
+
+        Raises:
+            EmbeddingError: If embedding fails after all retries
+        """
+        if not texts:
+            return
+
+        # Input positions by (truncated) text, so duplicates such as repeated
+        # boilerplate are embedded once and fanned back out
+        positions: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(self._truncate_text(text), []).append(i)
+
+        def expand(group: list[str], vectors: np.ndarray) -> tuple[list[int], np.ndarray]:
+            indices: list[int] = []
+            rows: list[int] = []
+            for row, text in enumerate(group):
+                for i in positions[text]:
+                    indices.append(i)
+                    rows.append(row)
+            return indices, vectors[rows]
+
+        # Look every distinct text up by content hash; only misses go upstream
+        unique = list(positions)
+        keys: dict[str, str] = {}
+        hits: dict[str, np.ndarray] = {}
+        misses = unique
+        if self.cache is not None:
+            keys = {text: make_cache_key(self.MODEL, text) for text in unique}
+            cached = await self.cache.get_many(list(keys.values()))
+            hits = {text: vector for text, vector in zip(unique, cached) if vector is not None}
+            misses = [text for text in unique if text not in hits]
         logger.info(
-            "Embedding %d texts in %d batches (concurrency=%d)",
+            "Embedding %d texts (%d distinct): %d cached, %d to embed",
             len(texts),
-            len(batches),
-            self.MAX_CONCURRENT_BATCHES,
+            len(unique),
+            len(hits),
+            len(misses),
         )
 
-        # Process batches concurrently with a semaphore to cap parallelism
-        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+        # Create batches, shortest texts first (sort is stable)
+        batches = self._create_batches(sorted(misses, key=len))
+        if batches:
+            logger.info(
+                "Embedding %d texts in %d batches (concurrency=%d)",
+                len(misses),
+                len(batches),
+                self.MAX_CONCURRENT_BATCHES,
+            )
 
-        async def _process_batch(batch_idx: int, batch: list[str]) -> list[list[float]]:
-            async with semaphore:
-                logger.debug(
-                    "Processing batch %d/%d (%d texts)",
-                    batch_idx + 1,
-                    len(batches),
-                    len(batch),
-                )
-                return await self._call_embedding_api(batch)
+        # Process batches concurrently; _call_embedding_api caps how many
+        # requests are in flight
+        async def _process_batch(
+            batch_idx: int, batch: list[str]
+        ) -> tuple[list[str], np.ndarray]:
+            logger.debug(
+                "Processing batch %d/%d (%d texts)",
+                batch_idx + 1,
+                len(batches),
+                len(batch),
+            )
+            return batch, await self._call_with_split(batch)
 
         tasks = [
-            _process_batch(i, batch) for i, batch in enumerate(batches)
+            asyncio.create_task(_process_batch(i, batch)) for i, batch in enumerate(batches)
         ]
-        batch_results = await asyncio.gather(*tasks)
-
-        # Flatten results in order
-        all_embeddings: list[list[float]] = []
-        for batch_embeddings in batch_results:
-            all_embeddings.extend(batch_embeddings)
-
-        return all_embeddings
+        try:
+            # Batches are already running while cached vectors are consumed
+            if hits:
+                yield expand(list(hits), np.asarray(list(hits.values()), dtype=np.float32))
+
+            for next_batch in asyncio.as_completed(tasks):
+                batch, vectors = await next_batch
+                if self.cache is not None:
+                    # Copy rows so cached vectors don't pin the whole batch array
+                    await self.cache.set_many(
+                        {keys[text]: vector.copy() for text, vector in zip(batch, vectors)}
+                    )
+                yield expand(batch, vectors)
+        finally:
+            # Stop outstanding requests if a batch failed or the caller stopped early
+            for task in tasks:
+                task.cancel()
+
+    async def _call_with_split(self, texts: list[str]) -> np.ndarray:
+        """Embed one batch, shrinking it by 10% whenever it is over the token limit."""
+        try:
+            return await self._call_embedding_api(texts)
+        except EmbeddingBatchTooLargeError:
+            if len(texts) == 1:
+                raise
+            cut = max(len(texts) * 9 // 10, 1)
+            logger.warning(
+                "Embedding batch of %d texts over the token limit, retrying as %d + %d",
+                len(texts),
+                cut,
+                len(texts) - cut,
+            )
+            head = await self._call_with_split(texts[:cut])
+            return np.concatenate((head, await self._call_with_split(texts[cut:])))
 
 
 # Singleton service instance
@@ -8,7 +8,7 @@ coordinates (latitude, longitude) for satellite imagery queries.
 Features:
 - Nominatim/OpenStreetMap geocoding (free, no API key)
 - Rate limiting (1 request/second per Nominatim ToS)
-- In-memory caching to reduce API calls
+- Two-tier (in-process + Redis) caching to reduce API calls across restarts
 - Coordinate validation
 """
 
@@ -20,29 +20,72 @@ from typing import Optional
 import httpx
 
 from app.core.config import settings
+from app.services.cache import TwoTierCache, geocoding_cache
 
 logger = logging.getLogger(__name__)
 
+# Cached in place of coordinates when Nominatim has no usable result, so a
+# cache hit can tell "known not found" apart from a miss (None)
+NOT_FOUND: list[float] = []
+
 
 class GeocodingService:
     """Service for geocoding location names to coordinates."""
 
-    def __init__(self):
+    # "Not found" results are retried sooner than found coordinates
+    NOT_FOUND_TTL_SECONDS = 24 * 3600
+
+    def __init__(self, cache: TwoTierCache = geocoding_cache):
         self.base_url = settings.GEOCODING_SERVICE_URL
         self.headers = {
             "User-Agent": "Sibyl-Geography-Agent/1.0 (sustainability-verification)"
         }
-        self._cache: dict[str, tuple[float, float] | None] = {}
-        self._last_request_time: float = 0.0
+        # Values are [lat, lon], or NOT_FOUND for a location Nominatim could not place
+        self._cache = cache
+        # Earliest time the next Nominatim request may be sent
+        self._next_request_time: float = 0.0
         self._rate_limit_seconds: float = settings.GEOCODING_RATE_LIMIT_SECONDS
+        # In-flight lookups by cache key, so concurrent claims naming the same
+        # place share one request
+        self._pending: dict[str, asyncio.Task[Optional[tuple[float, float]]]] = {}
+        # Shared across requests so Nominatim connections are kept alive;
+        # created on first use rather than at import time
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=10.0,
+                # Retry failed connection attempts (not requests)
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2, limits=httpx.Limits(max_keepalive_connections=5)
+                ),
+            )
+        return self._client
+
+    async def _cache_not_found(self, cache_key: str) -> None:
+        """Remember that a location could not be geocoded."""
+        await self._cache.set(cache_key, NOT_FOUND, ttl=self.NOT_FOUND_TTL_SECONDS)
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting (1 request per second)."""
+        """Enforce rate limiting (1 request per second).
+
+        Each caller reserves the next free slot before sleeping, so concurrent
+        callers are spaced out rather than all waking after the same delay.
+        """
         now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._rate_limit_seconds:
-            await asyncio.sleep(self._rate_limit_seconds - elapsed)
-        self._last_request_time = time.monotonic()
+        slot = max(now, self._next_request_time)
+        self._next_request_time = slot + self._rate_limit_seconds
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     @staticmethod
     def validate_coordinates(lat: float, lon: float) -> bool:
@@ -71,12 +114,29 @@ class GeocodingService:
         Returns:
             (latitude, longitude) tuple or None if not found
         """
-        # Check cache
-        cache_key = f"{location_name}:{country_code or ''}"
-        if cache_key in self._cache:
+        # Check cache (keys collapse case and surrounding whitespace)
+        cache_key = f"{location_name.strip().casefold()}:{(country_code or '').casefold()}"
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
             logger.debug("Geocoding cache hit: %s", location_name)
-            return self._cache[cache_key]
-
+            return None if cached == NOT_FOUND else (cached[0], cached[1])
+
+        task = self._pending.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._geocode_uncached(location_name, country_code, cache_key)
+            )
+            self._pending[cache_key] = task
+            task.add_done_callback(lambda _: self._pending.pop(cache_key, None))
+        return await task
+
+    async def _geocode_uncached(
+        self,
+        location_name: str,
+        country_code: str | None,
+        cache_key: str,
+    ) -> Optional[tuple[float, float]]:
+        """Query Nominatim for a location missing from the cache."""
         # Rate limit
         await self._rate_limit()
 
@@ -90,46 +150,43 @@ class GeocodingService:
             params["countrycodes"] = country_code
 
         try:
-            async with httpx.AsyncClient(
-                headers=self.headers, timeout=10.0
-            ) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-
-                results = response.json()
-
-                if not results:
-                    logger.info("No geocoding results for: %s", location_name)
-                    self._cache[cache_key] = None
-                    return None
-
-                # Take first (most relevant) result
-                best = results[0]
-                lat = float(best["lat"])
-                lon = float(best["lon"])
-
-                # Validate
-                if not self.validate_coordinates(lat, lon):
-                    logger.warning(
-                        "Invalid coordinates for %s: (%f, %f)",
-                        location_name, lat, lon,
-                    )
-                    self._cache[cache_key] = None
-                    return None
-
-                # Round to 4 decimal places (~11m precision)
-                lat = round(lat, 4)
-                lon = round(lon, 4)
-
-                logger.info(
-                    "Geocoded '%s' → (%f, %f) [%s]",
+            response = await self._get_client().get(self.base_url, params=params)
+            response.raise_for_status()
+
+            results = response.json()
+
+            if not results:
+                logger.info("No geocoding results for: %s", location_name)
+                await self._cache_not_found(cache_key)
+                return None
+
+            # Take first (most relevant) result
+            best = results[0]
+            lat = float(best["lat"])
+            lon = float(best["lon"])
+
+            # Validate
+            if not self.validate_coordinates(lat, lon):
+                logger.warning(
+                    "Invalid coordinates for %s: (%f, %f)",
                     location_name, lat, lon,
-                    best.get("display_name", ""),
                 )
+                await self._cache_not_found(cache_key)
+                return None
+
+            # Round to 4 decimal places (~11m precision)
+            lat = round(lat, 4)
+            lon = round(lon, 4)
+
+            logger.info(
+                "Geocoded '%s' → (%f, %f) [%s]",
+                location_name, lat, lon,
+                best.get("display_name", ""),
+            )
 
-                result = (lat, lon)
-                self._cache[cache_key] = result
-                return result
+            result = (lat, lon)
+            await self._cache.set(cache_key, list(result))
+            return result
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
@@ -152,28 +209,25 @@ class GeocodingService:
     ) -> Optional[tuple[float, float]]:
         """Single retry after rate limiting."""
         try:
-            async with httpx.AsyncClient(
-                headers=self.headers, timeout=10.0
-            ) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
+            response = await self._get_client().get(self.base_url, params=params)
+            response.raise_for_status()
 
-                results = response.json()
-                if not results:
-                    self._cache[cache_key] = None
-                    return None
+            results = response.json()
+            if not results:
+                await self._cache_not_found(cache_key)
+                return None
 
-                best = results[0]
-                lat = round(float(best["lat"]), 4)
-                lon = round(float(best["lon"]), 4)
+            best = results[0]
+            lat = round(float(best["lat"]), 4)
+            lon = round(float(best["lon"]), 4)
 
-                if not self.validate_coordinates(lat, lon):
-                    self._cache[cache_key] = None
-                    return None
+            if not self.validate_coordinates(lat, lon):
+                await self._cache_not_found(cache_key)
+                return None
 
-                result = (lat, lon)
-                self._cache[cache_key] = result
-                return result
+            result = (lat, lon)
+            await self._cache.set(cache_key, list(result))
+            return result
 
         except Exception as e:
             logger.error("Geocoding retry failed for '%s': %s", location_name, e)
@@ -195,8 +249,8 @@ class GeocodingService:
         return None
 
     def clear_cache(self) -> None:
-        """Clear the geocoding cache."""
-        self._cache.clear()
+        """Clear the in-process geocoding cache (Redis entries expire on their own)."""
+        self._cache.clear_local()
 
 
 # Singleton instance
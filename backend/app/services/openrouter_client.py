@@ -3,15 +3,16 @@
 Provides a single interface for all LLM calls in Sibyl through the OpenRouter gateway.
 """
 
-import asyncio
-import json
 import logging
 from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 
 from app.core.config import settings
+from app.core.rate_limit import openrouter_bucket
+from app.core.retry import RETRY_STATUS_CODES, retry_http
 from app.core.sanitize import sanitize_string
 
 logger = logging.getLogger(__name__)
@@ -44,12 +45,9 @@ class OpenRouterClient:
     - Consistent headers (Authorization, Referer, X-Title)
     """
 
-    # HTTP status codes that trigger retry
-    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
-
     # Retry configuration
     MAX_RETRIES = 3
-    RETRY_DELAYS = [1.0, 2.0, 4.0]  # seconds
+    RETRY_DELAYS = (1.0, 2.0, 4.0)  # seconds
 
     def __init__(self) -> None:
         """Initialize the OpenRouter client."""
@@ -62,6 +60,14 @@ class OpenRouterClient:
                 "X-Title": "Sibyl",
             },
             timeout=httpx.Timeout(180.0),  # Large reports may need 60-120s of generation
+            # Retry failed connection attempts (not requests); keep idle
+            # connections around so concurrent agents reuse them
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+                ),
+            ),
         )
 
     async def close(self) -> None:
@@ -105,99 +111,76 @@ class OpenRouterClient:
         if response_format is not None:
             payload["response_format"] = response_format
 
-        last_exception: Exception | None = None
+        logger.debug(
+            "OpenRouter request: model=%s, messages=%d",
+            model,
+            len(messages),
+        )
 
-        for attempt in range(self.MAX_RETRIES):
+        try:
+            response = await self._post_chat_completion(payload)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in RETRY_STATUS_CODES:
+                msg = f"OpenRouter request failed after {self.MAX_RETRIES} attempts"
+                logger.error(msg)
+                raise Exception(msg) from e
+            # Log the error response body for debugging
             try:
-                logger.debug(
-                    "OpenRouter request: model=%s, messages=%d, attempt=%d",
-                    model,
-                    len(messages),
-                    attempt + 1,
-                )
-
-                response = await self._client.post("/chat/completions", json=payload)
-
-                if response.status_code in self.RETRY_STATUS_CODES:
-                    delay = self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS) - 1)]
-                    logger.warning(
-                        "OpenRouter returned %d, retrying in %.1fs (attempt %d/%d)",
-                        response.status_code,
-                        delay,
-                        attempt + 1,
-                        self.MAX_RETRIES,
-                    )
-                    import asyncio
-                    await asyncio.sleep(delay)
-                    continue
+                error_body = e.response.json()
+                logger.error("OpenRouter error response: %s", error_body)
+            except Exception:
+                logger.error("OpenRouter error response (text): %s", e.response.text[:500])
+            logger.error("OpenRouter non-retryable error: %s", e)
+            raise
+        except Exception as e:
+            logger.error("OpenRouter unexpected error: %s", e)
+            raise
+
+        data = orjson.loads(response.content)
+        content = data["choices"][0]["message"]["content"]
+        finish_reason = data["choices"][0].get("finish_reason", "unknown")
+
+        # Log token usage and finish reason (WARNING level to bypass default config)
+        usage = data.get("usage", {})
+        logger.warning(
+            "OpenRouter response: model=%s, finish_reason=%s, "
+            "prompt_tokens=%s, completion_tokens=%s, "
+            "response_length=%d chars",
+            model,
+            finish_reason,
+            usage.get("prompt_tokens", "N/A"),
+            usage.get("completion_tokens", "N/A"),
+            len(content) if content else 0,
+        )
 
-                response.raise_for_status()
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                finish_reason = data["choices"][0].get("finish_reason", "unknown")
-
-                # Log token usage and finish reason (WARNING level to bypass default config)
-                usage = data.get("usage", {})
-                logger.warning(
-                    "OpenRouter response: model=%s, finish_reason=%s, "
-                    "prompt_tokens=%s, completion_tokens=%s, "
-                    "response_length=%d chars",
-                    model,
-                    finish_reason,
-                    usage.get("prompt_tokens", "N/A"),
-                    usage.get("completion_tokens", "N/A"),
-                    len(content) if content else 0,
-                )
-
-                # Warn on potential issues
-                if not content:
-                    logger.warning(
-                        "OpenRouter returned empty content! finish_reason=%s",
-                        finish_reason,
-                    )
-                if finish_reason == "length":
-                    logger.warning(
-                        "OpenRouter response truncated (finish_reason=length). "
-                        "Output hit max_tokens limit."
-                    )
-
-                # Sanitize LLM response to remove PostgreSQL-incompatible characters
-                # (null bytes can appear if the LLM echoes back tainted PDF/API content)
-                return sanitize_string(content) if content else content
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in self.RETRY_STATUS_CODES:
-                    last_exception = e
-                    delay = self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS) - 1)]
-                    logger.warning(
-                        "OpenRouter HTTP error %d, retrying in %.1fs",
-                        e.response.status_code,
-                        delay,
-                    )
-                    import asyncio
-                    await asyncio.sleep(delay)
-                    continue
-                # Log the error response body for debugging
-                try:
-                    error_body = e.response.json()
-                    logger.error("OpenRouter error response: %s", error_body)
-                except Exception:
-                    logger.error("OpenRouter error response (text): %s", e.response.text[:500])
-                logger.error("OpenRouter non-retryable error: %s", e)
-                raise
-
-            except Exception as e:
-                last_exception = e
-                logger.error("OpenRouter unexpected error: %s", e)
-                raise
-
-        # Exhausted retries
-        msg = f"OpenRouter request failed after {self.MAX_RETRIES} attempts"
-        logger.error(msg)
-        if last_exception:
-            raise Exception(msg) from last_exception
-        raise Exception(msg)
+        # Warn on potential issues
+        if not content:
+            logger.warning(
+                "OpenRouter returned empty content! finish_reason=%s",
+                finish_reason,
+            )
+        if finish_reason == "length":
+            logger.warning(
+                "OpenRouter response truncated (finish_reason=length). "
+                "Output hit max_tokens limit."
+            )
+
+        # Sanitize LLM response to remove PostgreSQL-incompatible characters
+        # (null bytes can appear if the LLM echoes back tainted PDF/API content)
+        return sanitize_string(content) if content else content
+
+    @retry_http(
+        max_retries=MAX_RETRIES,
+        delays=RETRY_DELAYS,
+        retry_codes=RETRY_STATUS_CODES,
+        label="OpenRouter",
+    )
+    async def _post_chat_completion(self, payload: dict[str, Any]) -> httpx.Response:
+        """Make one chat completion request, raising on any HTTP error status."""
+        await openrouter_bucket.acquire()
+        response = await self._client.post("/chat/completions", json=payload)
+        response.raise_for_status()
+        return response
 
     async def stream_chat_completion(
         self,
@@ -241,42 +224,37 @@ class OpenRouterClient:
             len(messages),
         )
 
+        await openrouter_bucket.acquire()
         async with self._client.stream("POST", "/chat/completions", json=payload) as response:
             response.raise_for_status()
 
-            buffer = ""
-            async for chunk in response.aiter_text():
-                buffer += chunk
-                
-                # Process complete SSE lines
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    
-                    if not line:
-                        continue
-                    
-                    if line.startswith("data: "):
-                        data_str = line[6:]
-                        
-                        # Check for stream end
-                        if data_str == "[DONE]":
-                            logger.debug("OpenRouter stream completed")
-                            return
-                        
-                        try:
-                            data = json.loads(data_str)
-                            choices = data.get("choices", [])
-                            if choices:
-                                delta = choices[0].get("delta", {})
-                                content = delta.get("content", "")
-                                if content:
-                                    # Sanitize streaming tokens to remove PostgreSQL-incompatible chars
-                                    yield sanitize_string(content)
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse SSE data: %s", data_str[:100])
-                            continue
+            # httpx splits the stream into lines as it arrives, so each SSE
+            # event is parsed once without re-scanning a growing buffer
+            async for line in response.aiter_lines():
+                line = line.strip()
+                if not line.startswith("data: "):
+                    continue
+
+                data_str = line[6:]
+
+                # Check for stream end
+                if data_str == "[DONE]":
+                    logger.debug("OpenRouter stream completed")
+                    return
+
+                try:
+                    data = orjson.loads(data_str)
+                except orjson.JSONDecodeError:
+                    logger.warning("Failed to parse SSE data: %s", data_str[:100])
+                    continue
 
+                choices = data.get("choices", [])
+                if choices:
+                    delta = choices[0].get("delta", {})
+                    content = delta.get("content", "")
+                    if content:
+                        # Sanitize streaming tokens to remove PostgreSQL-incompatible chars
+                        yield sanitize_string(content)
 
 # Singleton client instance
 openrouter_client = OpenRouterClient()
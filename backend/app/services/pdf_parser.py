@@ -9,9 +9,12 @@ Converts PDF documents to structured markdown with:
 - Content structure analysis
 """
 
+import asyncio
+import bisect
+import io
 import logging
 import re
-from typing import Any
+import sys
 
 import pymupdf
 import pymupdf4llm
@@ -21,6 +24,19 @@ from app.core.sanitize import sanitize_string
 
 logger = logging.getLogger(__name__)
 
+# Markdown headings, one per line: "## Title"
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+# Table separator cells such as |---|, which only occur in markdown tables
+_TABLE_SEP_RE = re.compile(r"\|[\s\-:]+\|")
+# HTML comments, including the page markers inserted by parse_pdf
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+# Word counting: table pipes become spaces and other markdown syntax is
+# dropped, in a single str.translate pass
+_MD_SYNTAX_TABLE = str.maketrans({"|": " ", **dict.fromkeys("#*_`[]()")})
+
+# PDFs with fewer non-whitespace characters than this are treated as scanned
+MIN_TEXT_CHARS = 100
+
 
 class PDFParseError(Exception):
     """Raised when PDF parsing fails."""
@@ -64,6 +80,31 @@ class ParseResult(BaseModel):
     page_boundaries: list[PageBoundary]
 
 
+def _extract_page_texts(pdf_bytes: bytes) -> list[str]:
+    """Convert a PDF to markdown, one text per page.
+
+    The whole document is converted in one call: PyMuPDF4LLM assigns heading
+    levels from the font sizes seen across all pages converted together, so
+    converting page ranges separately would give inconsistent levels.
+    """
+    doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page_chunks = pymupdf4llm.to_markdown(
+            doc,
+            page_chunks=True,
+            write_images=False,
+            show_progress=False,
+        )
+    finally:
+        doc.close()
+
+    # PyMuPDF4LLM returns either a dict with 'text' key or a string directly
+    return [
+        chunk.get("text", "") if isinstance(chunk, dict) else str(chunk)
+        for chunk in page_chunks
+    ]
+
+
 class PDFParserService:
     """Service for parsing PDF files into structured markdown.
 
@@ -86,42 +127,46 @@ class PDFParserService:
             PDFParseError: If the PDF cannot be parsed.
         """
         try:
-            # Open PDF from bytes using pymupdf
-            doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
-
-            # Extract markdown with page chunks for page boundary tracking
-            page_chunks = pymupdf4llm.to_markdown(
-                doc,
-                page_chunks=True,
-                write_images=False,
-                show_progress=False,
-            )
+            # Extract markdown per page for page boundary tracking, in a
+            # worker thread so the conversion doesn't block the event loop
+            page_texts = await asyncio.to_thread(_extract_page_texts, pdf_bytes)
 
-            if not page_chunks:
+            if not page_texts:
                 raise PDFParseError(
                     "The uploaded PDF could not be parsed. The file may be corrupt."
                 )
 
-            # Process page chunks and build full markdown with page markers
-            markdown_parts: list[str] = []
+            # Process page chunks and build full markdown with page markers;
+            # offsets come from the buffer itself, so they can't drift. Each
+            # page is released once written, so the page list and the buffer
+            # don't both hold the whole document.
+            page_count = len(page_texts)
+            page_texts.reverse()
+            buffer = io.StringIO()
             page_boundaries: list[PageBoundary] = []
-            char_pos = 0
+            text_chars = 0
+
+            for page_num in range(1, page_count + 1):
+                # Sanitize extracted text to remove PostgreSQL-incompatible
+                # characters (null bytes, unpaired surrogates) that may come
+                # from corrupted PDFs, before offsets are taken
+                page_text = sanitize_string(page_texts.pop(), max_length=sys.maxsize)
 
-            for i, chunk in enumerate(page_chunks):
-                page_num = i + 1
-                page_text = self._extract_page_text(chunk)
+                # Count non-whitespace characters outside comments, until
+                # there are enough to rule out an image-only PDF
+                if text_chars < MIN_TEXT_CHARS:
+                    text_chars += sum(map(len, _COMMENT_RE.sub("", page_text).split()))
 
                 # Insert page marker
-                page_marker = f"<!-- PAGE {page_num} -->\n\n"
-                markdown_parts.append(page_marker)
+                buffer.write(f"<!-- PAGE {page_num} -->\n\n")
 
-                char_start = char_pos + len(page_marker)
-                markdown_parts.append(page_text)
+                char_start = buffer.tell()
+                buffer.write(page_text)
+                char_end = buffer.tell()
 
                 if not page_text.endswith("\n"):
-                    markdown_parts.append("\n")
+                    buffer.write("\n")
 
-                char_end = char_start + len(page_text)
                 page_boundaries.append(
                     PageBoundary(
                         page_number=page_num,
@@ -130,19 +175,14 @@ class PDFParserService:
                     )
                 )
 
-                char_pos = char_end + 1  # +1 for trailing newline
+            full_markdown = buffer.getvalue()
+            buffer.close()
 
-            full_markdown = "".join(markdown_parts)
-            page_count = len(page_chunks)
-
-            # Sanitize extracted text to remove PostgreSQL-incompatible characters
-            # (null bytes, unpaired surrogates) that may come from corrupted PDFs
+            # Pages are already clean; this applies the stored-text length cap
             full_markdown = sanitize_string(full_markdown)
 
             # Check for image-only / scanned PDFs
-            text_content = re.sub(r"\s+", "", full_markdown)
-            text_content = re.sub(r"<!--.*?-->", "", text_content)
-            if len(text_content) < 100:
+            if text_chars < MIN_TEXT_CHARS:
                 raise PDFParseError(
                     "This PDF appears to contain only scanned images. "
                     "Text-based PDFs are required for analysis."
@@ -186,15 +226,6 @@ class PDFParserService:
                 "An unexpected error occurred while parsing the PDF."
             ) from e
 
-    def _extract_page_text(self, chunk: Any) -> str:
-        """Extract text from a page chunk.
-
-        PyMuPDF4LLM returns either a dict with 'text' key or a string directly.
-        """
-        if isinstance(chunk, dict):
-            return chunk.get("text", "")
-        return str(chunk)
-
     def _build_content_structure(
         self,
         markdown: str,
@@ -209,14 +240,18 @@ class PDFParserService:
         sections = self._extract_sections(markdown, page_boundaries)
 
         # Count tables (markdown tables have |---| separators)
-        table_count = len(re.findall(r"\|[\s\-:]+\|", markdown))
-
-        # Estimate word count (strip markdown syntax, split on whitespace)
-        text_only = re.sub(r"<!--.*?-->", "", markdown)  # Remove comments
-        text_only = re.sub(r"\|", " ", text_only)  # Tables
-        text_only = re.sub(r"[#*_`\[\]()]", "", text_only)  # Markdown syntax
-        words = text_only.split()
-        estimated_word_count = len(words)
+        table_count = len(_TABLE_SEP_RE.findall(markdown))
+
+        # Estimate word count (strip markdown syntax, split on whitespace).
+        # Pages are counted one at a time, so the stripped copies and word
+        # lists are page-sized rather than document-sized; page markers sit
+        # between pages and are never counted.
+        estimated_word_count = 0
+        for boundary in page_boundaries:
+            text_only = markdown[boundary.char_start : boundary.char_end]
+            text_only = _COMMENT_RE.sub("", text_only)  # Remove comments
+            text_only = text_only.translate(_MD_SYNTAX_TABLE)  # Tables and markdown syntax
+            estimated_word_count += len(text_only.split())
 
         return ContentStructure(
             sections=sections,
@@ -232,10 +267,9 @@ class PDFParserService:
     ) -> list[SectionInfo]:
         """Extract hierarchical section structure from markdown headings."""
         # Find all headings with their positions
-        heading_pattern = r"^(#{1,6})\s+(.+)$"
         headings: list[tuple[int, int, str, int]] = []  # (char_pos, level, title, line_num)
 
-        for match in re.finditer(heading_pattern, markdown, re.MULTILINE):
+        for match in _HEADING_RE.finditer(markdown):
             level = len(match.group(1))
             title = match.group(2).strip()
             char_pos = match.start()
@@ -244,13 +278,16 @@ class PDFParserService:
         if not headings:
             return []
 
-        # Helper to find page number for a character position
+        # Page lookup by binary search over the page start offsets (pages are
+        # in document order). A position in a page marker belongs to the page
+        # before it, and anything past the last page to the last page.
+        starts = [boundary.char_start for boundary in page_boundaries]
+        pages = [boundary.page_number for boundary in page_boundaries]
+
         def get_page_for_pos(char_pos: int) -> int:
-            for boundary in page_boundaries:
-                if boundary.char_start <= char_pos <= boundary.char_end:
-                    return boundary.page_number
-            # Default to last page if position is beyond all boundaries
-            return page_boundaries[-1].page_number if page_boundaries else 1
+            if not pages:
+                return 1
+            return pages[max(bisect.bisect_right(starts, char_pos) - 1, 0)]
 
         # Build hierarchical structure
         root_sections: list[SectionInfo] = []
@@ -18,11 +18,25 @@ from pathlib import Path
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel
-from sqlalchemy import delete, func, select, text
+import numpy as np
+from pgvector import HalfVector
+from pgvector.psycopg import register_vector_async
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import delete, func, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.embedding import Embedding
+from app.core.database import (
+    SESSION_HNSW_EF_SEARCH,
+    generate_uuid7_batch,
+    get_hnsw_ef_search,
+)
+from app.core.sanitize import sanitize_rows
+from app.models.embedding import (
+    EMBEDDING_SOURCE_TYPES,
+    Embedding,
+    embedding_partition_name,
+)
+from app.services.cache import TwoTierCache, make_cache_key, query_embedding_cache
 from app.services.chunking import chunk_ifrs, chunk_report, chunk_sasb
 from app.services.embedding_service import EmbeddingService
 
@@ -46,10 +60,83 @@ class RAGResult(BaseModel):
     search_method: str  # semantic | keyword | hybrid
 
 
+# Dump or validate whole result lists (e.g. for caching) in one call
+RAGResultListAdapter = TypeAdapter(list[RAGResult])
+
+
 class RAGServiceError(Exception):
     """Raised when RAG service operations fail."""
 
 
+def l2_normalize(vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+    """Scale each embedding to unit length.
+
+    Stored and query vectors are unit-normalized so the HNSW indexes can use
+    inner product, which ranks identically to cosine without the per-comparison
+    norm divisions. Zero vectors are returned unchanged.
+
+    Returns:
+        float32 array of shape (len(vectors), dimensions)
+    """
+    # Copy, so arrays passed in (e.g. from the embedding service) are left as-is
+    matrix = np.array(vectors, dtype=np.float32)
+    if matrix.size == 0:
+        return matrix.reshape(0, 0)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+# Columns written by COPY, with their PostgreSQL types for binary format;
+# created_at and the generated columns are filled server-side
+_EMBEDDING_COPY_COLUMNS = (
+    ("id", "uuid"),
+    ("report_id", "uuid"),
+    ("source_type", "varchar"),
+    ("chunk_text", "text"),
+    ("chunk_metadata", "jsonb"),
+    ("embedding", "halfvec"),
+)
+
+
+async def bulk_copy_embeddings(session: AsyncSession, rows: list[dict]) -> None:
+    """Write embedding rows with binary PostgreSQL COPY on the session's connection.
+
+    COPY avoids per-row statement overhead for large ingest batches, and the
+    binary format sends each vector as packed halves instead of text that
+    PostgreSQL would have to parse. Rows must already be sanitized (see
+    app.core.sanitize.sanitize_rows) since neither the ORM listener nor
+    SQLAlchemy type processing runs here. Requires the psycopg driver.
+
+    Args:
+        session: Async session whose transaction the COPY joins
+        rows: Dicts with id, report_id, source_type, chunk_text,
+            chunk_metadata, and embedding (float32 array or list of floats)
+    """
+    conn = await session.connection()
+    raw_conn = await conn.get_raw_connection()
+    driver_conn = raw_conn.driver_connection
+    # Adds the binary halfvec dumper to this connection's adapters
+    await register_vector_async(driver_conn)
+
+    columns = ", ".join(name for name, _ in _EMBEDDING_COPY_COLUMNS)
+    async with driver_conn.cursor() as cursor:
+        async with cursor.copy(
+            f"COPY embeddings ({columns}) FROM STDIN (FORMAT BINARY)"
+        ) as copy:
+            copy.set_types([pg_type for _, pg_type in _EMBEDDING_COPY_COLUMNS])
+            for row in rows:
+                await copy.write_row((
+                    row["id"],
+                    row["report_id"],
+                    row["source_type"],
+                    row["chunk_text"],
+                    row["chunk_metadata"],
+                    HalfVector(row["embedding"]),
+                ))
+
+
 class RAGService:
     """Central API for all RAG operations.
 
@@ -60,15 +147,40 @@ class RAGService:
     # Default RRF constant
     DEFAULT_RRF_K = 60
 
-    def __init__(self, db: AsyncSession, embedding_service: EmbeddingService):
+    # Batches at least this large are written with COPY instead of executemany
+    COPY_THRESHOLD = 100
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_service: EmbeddingService,
+        embedding_cache: TwoTierCache | None = query_embedding_cache,
+    ):
         """Initialize the RAG service.
 
         Args:
             db: Async SQLAlchemy session
             embedding_service: Service for generating embeddings
+            embedding_cache: Cache for query embeddings (None disables)
         """
         self.db = db
         self.embedding_service = embedding_service
+        self.embedding_cache = embedding_cache
+        # In-flight query embeddings, so concurrent searches embed once
+        self._query_embeddings: dict[str, asyncio.Task[list[float]]] = {}
+
+    def with_session(self, db: AsyncSession) -> "RAGService":
+        """Return a RAGService bound to another session.
+
+        The copy shares this service's embedding client, cache and in-flight
+        query embeddings, so searches run concurrently on separate sessions
+        still embed each query once.
+        """
+        if db is self.db:
+            return self
+        sibling = RAGService(db, self.embedding_service, self.embedding_cache)
+        sibling._query_embeddings = self._query_embeddings
+        return sibling
 
     # -------------------------------------------------------------------------
     # Ingestion Methods
@@ -221,10 +333,18 @@ class RAGService:
         Returns:
             Number of embeddings deleted
         """
-        stmt = delete(Embedding).where(Embedding.source_type == source_type)
-        result = await self.db.execute(stmt)
+        if source_type in EMBEDDING_SOURCE_TYPES:
+            # Each corpus is its own partition: count it, then TRUNCATE rather
+            # than deleting row by row and leaving the HNSW graph to vacuum
+            partition = embedding_partition_name(source_type)
+            count = (
+                await self.db.execute(text(f"SELECT count(*) FROM {partition}"))
+            ).scalar_one()
+            await self.db.execute(text(f"TRUNCATE {partition}"))
+        else:
+            stmt = delete(Embedding).where(Embedding.source_type == source_type)
+            count = (await self.db.execute(stmt)).rowcount
         await self.db.commit()
-        count = result.rowcount
         logger.info("Deleted %d embeddings for source_type=%s", count, source_type)
         return count
 
@@ -278,6 +398,36 @@ class RAGService:
         else:  # hybrid
             return await self._hybrid_search(query, top_k, source_types, report_id, rrf_k)
 
+    async def _embed_query(self, query: str) -> list[float]:
+        """Return the normalized embedding of a search query.
+
+        Concurrent searches for the same query on this service share one
+        embedding call, and results are cached across requests.
+        """
+        task = self._query_embeddings.get(query)
+        if task is None:
+            task = asyncio.create_task(self._load_query_embedding(query))
+            self._query_embeddings[query] = task
+        try:
+            return await task
+        except Exception:
+            self._query_embeddings.pop(query, None)
+            raise
+
+    async def _load_query_embedding(self, query: str) -> list[float]:
+        """Embed a query (normalized like the stored vectors), via the cache."""
+        cache_key = make_cache_key(self.embedding_service.MODEL, query)
+        if self.embedding_cache is not None:
+            cached = await self.embedding_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        embedding = await self.embedding_service.embed_text(query)
+        query_embedding = l2_normalize([embedding])[0].tolist()
+        if self.embedding_cache is not None:
+            await self.embedding_cache.set(cache_key, query_embedding)
+        return query_embedding
+
     async def _semantic_search(
         self,
         query: str,
@@ -286,35 +436,66 @@ class RAGService:
         report_id: str | None,
     ) -> list[RAGResult]:
         """Perform semantic search using pgvector cosine similarity."""
-        # Embed the query
-        query_embedding = await self.embedding_service.embed_text(query)
+        query_embedding = await self._embed_query(query)
 
         # Build the query using raw SQL for pgvector operations
-        # The <=> operator calculates cosine distance (1 - similarity)
-        sql = """
-            SELECT
-                id,
-                chunk_text,
-                chunk_metadata,
-                source_type,
-                report_id,
-                1 - (embedding <=> :query_vector) AS similarity_score
-            FROM embeddings
-            WHERE 1=1
-        """
-        params: dict = {"query_vector": str(query_embedding)}
-
-        if source_types:
-            sql += " AND source_type = ANY(:source_types)"
-            params["source_types"] = source_types
-
+        # Vectors are unit length, so the <#> operator (negative inner product)
+        # is the negated cosine similarity and orders like cosine distance
+        params: dict = {"query_vector": str(query_embedding), "top_k": top_k}
+        report_filter = ""
         if report_id:
-            sql += " AND report_id = :report_id"
+            report_filter = " AND report_id = :report_id"
             params["report_id"] = UUID(report_id)
 
-        sql += " ORDER BY embedding <=> :query_vector LIMIT :top_k"
-        params["top_k"] = top_k
-
+        if source_types and set(source_types) <= set(EMBEDDING_SOURCE_TYPES):
+            # One branch per corpus with a literal source_type predicate so the
+            # planner prunes to that partition and walks its HNSW index, then merge.
+            # Literals are safe: values are checked against the fixed set above.
+            branches = [
+                f"""
+                (SELECT id, chunk_text, chunk_metadata, source_type, report_id,
+                        embedding <#> :query_vector AS distance
+                 FROM embeddings
+                 WHERE source_type = '{source_type}'{report_filter}
+                 ORDER BY embedding <#> :query_vector
+                 LIMIT :top_k)
+                """
+                for source_type in dict.fromkeys(source_types)
+            ]
+            sql = f"""
+                SELECT
+                    id,
+                    chunk_text,
+                    chunk_metadata,
+                    source_type,
+                    report_id,
+                    -distance AS similarity_score
+                FROM ({" UNION ALL ".join(branches)}) AS candidates
+                ORDER BY distance
+                LIMIT :top_k
+            """
+        else:
+            sql = f"""
+                SELECT
+                    id,
+                    chunk_text,
+                    chunk_metadata,
+                    source_type,
+                    report_id,
+                    -(embedding <#> :query_vector) AS similarity_score
+                FROM embeddings
+                WHERE 1=1{report_filter}
+            """
+            if source_types:
+                sql += " AND source_type = ANY(:source_types)"
+                params["source_types"] = source_types
+            sql += " ORDER BY embedding <#> :query_vector LIMIT :top_k"
+
+        # Connections start with SESSION_HNSW_EF_SEARCH; override it for this
+        # transaction only when index tuning chose a different value
+        ef_search = get_hnsw_ef_search()
+        if ef_search != SESSION_HNSW_EF_SEARCH:
+            await self.db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
         result = await self.db.execute(text(sql), params)
         rows = result.fetchall()
 
@@ -447,7 +628,7 @@ class RAGService:
         sql = """
             SELECT id, chunk_text, chunk_metadata, source_type, report_id
             FROM embeddings
-            WHERE chunk_metadata->>'paragraph_id' = :paragraph_id
+            WHERE paragraph_id = :paragraph_id
               AND source_type IN ('ifrs_s1', 'ifrs_s2')
             LIMIT 1
         """
@@ -559,34 +740,37 @@ class RAGService:
         # Extract texts for batch embedding
         texts = [chunk.text for chunk in chunks]
 
-        # Generate embeddings
+        # Insert each group of embeddings as soon as its batch completes, so
+        # database writes overlap the remaining API calls. Bulk inserts bypass
+        # the ORM unit of work (and its before_flush sanitizer), so each group
+        # is sanitized here.
         logger.info("Generating embeddings for %d chunks...", len(texts))
-        embeddings = await self.embedding_service.embed_batch(texts)
-
-        # Create embedding records
-        for chunk, embedding in zip(chunks, embeddings):
-            # Create the embedding record
-            # ts_content is set via raw SQL to use to_tsvector
-            embedding_record = Embedding(
-                report_id=UUID(report_id) if report_id else None,
-                source_type=source_type,
-                chunk_text=chunk.text,
-                chunk_metadata=chunk.metadata,
-                embedding=embedding,
-            )
-            self.db.add(embedding_record)
-
-        # Flush to get IDs assigned
-        await self.db.flush()
+        report_uuid = UUID(report_id) if report_id else None
+        ids = generate_uuid7_batch(len(chunks))
+        conn = await self.db.connection()
+        use_copy = conn.dialect.driver == "psycopg"
+        async for indices, embeddings in self.embedding_service.embed_stream(texts):
+            # One contiguous (n, dims) float32 array instead of n lists of floats
+            vectors = l2_normalize(embeddings)
+            rows = [
+                {
+                    "id": ids[i],
+                    "report_id": report_uuid,
+                    "source_type": source_type,
+                    "chunk_text": chunks[i].text,
+                    "chunk_metadata": {**(chunks[i].metadata or {}), "normalized": True},
+                    "embedding": vector,
+                }
+                for i, vector in zip(indices, vectors)
+            ]
+            sanitize_rows(Embedding, rows)
+
+            if use_copy and len(rows) >= self.COPY_THRESHOLD:
+                await bulk_copy_embeddings(self.db, rows)
+            else:
+                await self.db.execute(insert(Embedding), rows)
 
-        # Update ts_content for all new records using raw SQL
-        # This uses to_tsvector to generate the tsvector from chunk_text
-        sql = """
-            UPDATE embeddings
-            SET ts_content = to_tsvector('english', chunk_text)
-            WHERE ts_content IS NULL
-        """
-        await self.db.execute(text(sql))
+        # ts_content is a generated column, so rows are searchable on commit
         await self.db.commit()
 
         logger.info("Stored %d embeddings with source_type=%s", len(chunks), source_type)
@@ -18,9 +18,11 @@ from uuid import UUID
 import redis.asyncio as redis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import undefer
 
 from app.core.config import settings
 from app.models.report import Report
+from app.models.report_pdf import ReportPdf
 from app.services.pdf_parser import PDFParseError, PDFParserService
 
 if TYPE_CHECKING:
@@ -235,7 +237,12 @@ class TaskWorker:
                     logger.error("Report not found: %s", report_id)
                     return
 
-                if report.pdf_binary is None:
+                pdf_binary = (
+                    await db.execute(
+                        select(ReportPdf.pdf_binary).where(ReportPdf.report_id == report.id)
+                    )
+                ).scalar_one_or_none()
+                if pdf_binary is None:
                     logger.error("Report has no PDF binary: %s", report_id)
                     await self._set_error(db, report, "Report PDF binary is missing.")
                     return
@@ -247,7 +254,7 @@ class TaskWorker:
 
                 # Parse the PDF
                 parser = PDFParserService()
-                parse_result = await parser.parse_pdf(report.pdf_binary)
+                parse_result = await parser.parse_pdf(pdf_binary)
 
                 # Store parsed content
                 report.parsed_content = parse_result.markdown
@@ -350,7 +357,11 @@ class TaskWorker:
         async with self.session_factory() as db:
             try:
                 # Fetch the report
-                stmt = select(Report).where(Report.id == UUID(report_id))
+                stmt = (
+                    select(Report)
+                    .where(Report.id == UUID(report_id))
+                    .options(undefer(Report.parsed_content))
+                )
                 result = await db.execute(stmt)
                 report = result.scalar_one_or_none()
 
@@ -435,7 +446,11 @@ class TaskWorker:
         async with self.session_factory() as db:
             try:
                 # Fetch the report
-                stmt = select(Report).where(Report.id == UUID(report_id))
+                stmt = (
+                    select(Report)
+                    .where(Report.id == UUID(report_id))
+                    .options(undefer(Report.parsed_content))
+                )
                 result = await db.execute(stmt)
                 report = result.scalar_one_or_none()
 
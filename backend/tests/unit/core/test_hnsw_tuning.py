@@ -0,0 +1,68 @@
+"""Unit tests for HNSW parameter selection."""
+
+import pytest
+
+from app.core.database import (
+    _stale_hnsw_indexes,
+    configure_hnsw_params,
+    hnsw_build_settings,
+    settings,
+)
+
+
+class TestConfigureHnswParams:
+    """Test corpus-size tiers for HNSW build and search parameters."""
+
+    @pytest.mark.parametrize(
+        "count,expected",
+        [
+            (0, {"m": 24, "ef_construction": 128, "ef_search": 40}),
+            (99_999, {"m": 24, "ef_construction": 128, "ef_search": 40}),
+            (100_000, {"m": 24, "ef_construction": 128, "ef_search": 100}),
+            (999_999, {"m": 24, "ef_construction": 128, "ef_search": 100}),
+            (1_000_000, {"m": 32, "ef_construction": 128, "ef_search": 200}),
+        ],
+    )
+    def test_tiers(self, count, expected):
+        assert configure_hnsw_params(count) == expected
+
+    def test_returns_fresh_dict(self):
+        params = configure_hnsw_params(10)
+        params["m"] = 99
+        assert configure_hnsw_params(10)["m"] == 24
+
+
+class TestStaleHnswIndexes:
+    """Test which indexes are selected for a rebuild."""
+
+    def test_indexes_built_like_the_model_are_not_stale(self):
+        params = configure_hnsw_params(0)
+        build_params = {k: params[k] for k in ("m", "ef_construction")}
+        indexes = [("ix_report", ["m=24", "ef_construction=128"], True)]
+        assert _stale_hnsw_indexes(indexes, build_params) == []
+
+    def test_mismatched_and_invalid_indexes(self):
+        indexes = [
+            ("ix_ifrs", ["m=16", "ef_construction=64"], True),
+            ("ix_ifrs_ccnew", ["m=24", "ef_construction=128"], False),
+        ]
+        build_params = {"m": 24, "ef_construction": 128}
+        assert _stale_hnsw_indexes(indexes, build_params) == ["ix_ifrs"]
+
+
+class TestHnswBuildSettings:
+    """Test the optional index build overrides used by migrations."""
+
+    def test_unset_leaves_server_config(self, mocker):
+        mocker.patch.object(settings, "HNSW_BUILD_MAINTENANCE_WORK_MEM", None)
+        mocker.patch.object(settings, "HNSW_BUILD_PARALLEL_WORKERS", None)
+        assert hnsw_build_settings() == []
+
+    def test_configured_values_are_bound(self, mocker):
+        mocker.patch.object(settings, "HNSW_BUILD_MAINTENANCE_WORK_MEM", "2GB")
+        mocker.patch.object(settings, "HNSW_BUILD_PARALLEL_WORKERS", 7)
+        params = [s.compile().params for s in hnsw_build_settings()]
+        assert params == [
+            {"name": "maintenance_work_mem", "value": "2GB"},
+            {"name": "max_parallel_maintenance_workers", "value": "7"},
+        ]
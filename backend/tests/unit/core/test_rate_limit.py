@@ -0,0 +1,49 @@
+"""Unit tests for the async token bucket."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.rate_limit import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket:
+    """Tests for AsyncTokenBucket."""
+
+    @pytest.fixture
+    def clock(self, mocker):
+        now = [100.0]
+        mocker.patch("app.core.rate_limit.time.monotonic", side_effect=lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def sleep(self, mocker):
+        return mocker.patch("app.core.rate_limit.asyncio.sleep", new_callable=AsyncMock)
+
+    @pytest.mark.asyncio
+    async def test_burst_is_free_then_waits_queue_in_order(self, clock, sleep):
+        bucket = AsyncTokenBucket(rate=2.0, capacity=2)
+
+        await bucket.acquire()
+        await bucket.acquire()
+        sleep.assert_not_awaited()
+
+        await bucket.acquire()
+        await bucket.acquire()
+        assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_refills_over_time_up_to_capacity(self, clock, sleep):
+        bucket = AsyncTokenBucket(rate=1.0, capacity=2)
+        await bucket.acquire(2)
+
+        clock[0] += 10.0
+        await bucket.acquire(2)
+        sleep.assert_not_awaited()
+
+        await bucket.acquire()
+        sleep.assert_awaited_once_with(1.0)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0, capacity=1)
@@ -0,0 +1,100 @@
+"""Unit tests for retry backoff delays and the retry decorator."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.core.retry import MAX_RETRY_AFTER_SECONDS, parse_retry_after, retry_delay, retry_http
+
+
+def _response(headers: dict[str, str]) -> httpx.Response:
+    return httpx.Response(429, headers=headers)
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.test")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after(_response({"Retry-After": "3"})) == 3.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        header = format_datetime(retry_at, usegmt=True)
+        delay = parse_retry_after(_response({"Retry-After": header}))
+        assert 28.0 <= delay <= 30.0
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after(_response({})) is None
+        assert parse_retry_after(_response({"Retry-After": "soon"})) is None
+
+    def test_capped(self):
+        assert parse_retry_after(_response({"Retry-After": "3600"})) == MAX_RETRY_AFTER_SECONDS
+
+
+class TestRetryDelay:
+    """Tests for jittered retry delays."""
+
+    @pytest.mark.parametrize("attempt,base", [(0, 1.0), (1, 2.0), (5, 4.0)])
+    def test_schedule_is_jittered_down(self, attempt, base):
+        delay = retry_delay(attempt, [1.0, 2.0, 4.0])
+        assert base * 0.5 <= delay <= base
+
+    def test_retry_after_is_a_minimum(self):
+        delay = retry_delay(0, [1.0], _response({"Retry-After": "5"}))
+        assert 5.0 <= delay <= 6.0
+
+
+class TestRetryHttp:
+    """Tests for the retry_http decorator."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, mocker):
+        return mocker.patch("app.core.retry.asyncio.sleep")
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status_until_success(self, no_sleep):
+        outcomes = [_status_error(429), _status_error(503), "ok"]
+
+        @retry_http(max_retries=3)
+        async def call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert await call() == "ok"
+        assert no_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reraises_after_last_attempt(self, no_sleep):
+        attempts = 0
+
+        @retry_http(max_retries=3)
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            raise _status_error(500)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await call()
+        assert attempts == 3
+        assert no_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_raises_immediately(self, no_sleep):
+        @retry_http(max_retries=3)
+        async def call():
+            raise _status_error(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await call()
+        no_sleep.assert_not_awaited()
@@ -0,0 +1,83 @@
+"""Unit tests for PostgreSQL text sanitization utilities."""
+
+from enum import Enum
+
+from app.core.sanitize import get_sanitize_keys, sanitize_for_pg, sanitize_rows, sanitize_string
+from app.models.claim import Claim
+
+
+class _Color(str, Enum):
+    RED = "red\x00"
+
+
+class TestSanitizeString:
+    """Test single-string sanitization."""
+
+    def test_removes_null_bytes(self):
+        assert sanitize_string("hello\x00world") == "helloworld"
+
+    def test_removes_unpaired_surrogates(self):
+        assert sanitize_string("a\ud800b") == "ab"
+
+    def test_truncates_long_strings(self):
+        assert sanitize_string("x" * 20, max_length=5) == "xxxxx"
+
+    def test_empty_string_unchanged(self):
+        assert sanitize_string("") == ""
+
+
+class TestSanitizeForPg:
+    """Test recursive sanitization of JSONB-style payloads."""
+
+    def test_nested_structures(self):
+        value = {"k\x00": ["a\x00", {"b": "c\x00"}, ("d\x00", 1)]}
+        assert sanitize_for_pg(value) == {"k": ["a", {"b": "c"}, ("d", 1)]}
+
+    def test_primitives_unchanged(self):
+        for value in (None, 1, 2.5, True, b"\x00"):
+            assert sanitize_for_pg(value) is value
+
+    def test_str_subclass_falls_back_to_isinstance(self):
+        assert sanitize_for_pg(_Color.RED) == "red"
+
+    def test_clean_value_returned_as_same_object(self):
+        value = {"k": ["a", {"b": ("c", 1)}], "n": None}
+        assert sanitize_for_pg(value) is value
+
+    def test_dirty_value_returns_new_object(self):
+        inner = ["clean"]
+        value = {"keep": inner, "fix": "x\x00"}
+        result = sanitize_for_pg(value)
+        assert result is not value
+        assert result["keep"] is inner
+        assert value["fix"] == "x\x00"
+
+    def test_max_length_threaded_through_containers(self):
+        assert sanitize_for_pg({"k": ["abcdef"]}, max_length=3) == {"k": ["abc"]}
+
+
+class TestSanitizeRows:
+    """Test bulk-insert row sanitization driven by model column types."""
+
+    def test_skips_trusted_columns(self):
+        string_keys, jsonb_keys = get_sanitize_keys(Claim)
+        assert "claim_text" in string_keys
+        assert "claim_type" not in string_keys
+        assert "priority" not in string_keys
+        assert "ifrs_paragraphs" in jsonb_keys
+
+    def test_sanitizes_rows_in_place(self):
+        rows = [
+            {
+                "claim_text": "net\x00 zero",
+                "source_location": {"note": "p\x00"},
+                "source_page": 3,
+            }
+        ]
+        result = sanitize_rows(Claim, rows)
+        assert result is rows
+        assert rows[0] == {
+            "claim_text": "net zero",
+            "source_location": {"note": "p"},
+            "source_page": 3,
+        }
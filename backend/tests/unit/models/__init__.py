@@ -0,0 +1 @@
+"""Unit tests for ORM models."""
@@ -0,0 +1,27 @@
+"""Guard against duplicate ORM model registration."""
+
+from collections import Counter
+
+import app.models
+from app.core.database import Base
+
+
+def test_exactly_one_mapper_per_exported_model():
+    mapped = {mapper.class_ for mapper in Base.registry.mappers}
+    exported = {getattr(app.models, name) for name in app.models.__all__}
+
+    assert mapped == exported
+    assert len(Base.registry.mappers) == len(app.models.__all__)
+
+
+def test_no_table_is_mapped_twice():
+    tables = Counter(mapper.local_table.name for mapper in Base.registry.mappers)
+
+    assert [name for name, count in tables.items() if count > 1] == []
+
+
+def test_finding_supports_report_level_rows():
+    columns = Base.metadata.tables["findings"].c
+
+    assert columns.report_id.nullable is False
+    assert columns.claim_id.nullable is True
@@ -0,0 +1,82 @@
+"""Unit tests for the two-tier chat cache."""
+
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.cache import TwoTierCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_stable_for_same_parts(self):
+        assert make_cache_key("a", 1, ["x"]) == make_cache_key("a", 1, ["x"])
+
+    def test_part_boundaries_matter(self):
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+class TestTwoTierCache:
+    """Tests for TwoTierCache."""
+
+    @pytest.fixture
+    def redis_client(self):
+        client = AsyncMock()
+        client.get = AsyncMock(return_value=None)
+        client.set = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_set_writes_both_tiers(self, redis_client):
+        cache = TwoTierCache(redis_client, "test", ttl=60)
+
+        await cache.set("k", {"v": 1})
+
+        redis_client.set.assert_awaited_once_with("test:k", orjson.dumps({"v": 1}), ex=60)
+        assert await cache.get("k") == {"v": 1}
+        redis_client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1(self, redis_client):
+        redis_client.get.return_value = orjson.dumps({"v": 2})
+        cache = TwoTierCache(redis_client, "test", ttl=60)
+
+        assert await cache.get("k") == {"v": 2}
+        assert await cache.get("k") == {"v": 2}
+        redis_client.get.assert_awaited_once_with("test:k")
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self, redis_client):
+        redis_client.get.side_effect = RedisConnectionError("down")
+        redis_client.set.side_effect = RedisConnectionError("down")
+        cache = TwoTierCache(redis_client, "test", ttl=60)
+
+        assert await cache.get("k") is None
+        await cache.set("k", {"v": 3})
+        assert await cache.get("k") == {"v": 3}
+
+    @pytest.mark.asyncio
+    async def test_get_many_fetches_l1_misses_in_one_mget(self, redis_client):
+        redis_client.mget = AsyncMock(return_value=[orjson.dumps({"v": 2}), None])
+        cache = TwoTierCache(redis_client, "test", ttl=60)
+        cache._l1["a"] = {"v": 1}
+
+        assert await cache.get_many(["a", "b", "c"]) == [{"v": 1}, {"v": 2}, None]
+        redis_client.mget.assert_awaited_once_with(["test:b", "test:c"])
+        assert await cache.get("b") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_custom_codec(self, redis_client):
+        cache = TwoTierCache(
+            redis_client, "test", ttl=60, dumps=str.encode, loads=bytes.decode
+        )
+        redis_client.get.return_value = b"raw"
+
+        await cache.set("k", "value")
+
+        redis_client.set.assert_awaited_once_with("test:k", b"value", ex=60)
+        cache.clear_local()
+        assert await cache.get("k") == "raw"
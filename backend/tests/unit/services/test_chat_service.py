@@ -0,0 +1,42 @@
+"""Unit tests for chat service helpers."""
+
+import pytest
+
+from app.services.chat_service import _CitationScanner, is_small_talk
+
+
+class TestCitationScanner:
+    """Tests for incremental citation marker extraction."""
+
+    def test_finds_markers_within_a_token(self):
+        scanner = _CitationScanner()
+        assert scanner.feed("Scope 3 is disclosed [1] and [2].") == [1, 2]
+
+    def test_finds_markers_split_across_tokens(self):
+        scanner = _CitationScanner()
+        assert scanner.feed("see [1") == []
+        assert scanner.feed("2] here") == [12]
+
+    def test_reports_each_number_once(self):
+        scanner = _CitationScanner()
+        scanner.feed("[3] then [3]")
+        assert scanner.feed(" and [3] again [4]") == [4]
+        assert scanner.used == {3, 4}
+
+    def test_ignores_non_numeric_brackets(self):
+        scanner = _CitationScanner()
+        assert scanner.feed("S2.14(a)[iv] and [x]") == []
+
+
+class TestIsSmallTalk:
+    """Tests for the retrieval short-circuit on greetings."""
+
+    @pytest.mark.parametrize("message", ["hi", "Thanks!", "thank you so much.", " OK "])
+    def test_greetings_and_acknowledgements(self, message):
+        assert is_small_talk(message)
+
+    @pytest.mark.parametrize(
+        "message", ["Scope 3?", "ok, what about water use?", "history", "hi, who audited this?"]
+    )
+    def test_questions_are_not_small_talk(self, message):
+        assert not is_small_talk(message)
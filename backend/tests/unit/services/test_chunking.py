@@ -0,0 +1,88 @@
+"""Unit tests for corpus chunking helpers."""
+
+from app.services.chunking import (
+    chunk_report,
+    _extract_metric_codes,
+    _extract_paragraph_id,
+    _extract_standard_code,
+    _extract_sub_requirements,
+    _header_level,
+    _identify_pillar,
+    _split_sentences,
+)
+
+
+class TestExtractionHelpers:
+    """Tests for the regex-based ID and code extractors."""
+
+    def test_extract_paragraph_id(self):
+        assert _extract_paragraph_id("See S2.14(a)(iv) for details") == "S2.14(a)(iv)"
+        assert _extract_paragraph_id("No paragraph here") is None
+
+    def test_extract_sub_requirements(self):
+        text = "S2.14(a)(i) and S2.14(b) extend S2.14; S2.15(a) does not."
+        assert _extract_sub_requirements(text, "S2.14") == ["S2.14(a)(i)", "S2.14(b)"]
+        assert _extract_sub_requirements("S2.140(a) and S2.14", "S2.14") == []
+
+    def test_extract_metric_codes(self):
+        text = "Report EM-EP-110a.1 and EM-EP-110a.2, then EM-EP-110a.1 again."
+        assert _extract_metric_codes(text) == ["EM-EP-110a.1", "EM-EP-110a.2"]
+        assert _extract_metric_codes("No codes in this paragraph.") == []
+
+    def test_extract_standard_code(self):
+        assert _extract_standard_code("Oil-and-Gas.md") == "EM-EP"
+        assert _extract_standard_code("electric utilities.md") == "IF-EU"
+        assert _extract_standard_code("unknown_industry.md") == "XX-XX"
+
+    def test_split_sentences(self):
+        assert _split_sentences("One. Two!  Three?\nFour") == ["One.", "Two!", "Three?", "Four"]
+
+    def test_header_level(self):
+        assert _header_level("# Governance") == (1, "Governance")
+        assert _header_level("#### S2.14 Strategy") == (4, "S2.14 Strategy")
+        assert _header_level("##### Too deep") == (0, "")
+        assert _header_level("#hashtag") == (0, "")
+        assert _header_level("##") == (0, "")
+
+    def test_identify_pillar_prefers_earlier_pillars(self):
+        assert _identify_pillar("Risk Management") == "risk_management"
+        assert _identify_pillar("Risk management and board oversight") == "governance"
+        assert _identify_pillar("GHG Emissions Targets") == "metrics_targets"
+        assert _identify_pillar("Introduction") == "governance"
+
+
+class TestChunkReport:
+    """Tests for report chunking."""
+
+    def test_pages_assigned_from_start_offsets(self):
+        body = "word " * 200
+        content = f"# One\n{body}\n# Two\n{body}\n# Three\n{body}"
+        second = content.index("# Two")
+        third = content.index("# Three")
+        pages = [
+            {"page_number": 1, "start_char": 0},
+            {"page_number": 2, "start_char": second},
+            {"page_number": 3, "start_char": third},
+        ]
+
+        chunks = chunk_report(content, pages)
+
+        assert [c.metadata["page_start"] for c in chunks] == [1, 2, 3]
+        assert [c.metadata["section_path"] for c in chunks] == [["One"], ["Two"], ["Three"]]
+
+    def test_sections_split_at_headers(self):
+        content = "# A\nbody a\n## B\nbody b\n##### not a header\n### C\n\n# D\n"
+
+        chunks = chunk_report(content)
+
+        assert [(c.metadata["section_path"], c.text) for c in chunks] == [
+            (["A"], "[Report > A]\n\nbody a"),
+            (["A", "B"], "[Report > A > B]\n\nbody b\n##### not a header"),
+        ]
+
+    def test_has_table_requires_a_separator_row(self):
+        table = "# T\n| Scope | tCO2e |\n|---|---|\n| 1 | 40 |"
+        prose = "# P\nRevenue | cost split\n\n---\n\nNext page"
+
+        assert chunk_report(table)[0].metadata["has_table"] is True
+        assert chunk_report(prose)[0].metadata["has_table"] is False
@@ -0,0 +1,240 @@
+"""Unit tests for embedding service caching."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import numpy as np
+import pytest
+
+from app.services.cache import make_cache_key
+from app.services.embedding_service import (
+    EmbeddingBatchTooLargeError,
+    EmbeddingError,
+    EmbeddingService,
+)
+
+
+@pytest.fixture
+def cache():
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock()
+    cache.get_many = AsyncMock()
+    cache.set_many = AsyncMock()
+    return cache
+
+
+class TestEmbeddingCache:
+    """Tests for cache lookups in embed_text and embed_batch."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_only_sends_distinct_misses(self, cache):
+        service = EmbeddingService(cache=cache)
+        cache.get_many.return_value = [[1.0], None]
+        service._call_embedding_api = AsyncMock(return_value=np.array([[2.0]], dtype=np.float32))
+
+        assert (await service.embed_batch(["a", "b", "b"])).tolist() == [[1.0], [2.0], [2.0]]
+
+        cache.get_many.assert_awaited_once_with(
+            [make_cache_key(service.MODEL, "a"), make_cache_key(service.MODEL, "b")]
+        )
+        service._call_embedding_api.assert_awaited_once_with(["b"])
+        (stored,) = cache.set_many.await_args.args
+        assert {key: vector.tolist() for key, vector in stored.items()} == {
+            make_cache_key(service.MODEL, "b"): [2.0]
+        }
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_all_cached_skips_api(self, cache):
+        service = EmbeddingService(cache=cache)
+        cache.get_many.return_value = [[1.0], [2.0]]
+        service._call_embedding_api = AsyncMock()
+
+        assert (await service.embed_batch(["a", "b"])).tolist() == [[1.0], [2.0]]
+
+        service._call_embedding_api.assert_not_awaited()
+        cache.set_many.assert_not_awaited()
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_embed_text_uses_cache(self, cache):
+        service = EmbeddingService(cache=cache)
+        service._request_embeddings = AsyncMock(return_value=b'{"data":[{"embedding":[3.0]}]}')
+
+        embedding = await service.embed_text("q")
+        assert embedding.dtype == np.float32
+        assert embedding.tolist() == [3.0]
+        cache.get.return_value = embedding
+        assert await service.embed_text("q") is embedding
+
+        service._request_embeddings.assert_awaited_once_with(
+            {"model": service.MODEL, "input": "q"}, 1
+        )
+        await service.close()
+
+
+class TestCreateBatches:
+    """Tests for token- and count-limited batching."""
+
+    def test_respects_token_and_count_limits(self):
+        service = EmbeddingService(cache=None)
+        service.MAX_TEXTS_PER_BATCH = 3
+        service.MAX_TOKENS_PER_BATCH = 10
+        texts = ["a" * 16, "b" * 16, "c" * 16, "d" * 4, "e" * 4, "f" * 4, "g" * 4]
+
+        batches = service._create_batches(texts)
+
+        assert [len(batch) for batch in batches] == [2, 3, 2]
+        assert sum(batches, []) == texts
+
+
+class TestTruncateText:
+    """Tests for UTF-8 byte-budget truncation."""
+
+    def test_short_text_is_returned_unchanged(self):
+        service = EmbeddingService(cache=None)
+        text = "x" * service.MAX_TEXT_BYTES
+
+        assert service._truncate_text(text) is text
+
+    def test_multibyte_text_is_cut_to_byte_budget(self):
+        service = EmbeddingService(cache=None)
+        service.MAX_TEXT_BYTES = 10
+        text = "气候" * 4  # 3 bytes per character
+
+        truncated = service._truncate_text(text)
+
+        assert truncated == "气候气"
+        assert len(truncated.encode("utf-8")) <= service.MAX_TEXT_BYTES
+
+
+class TestEmbedStream:
+    """Tests for length-sorted batching, batch shrinking and streaming."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_input_order(self):
+        service = EmbeddingService(cache=None)
+        service._call_embedding_api = AsyncMock(
+            side_effect=lambda batch: np.array([[len(text)] for text in batch], dtype=np.float32)
+        )
+
+        result = await service.embed_batch(["ccc", "a", "bb"])
+
+        assert result.tolist() == [[3.0], [1.0], [2.0]]
+        service._call_embedding_api.assert_awaited_once_with(["a", "bb", "ccc"])
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_embedded_once(self):
+        service = EmbeddingService(cache=None)
+        service._call_embedding_api = AsyncMock(
+            side_effect=lambda batch: np.array([[len(text)] for text in batch], dtype=np.float32)
+        )
+
+        result = await service.embed_batch(["bb", "a", "bb"])
+
+        assert result.tolist() == [[2.0], [1.0], [2.0]]
+        service._call_embedding_api.assert_awaited_once_with(["a", "bb"])
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_over_limit_batch_is_split(self):
+        service = EmbeddingService(cache=None)
+
+        async def call(batch):
+            if len(batch) > 5:
+                raise EmbeddingBatchTooLargeError("too many tokens")
+            return np.array([[float(text)] for text in batch], dtype=np.float32)
+
+        service._call_embedding_api = AsyncMock(side_effect=call)
+        texts = [str(i) for i in range(10)]
+
+        assert (await service.embed_batch(texts)).tolist() == [[float(i)] for i in range(10)]
+        await service.close()
+
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_cached_group_then_batches(self, cache):
+        service = EmbeddingService(cache=cache)
+        service.MAX_TEXTS_PER_BATCH = 2
+        cache.get_many.return_value = [None, [0.0], None, None]
+        service._call_embedding_api = AsyncMock(
+            side_effect=lambda batch: np.array([[len(text)] for text in batch], dtype=np.float32)
+        )
+
+        groups = [group async for group in service.embed_stream(["aa", "z", "b", "ccc", "b"])]
+
+        assert groups[0][0] == [1]
+        assert groups[0][1].tolist() == [[0.0]]
+        yielded = {
+            i: vector.tolist()
+            for indices, vectors in groups[1:]
+            for i, vector in zip(indices, vectors)
+        }
+        assert yielded == {0: [2.0], 2: [1.0], 3: [3.0], 4: [1.0]}
+        assert service._call_embedding_api.await_count == 2
+        await service.close()
+
+
+class TestCallEmbeddingApi:
+    """Tests for embedding API response handling."""
+
+    @pytest.mark.asyncio
+    async def test_orders_vectors_by_index(self):
+        body = b'{"data":[{"index":1,"embedding":[2.0]},{"index":0,"embedding":[1.0]}]}'
+        service = EmbeddingService(cache=None)
+        service._client = httpx.AsyncClient(
+            base_url="https://openrouter.test",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+        )
+
+        embeddings = await service._call_embedding_api(["a", "b"])
+
+        assert embeddings.dtype == np.float32
+        assert embeddings.tolist() == [[1.0], [2.0]]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_retryable_errors_exhaust_into_embedding_error(self, mocker):
+        mocker.patch("app.core.retry.asyncio.sleep")
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503, request=request)
+
+        service = EmbeddingService(cache=None)
+        service._client = httpx.AsyncClient(
+            base_url="https://openrouter.test", transport=httpx.MockTransport(handler)
+        )
+
+        with pytest.raises(EmbeddingError, match="after 3 attempts"):
+            await service._call_embedding_api(["a"])
+        assert len(requests) == service.MAX_RETRIES
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_request_slot_is_released_before_parsing(self):
+        service = EmbeddingService(cache=None)
+        service._request_slots = asyncio.Semaphore(1)
+        service._request_embeddings = AsyncMock(return_value=b'{"data":[{"embedding":[1.0]}]}')
+        parse = service._parse_embeddings
+        slot_held = []
+
+        def record(body, count):
+            slot_held.append(service._request_slots.locked())
+            return parse(body, count)
+
+        service._parse_embeddings = record
+
+        assert (await service._call_embedding_api(["a"])).tolist() == [[1.0]]
+        assert slot_held == [False]
+        await service.close()
+
+    def test_malformed_body_raises_embedding_error(self):
+        service = EmbeddingService(cache=None)
+
+        with pytest.raises(EmbeddingError):
+            service._parse_embeddings(b"<html>bad gateway</html>", 1)
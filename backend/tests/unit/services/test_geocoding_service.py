@@ -3,10 +3,13 @@
 Tests geocoding with mocked Nominatim API responses.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
+from app.services.cache import TwoTierCache
 from app.services.geocoding_service import GeocodingService
 from tests.fixtures.mock_satellite import (
     MOCK_NOMINATIM_RESPONSE_BORNEO,
@@ -20,8 +23,10 @@ class TestGeocodingService:
 
     @pytest.fixture
     def service(self):
-        """Create a fresh GeocodingService for each test."""
-        svc = GeocodingService()
+        """Create a fresh GeocodingService (with an empty cache) for each test."""
+        redis_client = AsyncMock()
+        redis_client.get = AsyncMock(return_value=None)
+        svc = GeocodingService(cache=TwoTierCache(redis_client, "geocode", ttl=60))
         svc._rate_limit_seconds = 0.0  # Disable rate limiting for tests
         return svc
 
@@ -152,9 +157,61 @@ class TestGeocodingService:
         assert not GeocodingService.validate_coordinates(0.0, 181.0)
         assert not GeocodingService.validate_coordinates(-91.0, 0.0)
 
-    def test_clear_cache(self, service):
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, service):
         """Test cache clearing."""
-        service._cache["test:"] = (1.0, 2.0)
-        assert len(service._cache) == 1
+        await service._cache.set("test:", [1.0, 2.0])
+        assert await service._cache.get("test:") == [1.0, 2.0]
         service.clear_cache()
-        assert len(service._cache) == 0
+        assert await service._cache.get("test:") is None
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_with_normalized_key(self, service, mocker):
+        """Test that misses are cached briefly and keys ignore case/whitespace."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = MOCK_NOMINATIM_RESPONSE_EMPTY
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        mocker.patch("app.services.geocoding_service.httpx.AsyncClient", return_value=mock_client)
+
+        assert await service.geocode("Nowhere Land") is None
+        assert await service.geocode("  nowhere land ") is None
+
+        assert mock_client.get.call_count == 1
+        service._cache.redis.set.assert_awaited_once_with(
+            "geocode:nowhere land:", b"[]", ex=service.NOT_FOUND_TTL_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, service, mocker):
+        """Test that concurrent geocodes of one place send a single request."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = MOCK_NOMINATIM_RESPONSE_BORNEO
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        mocker.patch("app.services.geocoding_service.httpx.AsyncClient", return_value=mock_client)
+
+        results = await asyncio.gather(
+            service.geocode("Central Kalimantan"), service.geocode("central kalimantan ")
+        )
+
+        assert results[0] == results[1] is not None
+        assert mock_client.get.call_count == 1
+        assert service._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_concurrent_callers(self, service, mocker):
+        """Test that concurrent callers reserve successive request slots."""
+        service._rate_limit_seconds = 1.0
+        mocker.patch("app.services.geocoding_service.time.monotonic", return_value=50.0)
+        sleep = mocker.patch("app.services.geocoding_service.asyncio.sleep", new_callable=AsyncMock)
+
+        await asyncio.gather(*(service._rate_limit() for _ in range(3)))
+
+        assert sorted(call.args[0] for call in sleep.await_args_list) == [1.0, 2.0]
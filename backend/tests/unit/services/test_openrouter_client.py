@@ -0,0 +1,49 @@
+"""Unit tests for the OpenRouter client."""
+
+import httpx
+import pytest
+
+from app.services.openrouter_client import OpenRouterClient
+
+
+def _client_with_body(body: bytes) -> OpenRouterClient:
+    client = OpenRouterClient()
+    client._client = httpx.AsyncClient(
+        base_url="https://openrouter.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+    )
+    return client
+
+
+class TestStreamChatCompletion:
+    """Tests for SSE parsing in stream_chat_completion."""
+
+    @pytest.mark.asyncio
+    async def test_yields_content_deltas_until_done(self):
+        body = (
+            b": keep-alive\n\n"
+            b'data: {"choices":[{"delta":{"content":"Hel"}}]}\n\n'
+            b"data: not-json\n\n"
+            b'data: {"choices":[{"delta":{}}]}\r\n\r\n'
+            b'data: {"choices":[{"delta":{"content":"lo\\u0000"}}]}\n\n'
+            b"data: [DONE]\n\n"
+            b'data: {"choices":[{"delta":{"content":"ignored"}}]}\n\n'
+        )
+        client = _client_with_body(body)
+
+        tokens = [token async for token in client.stream_chat_completion("m", [])]
+
+        assert tokens == ["Hel", "lo"]
+        await client.close()
+
+
+class TestChatCompletion:
+    """Tests for chat_completion response handling."""
+
+    @pytest.mark.asyncio
+    async def test_returns_sanitized_content(self):
+        body = b'{"choices":[{"message":{"content":"ok\\u0000"},"finish_reason":"stop"}]}'
+        client = _client_with_body(body)
+
+        assert await client.chat_completion("m", [{"role": "user", "content": "hi"}]) == "ok"
+        await client.close()
@@ -0,0 +1,83 @@
+"""Unit tests for PDF parser content structure analysis."""
+
+import re
+
+import pymupdf
+import pytest
+
+from app.services.pdf_parser import PageBoundary, PDFParseError, PDFParserService
+
+MARKDOWN = (
+    "<!-- PAGE 1 -->\n\n"
+    "# Climate *Risk*\n"
+    "Scope_3 emissions [see] (note) a|b\n"
+    "<!-- PAGE 2 -->\n\n"
+    "## Targets\n"
+    "| Year | Goal |\n"
+    "|---|---|\n"
+    "| 2030 | Net-zero |\n"
+)
+BOUNDARIES = [
+    PageBoundary(page_number=1, char_start=17, char_end=69),
+    PageBoundary(page_number=2, char_start=86, char_end=143),
+]
+
+
+class TestContentStructure:
+    """Tests for section extraction and word counting."""
+
+    def test_counts_words_without_markdown_syntax(self):
+        structure = PDFParserService()._build_content_structure(MARKDOWN, 2, BOUNDARIES)
+
+        # Climate Risk / Scope3 emissions see note a b / Targets /
+        # Year Goal / --- --- / 2030 Net-zero
+        assert structure.estimated_word_count == 15
+
+    def test_sections_are_nested_by_heading_level(self):
+        structure = PDFParserService()._build_content_structure(MARKDOWN, 2, BOUNDARIES)
+
+        (section,) = structure.sections
+        # Ends on page 1 even though the next heading opens page 2
+        assert (section.title, section.page_start, section.page_end) == ("Climate *Risk*", 1, 1)
+        (child,) = section.children
+        assert (child.title, child.level, child.page_start, child.page_end) == ("Targets", 2, 2, 2)
+
+
+def _text_pdf(page_count: int) -> bytes:
+    doc = pymupdf.open()
+    for page_number in range(1, page_count + 1):
+        page = doc.new_page()
+        page.insert_text((50, 72), f"Page {page_number} discusses transition risk " * 3)
+    return doc.tobytes()
+
+
+class TestParsePdf:
+    """Tests for whole-document parsing."""
+
+    @pytest.mark.asyncio
+    async def test_pdf_without_text_is_rejected_as_scanned(self):
+        doc = pymupdf.open()
+        doc.new_page()
+        doc.new_page()
+
+        with pytest.raises(PDFParseError, match="scanned images"):
+            await PDFParserService().parse_pdf(doc.tobytes())
+
+    @pytest.mark.asyncio
+    async def test_page_boundaries_follow_their_markers(self):
+        result = await PDFParserService().parse_pdf(_text_pdf(3))
+
+        for boundary in result.page_boundaries:
+            marker = f"<!-- PAGE {boundary.page_number} -->\n\n"
+            assert result.markdown[: boundary.char_start].endswith(marker)
+            page_text = result.markdown[boundary.char_start : boundary.char_end]
+            assert f"Page {boundary.page_number} discusses" in page_text
+
+    @pytest.mark.asyncio
+    async def test_word_count_covers_every_page(self):
+        result = await PDFParserService().parse_pdf(_text_pdf(3))
+
+        text_only = re.sub(r"<!--.*?-->", "", result.markdown)
+        assert result.content_structure.estimated_word_count == len(
+            text_only.replace("|", " ").translate(str.maketrans("", "", "#*_`[]()")).split()
+        )
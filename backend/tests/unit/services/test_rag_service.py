@@ -0,0 +1,59 @@
+"""Unit tests for RAG service query embedding reuse."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.rag_service import RAGService
+
+
+@pytest.fixture
+def embedding_service():
+    service = MagicMock()
+    service.MODEL = "test-model"
+    service.embed_text = AsyncMock(return_value=[3.0, 4.0])
+    return service
+
+
+class TestEmbedQuery:
+    """Tests for RAGService._embed_query."""
+
+    async def test_concurrent_searches_embed_once(self, embedding_service):
+        rag = RAGService(MagicMock(), embedding_service, embedding_cache=None)
+
+        first, second = await asyncio.gather(
+            rag._embed_query("scope 3"), rag._embed_query("scope 3")
+        )
+
+        assert first == second == pytest.approx([0.6, 0.8])
+        embedding_service.embed_text.assert_awaited_once_with("scope 3")
+
+    async def test_cache_hit_skips_embedding_call(self, embedding_service):
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=[1.0, 0.0])
+        cache.set = AsyncMock()
+        rag = RAGService(MagicMock(), embedding_service, embedding_cache=cache)
+
+        assert await rag._embed_query("scope 3") == [1.0, 0.0]
+        embedding_service.embed_text.assert_not_awaited()
+
+    async def test_failed_embedding_is_retried(self, embedding_service):
+        embedding_service.embed_text.side_effect = [RuntimeError("boom"), [1.0, 0.0]]
+        rag = RAGService(MagicMock(), embedding_service, embedding_cache=None)
+
+        with pytest.raises(RuntimeError):
+            await rag._embed_query("scope 3")
+        assert await rag._embed_query("scope 3") == pytest.approx([1.0, 0.0])
+
+
+class TestLoadS1S2Mapping:
+    """Tests for RAGService._load_s1_s2_mapping."""
+
+    async def test_loads_bundled_mapping_file(self, embedding_service):
+        rag = RAGService(MagicMock(), embedding_service, embedding_cache=None)
+
+        mapping = await rag._load_s1_s2_mapping()
+
+        assert mapping is not None
+        assert mapping["mappings"]
@@ -19,8 +19,16 @@ interface ChatPanelProps {
 }
 
 export function ChatPanel({ reportId, isOpen, onClose, onCitationClick }: ChatPanelProps) {
-  const { messages, isStreaming, currentResponse, error, isLoading, sendMessage, clearError } =
-    useChat(reportId);
+  const {
+    messages,
+    isStreaming,
+    currentResponse,
+    currentCitations,
+    error,
+    isLoading,
+    sendMessage,
+    clearError,
+  } = useChat(reportId);
 
   const messagesEndRef       = useRef<HTMLDivElement>(null);
   const messagesContainerRef = useRef<HTMLDivElement>(null);
@@ -48,7 +56,7 @@ export function ChatPanel({ reportId, isOpen, onClose, onCitationClick }: ChatPa
           id: "streaming",
           role: "assistant",
           content: currentResponse,
-          citations: [],
+          citations: currentCitations,
           timestamp: new Date().toISOString(),
         }
       : null;
@@ -15,6 +15,8 @@ export interface UseChatReturn {
   isStreaming: boolean;
   /** Current partial response during streaming */
   currentResponse: string;
+  /** Citations referenced so far by the streaming response */
+  currentCitations: Citation[];
   /** Error message, if any */
   error: string | null;
   /** Whether the chat history is loading */
@@ -35,6 +37,7 @@ export function useChat(reportId: string | undefined): UseChatReturn {
   const [messages, setMessages] = useState<ChatMessage[]>([]);
   const [isStreaming, setIsStreaming] = useState(false);
   const [currentResponse, setCurrentResponse] = useState("");
+  const [currentCitations, setCurrentCitations] = useState<Citation[]>([]);
   const [error, setError] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(false);
 
@@ -101,6 +104,7 @@ export function useChat(reportId: string | undefined): UseChatReturn {
       setError(null);
       setIsStreaming(true);
       setCurrentResponse("");
+      setCurrentCitations([]);
       currentCitationsRef.current = [];
 
       // Add user message immediately
@@ -118,8 +122,13 @@ export function useChat(reportId: string | undefined): UseChatReturn {
         onToken: (token) => {
           setCurrentResponse((prev) => prev + token);
         },
+        onCitationRef: (citation) => {
+          currentCitationsRef.current = [...currentCitationsRef.current, citation];
+          setCurrentCitations(currentCitationsRef.current);
+        },
         onCitations: (citations) => {
           currentCitationsRef.current = citations;
+          setCurrentCitations(citations);
         },
         onDone: (messageId, fullContent) => {
           // Add assistant message with full content and citations
@@ -133,12 +142,14 @@ export function useChat(reportId: string | undefined): UseChatReturn {
           setMessages((prev) => [...prev, assistantMessage]);
           setIsStreaming(false);
           setCurrentResponse("");
+          setCurrentCitations([]);
           currentCitationsRef.current = [];
         },
         onError: (errorMessage) => {
           setError(errorMessage);
           setIsStreaming(false);
           setCurrentResponse("");
+          setCurrentCitations([]);
         },
       });
     },
@@ -153,6 +164,7 @@ export function useChat(reportId: string | undefined): UseChatReturn {
     messages,
     isStreaming,
     currentResponse,
+    currentCitations,
     error,
     isLoading,
     sendMessage,
@@ -7,6 +7,7 @@ import { getChatMessageUrl } from "./api";
 import type {
   Citation,
   ChatTokenEventData,
+  ChatCitationRefEventData,
   ChatCitationsEventData,
   ChatDoneEventData,
   ChatErrorEventData,
@@ -17,6 +18,7 @@ import type {
  */
 export interface ChatStreamCallbacks {
   onToken: (token: string) => void;
+  onCitationRef: (citation: Citation) => void;
   onCitations: (citations: Citation[]) => void;
   onDone: (messageId: string, fullContent: string) => void;
   onError: (error: string) => void;
@@ -129,6 +131,11 @@ export function createChatStream(
               callbacks.onToken(tokenData.token);
               break;
             }
+            case "chat_citation_ref": {
+              const citationRefData = data as ChatCitationRefEventData;
+              callbacks.onCitationRef(citationRefData.citation);
+              break;
+            }
             case "chat_citations": {
               const citationsData = data as ChatCitationsEventData;
               callbacks.onCitations(citationsData.citations);
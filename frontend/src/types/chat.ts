@@ -61,6 +61,7 @@ export interface ConversationHistoryResponse {
  */
 export type ChatStreamEventType =
   | "chat_token"
+  | "chat_citation_ref"
   | "chat_citations"
   | "chat_done"
   | "chat_error";
@@ -72,6 +73,14 @@ export interface ChatTokenEventData {
   token: string;
 }
 
+/**
+ * Citation reference event data from SSE stream, sent the first time the
+ * response cites a source.
+ */
+export interface ChatCitationRefEventData {
+  citation: Citation;
+}
+
 /**
  * Citations event data from SSE stream.
  */